@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Static asset server for the web version of the chatbot
+Loads the web assets into memory once, precompresses them (gzip, and brotli
+when available) and serves them from an asyncio loop with strong ETags and
+immutable caching for content-hashed files
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import time
+from email.utils import formatdate
+from urllib.parse import unquote
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WEB_EXTENSIONS = {".html", ".js", ".css", ".svg", ".png", ".jpg", ".jpeg", ".gif", ".ico",
+                  ".webp", ".json", ".woff", ".woff2", ".txt", ".map"}
+COMPRESSIBLE = {".html", ".js", ".css", ".svg", ".json", ".txt", ".map"}
+SKIP_DIRS = {".git", "node_modules", "__pycache__", "benchmarks", "locale", ".venv", "venv"}
+SKIP_FILES = {"package.json", "package-lock.json", "requests.jsonl"}
+
+# app.3f9a1c2e.js, main.3f9a1c2e7b.css: the content hash is in the name
+HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.[a-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+MAX_HEADER_BYTES = 16 * 1024
+KEEPALIVE_TIMEOUT = 15.0
+ENCODING_CACHE_SIZE = 64
+
+
+class Asset:
+    """One file with its precompressed variants and prebuilt response headers"""
+
+    def __init__(self, url_path, body, content_type, prebuilt=None):
+        self.url_path = url_path
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        immutable = bool(HASHED_NAME.search(url_path))
+        cache_control = IMMUTABLE if immutable else REVALIDATE
+
+        variants = {"identity": body}
+        extension = os.path.splitext(url_path)[1]
+        if extension in COMPRESSIBLE:
+            prebuilt = prebuilt or {}
+            compressed = prebuilt.get("gzip") or gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                variants["gzip"] = compressed
+            compressed = prebuilt.get("br") or (brotli.compress(body, quality=11) if brotli else None)
+            if compressed and len(compressed) < len(body):
+                variants["br"] = compressed
+
+        # Strong ETag per representation; any of them validates for If-None-Match
+        self.etags = {encoding: f'"{digest}{"" if encoding == "identity" else "-" + encoding}"'
+                      for encoding in variants}
+        self.validators = set(self.etags.values())
+        self.variants = variants
+        self.headers = {}
+        for encoding, payload in variants.items():
+            lines = [
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(payload)}",
+                f"ETag: {self.etags[encoding]}",
+                f"Cache-Control: {cache_control}",
+                "Vary: Accept-Encoding",
+            ]
+            if encoding != "identity":
+                lines.append(f"Content-Encoding: {encoding}")
+            self.headers[encoding] = ("\r\n".join(lines) + "\r\n").encode("ascii")
+        self.not_modified = {encoding: (f"ETag: {etag}\r\nCache-Control: {cache_control}\r\n"
+                                        "Vary: Accept-Encoding\r\n").encode("ascii")
+                             for encoding, etag in self.etags.items()}
+
+
+def content_type(path):
+    guessed, _encoding = mimetypes.guess_type(path)
+    guessed = guessed or "application/octet-stream"
+    if guessed.startswith("text/") or guessed in ("application/javascript", "application/json",
+                                                  "image/svg+xml"):
+        guessed += "; charset=utf-8"
+    return guessed
+
+
+class AssetStore:
+    """All web assets under a root directory, keyed by URL path"""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.assets = {}
+        self.load()
+
+    def load(self):
+        assets = {}
+        for directory, dirs, files in os.walk(self.root):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+            for name in files:
+                if os.path.splitext(name)[1] not in WEB_EXTENSIONS or name in SKIP_FILES:
+                    continue
+                path = os.path.join(directory, name)
+                url_path = "/" + os.path.relpath(path, self.root).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    body = f.read()
+                # Build output may ship name.js.gz / name.js.br next to name.js
+                prebuilt = {}
+                for encoding, suffix in (("gzip", ".gz"), ("br", ".br")):
+                    if os.path.exists(path + suffix):
+                        with open(path + suffix, "rb") as f:
+                            prebuilt[encoding] = f.read()
+                assets[url_path] = Asset(url_path, body, content_type(path), prebuilt)
+        if "/index.html" in assets:
+            assets["/"] = assets["/index.html"]
+        self.assets = assets
+        return self
+
+    def lookup(self, target):
+        path = unquote(target.split("?", 1)[0].split("#", 1)[0])
+        asset = self.assets.get(path)
+        if asset is None and path.endswith("/"):
+            asset = self.assets.get(path + "index.html")
+        return asset
+
+    def total_bytes(self):
+        return sum(len(payload) for asset in set(self.assets.values()) for payload in asset.variants.values())
+
+
+def parse_accept_encoding(header):
+    """Accepted codings with their q-values ('*' included)"""
+    accepted = {}
+    for part in header.split(","):
+        token, _sep, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+    return accepted
+
+
+class AssetServer:
+    """asyncio HTTP/1.1 server answering GET/HEAD from an AssetStore"""
+
+    def __init__(self, store):
+        self.store = store
+        self.encoding_cache = {}
+        self.date_header = b""
+        self.date_second = 0
+        self.stats = {"requests": 0, "not_modified": 0, "not_found": 0, "connections": 0}
+
+    def choose_encoding(self, header, asset):
+        """Best available variant for an Accept-Encoding value (cached per distinct header)"""
+        preference = self.encoding_cache.get(header)
+        if preference is None:
+            accepted = parse_accept_encoding(header)
+            wildcard = accepted.get("*", 0.0)
+            preference = tuple(encoding for encoding in ("br", "gzip")
+                               if accepted.get(encoding, wildcard) > 0)
+            if len(self.encoding_cache) >= ENCODING_CACHE_SIZE:
+                self.encoding_cache.clear()
+            self.encoding_cache[header] = preference
+        for encoding in preference:
+            if encoding in asset.variants:
+                return encoding
+        return "identity"
+
+    def date(self):
+        now = int(time.time())
+        if now != self.date_second:
+            self.date_second = now
+            self.date_header = f"Date: {formatdate(now, usegmt=True)}\r\n".encode("ascii")
+        return self.date_header
+
+    async def handle(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(b"HTTP/1.1 431 Request Header Fields Too Large\r\n"
+                                 b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+                    break
+                if not self.respond(head, writer):
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            try:
+                writer.close()
+            except Exception:
+                pass
+
+    def respond(self, head, writer):
+        """Write one response; returns False when the connection should close"""
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+
+        keep_alive = (headers.get("connection", "").lower() != "close"
+                      if version == "HTTP/1.1" else headers.get("connection", "").lower() == "keep-alive")
+        if "transfer-encoding" in headers or headers.get("content-length", "0").strip() != "0":
+            # Bodies are never read: close instead of parsing one as the next request
+            keep_alive = False
+        connection = b"" if keep_alive else b"Connection: close\r\n"
+        self.stats["requests"] += 1
+
+        if method not in ("GET", "HEAD"):
+            writer.write(b"HTTP/1.1 405 Method Not Allowed\r\nAllow: GET, HEAD\r\nContent-Length: 0\r\n"
+                         + connection + b"\r\n")
+            return keep_alive
+
+        asset = self.store.lookup(target)
+        if asset is None:
+            self.stats["not_found"] += 1
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Type: text/plain; charset=utf-8\r\n"
+                         b"Content-Length: 9\r\n" + self.date() + connection + b"\r\n"
+                         + (b"Not Found" if method == "GET" else b""))
+            return keep_alive
+
+        encoding = self.choose_encoding(headers.get("accept-encoding", ""), asset)
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or any(
+                tag.strip().removeprefix("W/") in asset.validators for tag in if_none_match.split(","))):
+            self.stats["not_modified"] += 1
+            writer.write(b"HTTP/1.1 304 Not Modified\r\n" + asset.not_modified[encoding]
+                         + self.date() + connection + b"\r\n")
+            return keep_alive
+
+        writer.write(b"HTTP/1.1 200 OK\r\n" + asset.headers[encoding] + self.date() + connection + b"\r\n")
+        if method == "GET":
+            writer.write(asset.variants[encoding])
+        return keep_alive
+
+    async def serve(self, host, port, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES,
+                                            reuse_address=True, backlog=1024)
+        if ready:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+
+def run(root=".", host="127.0.0.1", port=8000, quiet=False):
+    store = AssetStore(root)
+    server = AssetServer(store)
+
+    def ready(listener):
+        if quiet:
+            return
+        address = listener.sockets[0].getsockname()
+        print(f"🌐 Serverar {len(set(store.assets.values()))} filer "
+              f"({store.total_bytes() / 1024:.0f} kB i minnet, brotli {'på' if brotli else 'av'}) "
+              f"på http://{address[0]}:{address[1]}/")
+
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    try:
+        asyncio.run(server.serve(host, port, ready))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statisk server för webbversionen")
+    parser.add_argument("--root", default=os.path.dirname(os.path.abspath(__file__)),
+                        help="katalog med index.html (t.ex. dist/ efter bygget)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+    run(args.root, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Load benchmark for the asset server
+Starts asset_server.py in a subprocess and replays kiosk page loads from many
+concurrent keep-alive clients, reporting throughput, latency and server CPU
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from percentiles import percentile
+from asset_server import AssetStore
+
+# What kiosk browsers send: modern Chromium, an older gzip-only client, a revalidating reload
+ACCEPT_ENCODINGS = ("gzip, deflate, br, zstd", "gzip, deflate", "")
+
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_cpu_seconds(pid):
+    """utime + stime of a process from /proc (None where /proc is unavailable)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return None
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head[9:12])
+    length = 0
+    etag = None
+    for line in head.split(b"\r\n")[1:]:
+        name, _sep, value = line.partition(b":")
+        name = name.strip().lower()
+        if name == b"content-length":
+            length = int(value)
+        elif name == b"etag":
+            etag = value.strip().decode("ascii")
+    if length:
+        await reader.readexactly(length)
+    return status, length, etag
+
+
+async def client(host, port, paths, requests, revalidate, latencies, totals):
+    """One kiosk browser: a keep-alive connection fetching the page assets in turn"""
+    reader, writer = await asyncio.open_connection(host, port)
+    accept = random.choice(ACCEPT_ENCODINGS)
+    etags = {}
+    try:
+        for index in range(requests):
+            path = paths[index % len(paths)]
+            lines = [f"GET {path} HTTP/1.1", f"Host: {host}:{port}"]
+            if accept:
+                lines.append(f"Accept-Encoding: {accept}")
+            if path in etags and random.random() < revalidate:
+                lines.append(f"If-None-Match: {etags[path]}")
+            started = time.perf_counter()
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("ascii"))
+            status, length, etag = await read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            totals["bytes"] += length
+            totals[status] = totals.get(status, 0) + 1
+            if etag:
+                etags[path] = etag
+    finally:
+        writer.close()
+
+
+async def load(host, port, paths, clients, requests, revalidate):
+    latencies, totals = [], {"bytes": 0}
+    started = time.perf_counter()
+    await asyncio.gather(*(client(host, port, paths, requests, revalidate, latencies, totals)
+                           for _ in range(clients)))
+    return time.perf_counter() - started, sorted(latencies), totals
+
+
+def wait_for_port(host, port, process, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            sys.exit("❌ Servern avslutades direkt")
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    sys.exit("❌ Servern svarade inte")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lasttest av asset_server.py")
+    parser.add_argument("--root", default=ROOT_DIR, help="katalog att servera (t.ex. dist/)")
+    parser.add_argument("--clients", type=int, default=200, help="samtidiga kioskwebbläsare")
+    parser.add_argument("--requests", type=int, default=100, help="anrop per klient")
+    parser.add_argument("--revalidate", type=float, default=0.3,
+                        help="andel anrop med If-None-Match när ETag är känd")
+    parser.add_argument("--json", action="store_true", help="skriv resultatet som JSON")
+    args = parser.parse_args(argv)
+
+    paths = sorted(path for path in AssetStore(args.root).assets if path != "/")
+    host, port = "127.0.0.1", free_port()
+    server = subprocess.Popen([sys.executable, os.path.join(ROOT_DIR, "asset_server.py"),
+                               "--root", args.root, "--host", host, "--port", str(port)],
+                              stdout=subprocess.DEVNULL)
+    try:
+        wait_for_port(host, port, server)
+        cpu_before = process_cpu_seconds(server.pid)
+        elapsed, latencies, totals = asyncio.run(
+            load(host, port, paths, args.clients, args.requests, args.revalidate))
+        cpu_after = process_cpu_seconds(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    count = len(latencies)
+    result = {
+        "clients": args.clients,
+        "requests": count,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(count / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "megabytes": round(totals["bytes"] / 1e6, 2),
+        "status": {str(code): value for code, value in totals.items() if code != "bytes"},
+    }
+    if cpu_before is not None and cpu_after is not None:
+        result["server_cpu_seconds"] = round(cpu_after - cpu_before, 3)
+        result["server_cpu_us_per_request"] = round((cpu_after - cpu_before) / count * 1e6, 1)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"🚀 {count} anrop från {args.clients} klienter på {result['seconds']} s "
+          f"({result['requests_per_second']} anrop/s, {result['megabytes']} MB)")
+    print(f"⏱️ p50 {result['p50_ms']} ms, p90 {result['p90_ms']} ms, p99 {result['p99_ms']} ms")
+    if "server_cpu_seconds" in result:
+        print(f"🧮 Server-CPU {result['server_cpu_seconds']} s "
+              f"({result['server_cpu_us_per_request']} µs per anrop)")
+    print(f"📊 Statuskoder: {result['status']}")
+
+
+if __name__ == "__main__":
+    main()
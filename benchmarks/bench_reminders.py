@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the reminder timer wheel
+Inserts and cancels many pending reminders, ticks through a simulated day
+and rebuilds a scheduler from a journal of the same size
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from reminders import (TimerWheel, Reminder, ReminderScheduler, RecordingNotifier, encode_record,
+                       ADD, JOURNAL, TICK)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark för påminnelsehjulet")
+    parser.add_argument("--count", type=int, default=300000, help="antal väntande påminnelser")
+    parser.add_argument("--days", type=float, default=30, help="påminnelserna sprids över så många dagar")
+    parser.add_argument("--json", action="store_true", help="skriv resultatet som JSON")
+    args = parser.parse_args()
+
+    random.seed(1)
+    now = time.time()
+    payload = json.dumps({"name": "Anna Andersson", "phone": "070-123 45 67",
+                          "meeting": "2026-01-01T09:00:00"}).encode("utf-8")
+    reminders = [Reminder(i, now + random.random() * args.days * 86400, payload) for i in range(args.count)]
+
+    wheel = TimerWheel(int(now // TICK))
+    started = time.perf_counter()
+    for reminder in reminders:
+        wheel.insert(reminder)
+    insert_us = (time.perf_counter() - started) / args.count * 1e6
+
+    cancelled = reminders[::10]
+    started = time.perf_counter()
+    for reminder in cancelled:
+        wheel.remove(reminder)
+    cancel_us = (time.perf_counter() - started) / len(cancelled) * 1e6
+
+    ticks = int(86400 / TICK)
+    started = time.perf_counter()
+    fired = 0
+    for tick in range(1, ticks + 1):
+        fired += len(wheel.advance(int(now // TICK) + tick))
+    day_s = time.perf_counter() - started
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, JOURNAL), "wb") as f:
+            f.write(b"".join(encode_record(ADD, r.id + 1, r.due, payload) for r in reminders))
+        scheduler = ReminderScheduler(directory, RecordingNotifier())
+        while not scheduler.owner:
+            time.sleep(0.01)
+        rebuild_ms = scheduler.stats["rebuild_ms"]
+        scheduler.close()
+
+    result = {"count": args.count, "insert_us": round(insert_us, 2), "cancel_us": round(cancel_us, 2),
+              "day_of_ticks_s": round(day_s, 3), "fired_in_day": fired, "rebuild_ms": rebuild_ms}
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"⏰ {args.count} påminnelser över {args.days:g} dagar")
+    print(f"  insert {insert_us:.2f} µs, cancel {cancel_us:.2f} µs")
+    print(f"  ett dygns tick: {day_s:.2f} s ({fired} avfyrade)")
+    print(f"  återuppbyggnad från journal: {rebuild_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Tk UI hot paths
+Runs headless under Xvfb, reports per-operation latency distributions and
+Tcl call counts, and compares them against a JSON baseline
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from percentiles import percentile
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline_ui.json")
+
+SAMPLE_TEXT = ("Perfekt! Startups är våra favoriter! 💡 Vi kan implementera en AI-chatbot "
+               "som hanterar 80% av era kundförfrågningar automatiskt.")
+
+
+def isolate_environment(directory):
+    """Keep the app's journals, control socket and caches out of the user's home (before importing it)"""
+    for name in ("AXIE_REMINDER_DIR", "AXIE_VISITOR_DIR", "AXIE_CONTROL_DIR", "AXIE_EVENT_DIR", "AXIE_TRANSCRIPT_DIR"):
+        os.environ[name] = ""
+    os.environ["AXIE_CACHE_DIR"] = directory
+
+
+def start_xvfb(display=":99", screen="1280x1024x24"):
+    """Start Xvfb when there is no display; returns the process (or None)"""
+    if os.environ.get("DISPLAY"):
+        return None
+    if not shutil.which("Xvfb"):
+        sys.exit("❌ Ingen DISPLAY och Xvfb saknas - installera xvfb eller kör med en X-server")
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", screen, "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    socket_path = f"/tmp/.X11-unix/X{display.lstrip(':')}"
+    deadline = time.monotonic() + 10
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            sys.exit("❌ Xvfb startade inte")
+        time.sleep(0.05)
+    os.environ["DISPLAY"] = display
+    return process
+
+
+class CountingTcl:
+    """Proxy around a tkapp that counts Tcl calls made through it"""
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self.calls = 0
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tkapp.call(*args)
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+
+
+class UIBench:
+    """Sets up an offline Tk root and times UI operations"""
+
+    def __init__(self, repeat, warmup):
+        import tkinter as tk
+        import requests
+
+        # Benchmarks must not depend on the network (logo download)
+        def offline(*args, **kwargs):
+            raise requests.ConnectionError("offline benchmark")
+        requests.get = offline
+
+        self.tk = tk
+        self.repeat = repeat
+        self.warmup = warmup
+        self.root = tk.Tk()
+        self.counter = CountingTcl(self.root.tk)
+        self.root.tk = self.counter  # Every widget created from now on goes through the proxy
+        self.results = {}
+
+    def measure(self, name, operation, setup=None, teardown=None, repeat=None):
+        """Time operation() plus the idle work it causes, repeat times"""
+        samples, calls = [], []
+        for i in range(self.warmup + (repeat or self.repeat)):
+            state = setup() if setup else None
+            self.root.update()
+            before = self.counter.calls
+            start = time.perf_counter()
+            result = operation(state)
+            self.root.update_idletasks()
+            elapsed = time.perf_counter() - start
+            made = self.counter.calls - before
+            if teardown:
+                teardown(result if result is not None else state)
+            if i >= self.warmup:
+                samples.append(elapsed * 1000)
+                calls.append(made)
+
+        samples.sort()
+        self.results[name] = {
+            "samples": len(samples),
+            "mean_ms": round(sum(samples) / len(samples), 4),
+            "p50_ms": round(percentile(samples, 0.50), 4),
+            "p90_ms": round(percentile(samples, 0.90), 4),
+            "p99_ms": round(percentile(samples, 0.99), 4),
+            "max_ms": round(samples[-1], 4),
+            "tcl_calls": round(sum(calls) / len(calls), 1),
+        }
+        print(f"  {name:<40} p50 {self.results[name]['p50_ms']:>9.3f} ms   "
+              f"p90 {self.results[name]['p90_ms']:>9.3f} ms   "
+              f"{self.results[name]['tcl_calls']:>8.1f} Tcl-anrop")
+
+    def new_chatbot(self, time_scale=1.0):
+        from enhanced_chatbot import SuperAutomatedChatbot
+        from demo_scheduler import DemoScheduler
+        from shared_assets import SharedAssets
+
+        if not hasattr(self, "assets"):
+            self.assets = SharedAssets(self.root)
+        window = self.tk.Toplevel(self.root)
+        scheduler = DemoScheduler(self.root, time_scale=time_scale)
+        return SuperAutomatedChatbot(window, assets=self.assets, scheduler=scheduler, autostart=False)
+
+    def bench_add_message(self):
+        chatbot = self.new_chatbot()
+        self.measure("add_message_with_animation (typing)",
+                     lambda _: chatbot.add_message_with_animation(SAMPLE_TEXT, True))
+        self.measure("add_message_with_animation (no typing)",
+                     lambda _: chatbot.add_message_with_animation(SAMPLE_TEXT, False, animate_typing=False))
+        chatbot.root.destroy()
+
+    def bench_clear_chat(self, counts=(10, 50)):
+        chatbot = self.new_chatbot()
+
+        def fill(count, prepare=False):
+            def setup():
+                for i in range(count):
+                    chatbot.add_message_with_animation(SAMPLE_TEXT, i % 2 == 0, animate_typing=False)
+                if prepare:
+                    chatbot.prepare_chat()  # As the demo does during conversation_delay
+            return setup
+
+        for count in counts:
+            self.measure(f"clear_chat after {count} messages",
+                         lambda _: chatbot.clear_chat(), setup=fill(count),
+                         repeat=max(3, self.repeat // 3))
+            self.measure(f"clear_chat after {count} (pane prepared)",
+                         lambda _: chatbot.clear_chat(), setup=fill(count, prepare=True),
+                         repeat=max(3, self.repeat // 3))
+        chatbot.root.destroy()
+
+    def bench_booking_modal(self):
+        from enhanced_chatbot import AdvancedBookingModal
+
+        parent = self.tk.Toplevel(self.root)
+        self.measure("AdvancedBookingModal construct",
+                     lambda _: AdvancedBookingModal(parent),
+                     teardown=lambda modal: modal.window.destroy())
+
+        def construct(_):
+            return AdvancedBookingModal(parent)
+        self.measure("AdvancedBookingModal teardown",
+                     lambda modal: modal.window.destroy(),
+                     setup=lambda: construct(None))
+        parent.destroy()
+
+    def bench_calendar(self):
+        from chatbot_animation import BookingModal
+
+        modal = BookingModal(self.root)
+        self.measure("BookingModal.update_calendar next_month", lambda _: modal.next_month())
+        self.measure("BookingModal.update_calendar prev_month", lambda _: modal.prev_month())
+        modal.window.destroy()
+
+    def bench_fade(self, counts=(10, 100, 1000)):
+        from chatbot_animation import AnimatedChatbot
+
+        # Build the window without starting its demo thread
+        start_demo = AnimatedChatbot.start_automatic_demo
+        AnimatedChatbot.start_automatic_demo = lambda chatbot: None
+        try:
+            window = self.tk.Toplevel(self.root)
+            chatbot = AnimatedChatbot(window)
+        finally:
+            AnimatedChatbot.start_automatic_demo = start_demo
+
+        existing = 0
+        for count in counts:
+            # Message frames with the same widget shape add_message creates
+            for i in range(existing, count):
+                bubble = self.tk.Frame(chatbot.scrollable_frame, bg='#f8f9fa')
+                bubble.pack(fill=self.tk.X)
+                self.tk.Label(bubble, text=SAMPLE_TEXT, wraplength=300).pack()
+                self.tk.Label(bubble, text="12:00").pack()
+            existing = count
+            self.measure(f"fade_old_messages ({count} messages)",
+                         lambda _: chatbot.fade_old_messages(),
+                         repeat=max(3, self.repeat // (1 + count // 100)))
+        window.destroy()
+
+    def bench_conversation_cycle(self, time_scale=0.001):
+        """One scripted conversation end to end with all pacing delays scaled down"""
+        def run(_):
+            chatbot = self.new_chatbot(time_scale)
+            chatbot.typing_speed = 0.0
+            starts = []
+            chatbot.conversation_listeners.append(starts.append)
+            chatbot.start_super_automation()
+            while len(starts) < 2:
+                self.root.update()
+            return chatbot
+
+        # Destroying the window also closes the booking modal and cancels its tasks
+        self.measure("full accelerated conversation cycle", run,
+                     teardown=lambda chatbot: chatbot.root.destroy(),
+                     repeat=max(2, self.repeat // 10))
+
+    def run(self, only=None):
+        benches = {
+            "add_message": self.bench_add_message,
+            "clear_chat": self.bench_clear_chat,
+            "booking_modal": self.bench_booking_modal,
+            "calendar": self.bench_calendar,
+            "fade": self.bench_fade,
+            "cycle": self.bench_conversation_cycle,
+        }
+        for name, bench in benches.items():
+            if only and name not in only:
+                continue
+            print(f"▶ {name}")
+            bench()
+        return self.results
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of regressions beyond tolerance (relative)"""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        for metric in ("p50_ms", "p90_ms", "tcl_calls"):
+            if reference.get(metric) and result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {result[metric]} > {reference[metric]} "
+                                   f"(+{(result[metric] / reference[metric] - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark för UI-hotpaths (Xvfb)")
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", action="append",
+                        help="add_message, clear_chat, booking_modal, calendar, fade, cycle")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="skriv resultaten som ny baslinje")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="tillåten relativ försämring")
+    parser.add_argument("--json", help="skriv resultaten till denna fil")
+    args = parser.parse_args(argv)
+
+    xvfb = start_xvfb()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            isolate_environment(directory)
+            results = UIBench(args.repeat, args.warmup).run(args.only)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+        print(f"💾 Baslinje sparad i {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print("ℹ️ Ingen baslinje ännu - kör med --save-baseline")
+        return
+    with open(args.baseline, encoding="utf-8") as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    if regressions:
+        print("❌ Prestandaregressioner:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+    print("✅ Inga regressioner utöver toleransen")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the visitor directory
+Builds the prefix index over many synthetic visitors, maps it the way a
+kiosk does at startup and times autocomplete lookups for typed prefixes
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from percentiles import percentile
+from visitor_directory import VisitorDirectory, build_index, LOG
+
+FIRST_NAMES = ("Anna", "Erik", "Maria", "Lars", "Karin", "Johan", "Sara", "Anders", "Eva", "Per", "Åsa", "Örjan",
+               "Linnea", "Mikael", "Sofia", "Björn")
+LAST_NAMES = ("Andersson", "Johansson", "Karlsson", "Nilsson", "Eriksson", "Larsson", "Olsson", "Persson",
+              "Svensson", "Gustafsson", "Lindström", "Öberg", "Åberg", "Holm")
+COMPANIES = ("Innovativa Lösningar", "Nordisk Data", "Företagsgruppen", "Smart Logistik", "Gröna Fastigheter",
+             "Kustbygg", "Medicinteknik Syd", "Fjällresor")
+
+
+def visitor(number):
+    first, last = random.choice(FIRST_NAMES), random.choice(LAST_NAMES)
+    company = f"{random.choice(COMPANIES)} {number % 997} AB"
+    return {"Namn": f"{first} {last}", "E-post": f"{first}.{last}{number}@företag{number % 50}.se".lower(),
+            "Telefon": f"07{random.randint(0, 9)}-{random.randint(100, 999)} {random.randint(10, 99)} "
+                       f"{random.randint(10, 99)}",
+            "Företag": company, "Befattning": "VD", "t": 1700000000 + number}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark för besöksregistret")
+    parser.add_argument("--count", type=int, default=100000, help="antal besökare")
+    parser.add_argument("--lookups", type=int, default=20000, help="antal uppslag")
+    parser.add_argument("--json", action="store_true", help="skriv resultatet som JSON")
+    args = parser.parse_args()
+
+    random.seed(1)
+    records = [visitor(number) for number in range(args.count)]
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, LOG), "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+
+        started = time.perf_counter()
+        size = build_index(directory)
+        build_s = time.perf_counter() - started
+
+        visitors = VisitorDirectory(directory)
+        queries = []
+        for _ in range(args.lookups):
+            record = random.choice(records)
+            field = random.choice(("Namn", "E-post", "Telefon", "Företag"))
+            value = record[field]
+            queries.append((field, value[:random.randint(3, min(len(value), 8))]))
+
+        timings, hits = [], 0
+        for field, prefix in queries:
+            started = time.perf_counter()
+            hits += len(visitors.lookup(field, prefix))
+            timings.append(time.perf_counter() - started)
+        timings.sort()
+        visitors.close()
+
+    result = {"count": args.count, "index_mb": round(size / 2 ** 20, 1), "build_s": round(build_s, 2),
+              "load_ms": visitors.stats["load_ms"],
+              "lookup_p50_us": round(percentile(timings, 0.50) * 1e6, 1),
+              "lookup_p99_us": round(percentile(timings, 0.99) * 1e6, 1),
+              "lookup_max_us": round(timings[-1] * 1e6, 1), "hits_per_lookup": round(hits / len(queries), 2)}
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"👥 {args.count} besökare, index {result['index_mb']} MB byggt på {build_s:.2f} s, "
+          f"laddat på {result['load_ms']} ms")
+    print(f"  uppslag p50 {result['lookup_p50_us']} µs, p99 {result['lookup_p99_us']} µs, "
+          f"max {result['lookup_max_us']} µs ({result['hits_per_lookup']} träffar i snitt)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Synthetic-visitor load generator for the chat and booking path
+Thousands of asyncio visitors replay the user turns of the demo scenarios
+against the local intent matcher, then pick a date, time and service, fill in
+the form and confirm against a shared booking ledger, with think times drawn
+from log-normal distributions; reports throughput, per-step latency
+percentiles and error and conflict rates
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from percentiles import percentile
+from scenarios import CONVERSATIONS
+from intent_matcher import IntentMatcher, build_intents_from_conversations
+from form_validation import FIELD_VALIDATORS
+from reminders import ReminderScheduler, RecordingNotifier, LEAD_SECONDS
+
+# What AdvancedBookingModal offers: 5 business days, these slots and services
+BUSINESS_DAYS = 5
+SLOT_TIMES = ("09:00", "10:30", "13:00", "14:30", "16:00")
+SLOT_PREFERENCE = (3, 2, 1, 2, 1)  # Mornings go first
+SERVICES = ("🤖 Intelligent Kundservice", "📊 Smart Dataanalys", "⚡ Processautomatisering",
+            "💡 Skräddarsydd AI-lösning")
+STEPS = ("chat", "date", "time", "service", "form", "confirm")
+MAX_CONFLICT_RETRIES = 3
+
+# Think time medians in seconds and log-normal spread (sigma)
+READ_CHARS_PER_SECOND = 25
+TYPE_SECONDS_PER_CHAR = (0.12, 0.35)
+THINK = {"date": (4.0, 0.5), "time": (3.0, 0.5), "service": (5.0, 0.6), "field": (5.0, 0.5),
+         "fix": (4.0, 0.5), "confirm": (2.0, 0.4)}
+
+# (valid value, first attempt with a typo) per form field
+FORM_VALUES = {
+    "Namn": ("Anna Andersson", "A"),
+    "E-post": ("anna.andersson@företag.se", "anna.andersson@företag"),
+    "Telefon": ("070-123 45 67", "070-12"),
+    "Företag": ("Innovativa Lösningar AB", ""),
+    "Befattning": ("VD", "VD"),
+}
+
+
+def business_days(today, count=BUSINESS_DAYS):
+    days, day = [], today + timedelta(days=1)
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.date())
+        day += timedelta(days=1)
+    return days
+
+
+
+class BookingLedger:
+    """In-process booking store: consultants per slot, first confirmation wins"""
+
+    def __init__(self, days, consultants):
+        self.capacity = consultants
+        self.booked = {(day, slot): 0 for day in days for slot in SLOT_TIMES}
+
+    def available(self, day):
+        return [slot for slot in SLOT_TIMES if self.booked[day, slot] < self.capacity]
+
+    def reserve(self, day, slot):
+        """Book a consultant for the slot; False when it filled up since the visitor looked"""
+        if self.booked[day, slot] >= self.capacity:
+            return False
+        self.booked[day, slot] += 1
+        return True
+
+
+class LoadRun:
+    def __init__(self, args):
+        self.args = args
+        self.random = random.Random(args.seed)
+        self.matcher = IntentMatcher()
+        self.matcher.build(build_intents_from_conversations(CONVERSATIONS))
+        self.days = business_days(datetime.now())
+        self.ledger = BookingLedger(self.days, args.consultants)
+        self.latencies = defaultdict(list)
+        self.counts = Counter()
+        self.reminders = None
+
+    def think(self, median, sigma):
+        return median * math.exp(self.random.gauss(0.0, sigma)) * self.args.think_scale
+
+    async def step(self, name, delay, action):
+        """Sleep the think time, then run one step; latency includes any event loop lag"""
+        due = time.perf_counter() + delay
+        await asyncio.sleep(delay)
+        result = action()
+        self.latencies[name].append(time.perf_counter() - due)
+        self.counts[f"{name}_steps"] += 1
+        return result
+
+    def chat_turn(self, text):
+        intent, _score = self.matcher.match(text)
+        if intent is None:
+            self.counts["no_intent"] += 1
+            return 0
+        return sum(len(reply) for reply in intent["responses"])
+
+    def pick_date(self):
+        open_days = [day for day in self.days if self.ledger.available(day)]
+        return self.random.choice(open_days) if open_days else None
+
+    def pick_time(self, day):
+        slots = self.ledger.available(day)
+        if not slots:
+            return None
+        weights = [SLOT_PREFERENCE[SLOT_TIMES.index(slot)] for slot in slots]
+        return self.random.choices(slots, weights)[0]
+
+    def validate(self, field, value):
+        error = FIELD_VALIDATORS[field](value)
+        if error:
+            self.counts["validation_errors"] += 1
+        return error
+
+    def confirm(self, day, slot):
+        if not self.ledger.reserve(day, slot):
+            self.counts["conflicts"] += 1
+            return False
+        if self.reminders:
+            start = datetime.combine(day, datetime.strptime(slot, "%H:%M").time())
+            self.reminders.add(start.timestamp() - LEAD_SECONDS, {"meeting": start.isoformat(),
+                                                                 "name": FORM_VALUES["Namn"][0]})
+        return True
+
+    async def visitor(self, number, start_delay):
+        await asyncio.sleep(start_delay)
+        self.counts["started"] += 1
+        try:
+            conversation = CONVERSATIONS[number % len(CONVERSATIONS)]
+            reading = 0
+            for sender, message in conversation:
+                if sender == "bot":
+                    reading += len(message)
+                elif sender == "user":
+                    typing = len(message) * self.think(*TYPE_SECONDS_PER_CHAR)
+                    read_time = reading / READ_CHARS_PER_SECOND * self.args.think_scale
+                    reading = await self.step("chat", read_time + typing,
+                                              lambda message=message: self.chat_turn(message))
+
+            day = await self.step("date", self.think(*THINK["date"]), self.pick_date)
+            slot = day and await self.step("time", self.think(*THINK["time"]), lambda: self.pick_time(day))
+            await self.step("service", self.think(*THINK["service"]), lambda: self.random.choice(SERVICES))
+
+            for field, (value, typo) in FORM_VALUES.items():
+                first = typo if self.random.random() < self.args.typo_rate else value
+                error = await self.step("form", self.think(*THINK["field"]), lambda: self.validate(field, first))
+                if error:
+                    await self.step("form", self.think(*THINK["fix"]), lambda: self.validate(field, value))
+
+            for attempt in range(MAX_CONFLICT_RETRIES + 1):
+                if not slot:
+                    break
+                if await self.step("confirm", self.think(*THINK["confirm"]), lambda: self.confirm(day, slot)):
+                    self.counts["booked"] += 1
+                    return
+                # Taken meanwhile: choose again, another day when this one filled up
+                day = self.pick_date()
+                slot = day and await self.step("time", self.think(*THINK["time"]), lambda: self.pick_time(day))
+            self.counts["fully_booked"] += 1
+        except Exception as e:
+            self.counts["exceptions"] += 1
+            self.counts[f"exception:{type(e).__name__}"] += 1
+        finally:
+            self.counts["finished"] += 1
+
+    async def run(self):
+        # Poisson arrivals spread over the ramp-up period
+        starts, t = [], 0.0
+        rate = self.args.visitors / max(self.args.ramp, 1e-9)
+        for _ in range(self.args.visitors):
+            t += self.random.expovariate(rate)
+            starts.append(min(t, self.args.ramp))
+        started = time.perf_counter()
+        await asyncio.gather(*(self.visitor(number, start) for number, start in enumerate(starts)))
+        return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lasttest av chatt- och bokningsflödet med syntetiska besökare")
+    parser.add_argument("--visitors", type=int, default=2000, help="antal syntetiska besökare")
+    parser.add_argument("--ramp", type=float, default=60.0, help="sekunder över vilka besökarna anländer")
+    parser.add_argument("--think-scale", type=float, default=1.0,
+                        help="skalning av betänketider (1 = realistiskt, 0.01 = stresstest)")
+    parser.add_argument("--consultants", type=int, default=10, help="konsulter (bokningar) per tid")
+    parser.add_argument("--typo-rate", type=float, default=0.1, help="andel fält som först fylls i fel")
+    parser.add_argument("--no-reminders", action="store_true", help="hoppa över påminnelsejournalen")
+    parser.add_argument("--seed", type=int, default=1, help="slumpfrö")
+    parser.add_argument("--json", action="store_true", help="skriv resultatet som JSON")
+    args = parser.parse_args(argv)
+
+    load = LoadRun(args)
+    with tempfile.TemporaryDirectory() as directory:
+        if not args.no_reminders:
+            load.reminders = ReminderScheduler(directory, RecordingNotifier())
+        elapsed = asyncio.run(load.run())
+        if load.reminders:
+            load.reminders.close()
+
+    counts = load.counts
+    steps = {}
+    for name in STEPS:
+        values = sorted(load.latencies[name])
+        steps[name] = {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+            "p90_ms": round(percentile(values, 0.90) * 1000, 3),
+            "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+            "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+        }
+    confirms = max(counts["confirm_steps"], 1)
+    fields = max(counts["form_steps"], 1)
+    result = {
+        "visitors": args.visitors,
+        "seconds": round(elapsed, 3),
+        "think_scale": args.think_scale,
+        "visitors_per_second": round(counts["finished"] / elapsed, 2),
+        "steps_per_second": round(sum(step["count"] for step in steps.values()) / elapsed, 1),
+        "bookings": counts["booked"],
+        "bookings_per_second": round(counts["booked"] / elapsed, 2),
+        "steps": steps,
+        "errors": {
+            "conflicts": counts["conflicts"],
+            "conflict_rate": round(counts["conflicts"] / confirms, 4),
+            "fully_booked": counts["fully_booked"],
+            "validation_errors": counts["validation_errors"],
+            "validation_error_rate": round(counts["validation_errors"] / fields, 4),
+            "no_intent": counts["no_intent"],
+            "exceptions": counts["exceptions"],
+            "error_rate": round((counts["fully_booked"] + counts["exceptions"]) / max(counts["finished"], 1), 4),
+        },
+    }
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+    print(f"👥 {args.visitors} besökare på {elapsed:.1f} s: {result['visitors_per_second']} besökare/s, "
+          f"{result['steps_per_second']} steg/s, {counts['booked']} bokningar")
+    for name, step in steps.items():
+        print(f"  {name:8} {step['count']:7}  p50 {step['p50_ms']:8.2f} ms  p90 {step['p90_ms']:8.2f} ms  "
+              f"p99 {step['p99_ms']:8.2f} ms")
+    errors = result["errors"]
+    print(f"  konflikter {errors['conflicts']} ({errors['conflict_rate']:.1%}), fullbokade {errors['fully_booked']}, "
+          f"valideringsfel {errors['validation_errors']}, utan intent {errors['no_intent']}, "
+          f"undantag {errors['exceptions']}")
+
+
+if __name__ == "__main__":
+    main()
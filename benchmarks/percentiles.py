@@ -0,0 +1,14 @@
+"""
+Percentiles shared by the benchmark reports
+One definition (nearest rank) so p50/p90/p99 mean the same in every report
+"""
+
+import math
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an ascending list: the smallest value with fraction of samples at or below it"""
+    if not len(sorted_values):
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(rank, 1)) - 1]
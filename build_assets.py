@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Build step for the web version
+Minifies and bundles the CSS and JS into content-hashed files, inlines the
+CSS of the initial chat view into index.html and loads the booking popup and
+ending animation on first use; results are cached by input hash
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from html.parser import HTMLParser
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BUILD_VERSION = "1"  # Bump when the output format changes to invalidate the cache
+CACHE_DIR = ".cache"
+MANIFEST = "build.json"
+
+# Initial chat view: inlined critical rules, the rest loads without blocking first paint
+APP_CSS = ("styles/main.css", "styles/chat-animations.css")
+APP_JS = ("js/chat-controller.js", "js/paper-plane-animation.js")
+# Loaded on first use by the loader in the app bundle
+LAZY_CHUNKS = {
+    "booking": {"js": ("js/booking-controller.js",), "css": ("styles/booking-popup.css",)},
+    "ending": {"js": ("js/ending-animation.js",), "css": ()},
+}
+# Markup that stays hidden until a lazy chunk shows it
+LAZY_ROOTS = {"bookingModal", "successModal"}
+HASH_LENGTH = 10
+
+LOADER_JS = """
+(function () {
+    var chunks = %s;
+    var loading = {};
+
+    function loadStyle(href) {
+        return new Promise(function (resolve) {
+            var link = document.createElement('link');
+            link.rel = 'stylesheet';
+            link.href = href;
+            link.onload = link.onerror = resolve;
+            document.head.appendChild(link);
+        });
+    }
+
+    function loadScript(src) {
+        return new Promise(function (resolve, reject) {
+            var script = document.createElement('script');
+            script.src = src;
+            script.onload = resolve;
+            script.onerror = reject;
+            document.head.appendChild(script);
+        });
+    }
+
+    function load(name) {
+        if (!loading[name]) {
+            var chunk = chunks[name];
+            loading[name] = Promise.all(chunk.css.map(loadStyle)).then(function () {
+                return Promise.all(chunk.js.map(loadScript));
+            });
+        }
+        return loading[name];
+    }
+
+    window.axieLoad = load;
+
+    // Stands in for the booking controller until its chunk replaces it
+    var placeholder = {
+        openModal: function () {
+            load('booking').then(function () {
+                if (window.bookingController !== placeholder) {
+                    window.bookingController.openModal();
+                }
+            });
+        }
+    };
+    window.bookingController = placeholder;
+
+    document.addEventListener('bookingCompleted', function replay(event) {
+        document.removeEventListener('bookingCompleted', replay);
+        load('ending').then(function () {
+            document.dispatchEvent(new CustomEvent('bookingCompleted', { detail: event.detail }));
+        });
+    });
+})();
+"""
+
+JS_KEYWORDS_BEFORE_EXPRESSION = {"return", "typeof", "case", "do", "else", "in", "of", "new", "delete",
+                                 "void", "throw", "instanceof", "yield", "await"}
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source",
+                 "track", "wbr"}
+
+
+def digest(*parts):
+    sha = hashlib.sha256(BUILD_VERSION.encode())
+    for part in parts:
+        sha.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+class BuildCache:
+    """Minified and compressed outputs keyed by the hash of their input"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.used = set()
+        self.hits = self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, kind, data, build):
+        key = digest(kind, data)
+        path = os.path.join(self.directory, key)
+        self.used.add(key)
+        try:
+            with open(path, "rb") as f:
+                self.hits += 1
+                return f.read()
+        except OSError:
+            pass
+        self.misses += 1
+        result = build(data)
+        with open(path + ".tmp", "wb") as f:
+            f.write(result)
+        os.replace(path + ".tmp", path)
+        return result
+
+    def prune(self):
+        """Drop entries the current build did not use"""
+        for name in os.listdir(self.directory):
+            if name not in self.used:
+                os.remove(os.path.join(self.directory, name))
+
+
+# Minifiers
+
+def split_css_strings(css):
+    """Alternate (code, string) pieces so string contents are never rewritten"""
+    return re.split(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')""", css)
+
+
+def minify_css(css):
+    pieces = split_css_strings(re.sub(r"/\*.*?\*/", "", css, flags=re.S))
+    for index in range(0, len(pieces), 2):
+        code = re.sub(r"\s+", " ", pieces[index])
+        code = re.sub(r"\s*([{};,>])\s*", r"\1", code)
+        code = re.sub(r":\s+", ":", code)
+        pieces[index] = code.replace(";}", "}")
+    return "".join(pieces).strip()
+
+
+def skip_string(source, index):
+    """Index just past the string literal starting at index"""
+    quote = source[index]
+    index += 1
+    while index < len(source) and source[index] != quote:
+        index += 2 if source[index] == "\\" else 1
+    return index + 1
+
+
+def skip_template(source, index):
+    """Index just past the template literal starting at index (nested ${} included)"""
+    index += 1
+    while index < len(source) and source[index] != "`":
+        if source[index] == "\\":
+            index += 2
+        elif source.startswith("${", index):
+            index = skip_braces(source, index + 1)
+        else:
+            index += 1
+    return index + 1
+
+
+def skip_braces(source, index):
+    """Index just past the } matching the { at index"""
+    depth = 0
+    while index < len(source):
+        char = source[index]
+        if char in "'\"":
+            index = skip_string(source, index)
+            continue
+        if char == "`":
+            index = skip_template(source, index)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return index
+
+
+def skip_regex(source, index):
+    in_class = False
+    index += 1
+    while index < len(source):
+        char = source[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            index += 1
+            while index < len(source) and source[index].isalpha():
+                index += 1
+            return index
+        elif char == "\n":
+            return index
+        index += 1
+    return index
+
+
+def is_word(char):
+    return char.isalnum() or char in "_$\\" or ord(char) > 127
+
+
+def minify_js(source):
+    """Strip comments and whitespace without touching literals (keeps newlines where ASI could matter)"""
+    out = []
+    prev = ""          # last emitted character
+    last_word = ""     # last emitted identifier, to tell regex literals from division
+    gap = ""           # pending whitespace: "", " " or "\n"
+    index, length = 0, len(source)
+
+    def emit(token):
+        nonlocal prev, gap
+        first = token[0]
+        if gap == "\n" and prev and prev not in "{;,([" and first not in ")]}.,;":
+            out.append("\n")
+        elif gap and prev and ((is_word(prev) and is_word(first)) or (prev == first and first in "+-/")):
+            out.append(" ")
+        out.append(token)
+        prev = token[-1]
+        gap = ""
+
+    while index < length:
+        char = source[index]
+        if char in " \t\r\n":
+            if char == "\n" or gap == "\n":
+                gap = "\n"
+            elif not gap:
+                gap = " "
+            index += 1
+        elif source.startswith("//", index):
+            end = source.find("\n", index)
+            index = length if end < 0 else end
+        elif source.startswith("/*", index):
+            end = source.find("*/", index + 2)
+            index = length if end < 0 else end + 2
+            gap = gap or " "
+        elif char in "'\"":
+            end = skip_string(source, index)
+            emit(source[index:end])
+            last_word = ""
+            index = end
+        elif char == "`":
+            end = skip_template(source, index)
+            emit(source[index:end])
+            last_word = ""
+            index = end
+        elif char == "/" and (not prev or prev in "(,=:[!&|?{};+-*%<>~^" or last_word in JS_KEYWORDS_BEFORE_EXPRESSION):
+            end = skip_regex(source, index)
+            emit(source[index:end])
+            last_word = ""
+            index = end
+        elif is_word(char):
+            end = index
+            while end < length and is_word(source[end]):
+                end += 1
+            last_word = source[index:end]
+            emit(last_word)
+            index = end
+        else:
+            emit(char)
+            last_word = ""
+            index += 1
+    return "".join(out).strip()
+
+
+def minify_html(html):
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    return re.sub(r"\n\s+", "\n", html).strip() + "\n"
+
+
+# Critical CSS
+
+class ViewScanner(HTMLParser):
+    """Tags, classes and ids of the markup visible before any lazy chunk runs"""
+
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+        self.hidden_depth = None
+        self.tags, self.classes, self.ids = {"html", "body", "*"}, set(), set()
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        void = tag in VOID_ELEMENTS
+        if self.hidden_depth is None and attrs.get("id") in LAZY_ROOTS and not void:
+            self.hidden_depth = len(self.stack)
+        if self.hidden_depth is None:
+            self.tags.add(tag)
+            self.classes.update((attrs.get("class") or "").split())
+            if attrs.get("id"):
+                self.ids.add(attrs["id"])
+        if not void:
+            self.stack.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS or tag not in self.stack:
+            return
+        while self.stack and self.stack.pop() != tag:
+            pass
+        if self.hidden_depth is not None and len(self.stack) <= self.hidden_depth:
+            self.hidden_depth = None
+
+
+def scan_view(html, scripts):
+    """Selectors usable by the first paint: static markup plus names the app JS creates"""
+    scanner = ViewScanner()
+    scanner.feed(html)
+    for source in scripts:
+        for literal in re.findall(r"""'([^'\n]*)'|"([^"\n]*)"|`([^`]*)`""", source):
+            words = set(re.findall(r"[A-Za-z][\w-]*", "".join(literal)))
+            scanner.classes |= words
+            scanner.ids |= words
+            scanner.tags |= {word.lower() for word in words}
+    return scanner
+
+
+def split_rules(css):
+    """Top-level (prelude, body) pairs of a comment-free stylesheet"""
+    rules, index = [], 0
+    while index < len(css):
+        start = css.find("{", index)
+        if start < 0:
+            break
+        depth, end = 0, start
+        while end < len(css):
+            if css[end] in "'\"":
+                end = skip_string(css, end)
+                continue
+            if css[end] == "{":
+                depth += 1
+            elif css[end] == "}":
+                depth -= 1
+                if depth == 0:
+                    break
+            end += 1
+        rules.append((css[index:start].strip(), css[start + 1:end]))
+        index = end + 1
+    return rules
+
+
+def selector_visible(selector, view):
+    selector = re.sub(r"::?[\w-]+(\([^)]*\))?", "", selector)
+    classes = set(re.findall(r"\.([\w-]+)", selector))
+    ids = set(re.findall(r"#([\w-]+)", selector))
+    tags = {tag.lower() for tag in re.findall(r"(?:^|[\s>+~])([a-zA-Z][\w-]*|\*)", selector)}
+    return classes <= view.classes and ids <= view.ids and tags <= view.tags
+
+
+def split_critical(css, view):
+    """(critical, deferred) CSS: rules whose selectors can match the initial view go inline"""
+    critical, deferred, keyframes = [], [], {}
+    for prelude, body in split_rules(re.sub(r"/\*.*?\*/", "", css, flags=re.S)):
+        if prelude.startswith("@keyframes") or prelude.startswith("@-webkit-keyframes"):
+            keyframes[prelude.split()[-1]] = f"{prelude}{{{body}}}"
+        elif prelude.startswith("@media") or prelude.startswith("@supports"):
+            inner_critical, inner_deferred = split_critical(body, view)
+            if inner_critical:
+                critical.append(f"{prelude}{{{inner_critical}}}")
+            if inner_deferred:
+                deferred.append(f"{prelude}{{{inner_deferred}}}")
+        elif prelude.startswith("@"):
+            critical.append(f"{prelude}{{{body}}}")
+        elif any(selector_visible(selector, view) for selector in prelude.split(",")):
+            critical.append(f"{prelude}{{{body}}}")
+        else:
+            deferred.append(f"{prelude}{{{body}}}")
+    # Animations follow the rules that use them
+    critical_text = "".join(critical)
+    for name, rule in keyframes.items():
+        (critical if re.search(rf"\b{re.escape(name)}\b", critical_text) else deferred).append(rule)
+    return "".join(critical), "".join(deferred)
+
+
+# Build
+
+def read(path):
+    with open(os.path.join(ROOT_DIR, path), encoding="utf-8") as f:
+        return f.read()
+
+
+def hashed_name(stem, extension, data):
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.{extension}"
+
+
+def wrap_js(source):
+    """Own scope per file so top-level names of bundled files cannot collide"""
+    return f";(function () {{\n{source}\n}})();"
+
+
+def build(out_dir, force=False):
+    sources = sorted({"index.html", *APP_CSS, *APP_JS,
+                      *(path for chunk in LAZY_CHUNKS.values() for paths in chunk.values() for path in paths)})
+    contents = {path: read(path) for path in sources}
+    input_hash = digest(*(part for path in sources for part in (path, contents[path])),
+                        "brotli" if brotli else "")
+
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    if not force and os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f)
+        if previous.get("input") == input_hash and all(
+                os.path.exists(os.path.join(out_dir, name)) for name in previous["files"]):
+            print(f"✅ Oförändrat - {out_dir} är redan byggd")
+            return previous
+
+    started = time.perf_counter()
+    cache = BuildCache(os.path.join(out_dir, CACHE_DIR))
+    outputs = {}
+
+    def css(paths):
+        return "".join(cache.get("css", contents[path], lambda text: minify_css(text).encode()).decode()
+                       for path in paths)
+
+    def js(paths):
+        return "\n".join(cache.get("js", contents[path],
+                                   lambda text: wrap_js(minify_js(text)).encode()).decode()
+                         for path in paths)
+
+    def add(stem, extension, text):
+        data = text.encode("utf-8")
+        name = hashed_name(stem, extension, data)
+        outputs[name] = data
+        return name
+
+    chunks = {}
+    for name, chunk in LAZY_CHUNKS.items():
+        chunks[name] = {"css": [add(name, "css", css(chunk["css"]))] if chunk["css"] else [],
+                        "js": [add(name, "js", js(chunk["js"]))]}
+
+    html = contents["index.html"]
+    view = scan_view(html, [contents[path] for path in APP_JS])
+    critical, deferred = split_critical("".join(contents[path] for path in APP_CSS), view)
+    critical = minify_css(critical)
+    app_css = add("app", "css", minify_css(deferred))
+    loader = minify_js(LOADER_JS % json.dumps(chunks, separators=(",", ":")))
+    app_js = add("app", "js", loader + "\n" + js(APP_JS))
+
+    for path in APP_CSS + tuple(path for chunk in LAZY_CHUNKS.values() for path in chunk["css"]):
+        html = re.sub(rf'\s*<link[^>]+href="{re.escape(path)}"[^>]*>', "", html)
+    for path in APP_JS + tuple(path for chunk in LAZY_CHUNKS.values() for path in chunk["js"]):
+        html = re.sub(rf'\s*<script[^>]+src="{re.escape(path)}"[^>]*></script>', "", html)
+    head = (f"<style>{critical}</style>\n"
+            f'<link rel="preload" href="{app_css}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            f'<noscript><link rel="stylesheet" href="{app_css}"></noscript>\n'
+            f'<script src="{app_js}" defer></script>\n')
+    html = html.replace("</head>", head + "</head>", 1)
+    outputs["index.html"] = minify_html(html).encode("utf-8")
+
+    # Precompressed variants for asset_server.py
+    for name, data in list(outputs.items()):
+        outputs[name + ".gz"] = cache.get("gzip", data, lambda data: gzip.compress(data, 9, mtime=0))
+        if brotli:
+            outputs[name + ".br"] = cache.get("brotli", data, lambda data: brotli.compress(data, quality=11))
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name, data in outputs.items():
+        path = os.path.join(out_dir, name)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+    # Old hashed files go once the new index.html is in place
+    for name in os.listdir(out_dir):
+        path = os.path.join(out_dir, name)
+        if name not in outputs and name not in (MANIFEST, CACHE_DIR):
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+    cache.prune()
+
+    manifest = {"input": input_hash, "files": sorted(outputs), "chunks": chunks,
+                "app": {"css": app_css, "js": app_js}, "critical_bytes": len(critical)}
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    source_bytes = sum(len(text.encode("utf-8")) for text in contents.values())
+    built_bytes = sum(len(data) for name, data in outputs.items() if not name.endswith((".gz", ".br")))
+    print(f"📦 {source_bytes / 1024:.1f} kB källor → {built_bytes / 1024:.1f} kB i {out_dir} "
+          f"(kritisk CSS {len(critical) / 1024:.1f} kB inline, cache {cache.hits} träffar / "
+          f"{cache.misses} nya, {(time.perf_counter() - started) * 1000:.0f} ms)")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bygg webbversionen till dist/")
+    parser.add_argument("--out", default=os.path.join(ROOT_DIR, "dist"), help="utkatalog")
+    parser.add_argument("--force", action="store_true", help="bygg om även när inget ändrats")
+    args = parser.parse_args(argv)
+    build(args.out, args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,14 @@ from io import BytesIO
 import math
 from datetime import datetime, timedelta
 import calendar
+from smooth_scroll import ScrollRegionKeeper, SmoothScroller
+from i18n import _, format_date, day_abbreviations
+from form_validation import validate_required, validate_email, validate_phone
 
 class BookingModal:
     def __init__(self, parent):
         self.window = tk.Toplevel(parent)
-        self.window.title("Boka Tid - Axie Studio")
+        self.window.title(_("Boka Tid - Axie Studio"))
         
         # Configure the window
         screen_width = self.window.winfo_screenwidth()
@@ -41,7 +44,7 @@ class BookingModal:
         header.pack(fill=tk.X, pady=0)
         header.pack_propagate(False)
         
-        tk.Label(header, text="🎯 Boka Din AI-Konsultation", font=self.title_font,
+        tk.Label(header, text=_("🎯 Boka Din AI-Konsultation"), font=self.title_font,
                 bg='#0066cc', fg='white').pack(pady=15)
 
         # Main content
@@ -52,9 +55,9 @@ class BookingModal:
         welcome_frame = tk.Frame(content, bg='#f0f8ff', relief=tk.RAISED, bd=1)
         welcome_frame.pack(fill=tk.X, pady=10)
         
-        tk.Label(welcome_frame, text="🚀 Upptäck hur AI kan revolutionera ditt företag!", 
+        tk.Label(welcome_frame, text=_("🚀 Upptäck hur AI kan revolutionera ditt företag!"), 
                 font=self.header_font, bg='#f0f8ff', fg='#0066cc').pack(pady=10)
-        tk.Label(welcome_frame, text="Välj en tid som passar dig bäst:", 
+        tk.Label(welcome_frame, text=_("Välj en tid som passar dig bäst:"), 
                 font=self.normal_font, bg='#f0f8ff').pack(pady=(0,10))
 
         # Calendar section
@@ -67,7 +70,7 @@ class BookingModal:
         self.setup_contact_form(content)
         
         # Confirmation button
-        self.confirm_button = tk.Button(content, text="🎉 Bekräfta Min Bokning",
+        self.confirm_button = tk.Button(content, text=_("🎉 Bekräfta Min Bokning"),
                                       font=self.header_font, bg='#00cc66', fg='white',
                                       command=self.confirm_booking, relief=tk.FLAT)
         self.confirm_button.pack(pady=20, ipady=12, ipadx=30)
@@ -76,7 +79,7 @@ class BookingModal:
         calendar_frame = tk.Frame(parent, bg='white')
         calendar_frame.pack(fill=tk.X, pady=10)
         
-        tk.Label(calendar_frame, text="📅 Välj Datum", font=self.header_font,
+        tk.Label(calendar_frame, text=_("📅 Välj Datum"), font=self.header_font,
                 bg='white', fg='#333').pack(anchor='w')
         
         # Month navigation
@@ -87,7 +90,7 @@ class BookingModal:
         
         tk.Button(nav_frame, text="◀", command=self.prev_month, 
                  bg='#0066cc', fg='white', font=self.normal_font).pack(side=tk.LEFT)
-        self.month_label = tk.Label(nav_frame, text=self.current_date.strftime("%B %Y"),
+        self.month_label = tk.Label(nav_frame, text=format_date(self.current_date, "month_year"),
                                   font=self.header_font, bg='white')
         self.month_label.pack(side=tk.LEFT, expand=True)
         tk.Button(nav_frame, text="▶", command=self.next_month,
@@ -102,11 +105,11 @@ class BookingModal:
         time_frame = tk.Frame(parent, bg='white')
         time_frame.pack(fill=tk.X, pady=10)
         
-        tk.Label(time_frame, text="⏰ Tillgängliga Tider", font=self.header_font,
+        tk.Label(time_frame, text=_("⏰ Tillgängliga Tider"), font=self.header_font,
                 bg='white', fg='#333').pack(anchor='w')
         
-        times = ["09:00 - Morgonmöte", "10:30 - Förmiddagssamtal", "13:00 - Lunchmöte", 
-                "14:30 - Eftermiddagssamtal", "16:00 - Kvällsmöte"]
+        times = [f"09:00 - {_('Morgonmöte')}", f"10:30 - {_('Förmiddagssamtal')}", f"13:00 - {_('Lunchmöte')}", 
+                f"14:30 - {_('Eftermiddagssamtal')}", f"16:00 - {_('Kvällsmöte')}"]
         
         slots_frame = tk.Frame(time_frame, bg='white')
         slots_frame.pack(fill=tk.X, pady=5)
@@ -121,21 +124,21 @@ class BookingModal:
         form_frame = tk.Frame(parent, bg='white')
         form_frame.pack(fill=tk.X, pady=10)
         
-        tk.Label(form_frame, text="📝 Dina Kontaktuppgifter", font=self.header_font,
+        tk.Label(form_frame, text=_("📝 Dina Kontaktuppgifter"), font=self.header_font,
                 bg='white', fg='#333').pack(anchor='w')
         
         # Name field
-        tk.Label(form_frame, text="Namn:", font=self.normal_font, bg='white').pack(anchor='w')
+        tk.Label(form_frame, text=_("Namn:"), font=self.normal_font, bg='white').pack(anchor='w')
         self.name_entry = tk.Entry(form_frame, font=self.normal_font, bg='#f8f9fa')
         self.name_entry.pack(fill=tk.X, pady=(2,8))
         
         # Email field
-        tk.Label(form_frame, text="E-post:", font=self.normal_font, bg='white').pack(anchor='w')
+        tk.Label(form_frame, text=_("E-post:"), font=self.normal_font, bg='white').pack(anchor='w')
         self.email_entry = tk.Entry(form_frame, font=self.normal_font, bg='#f8f9fa')
         self.email_entry.pack(fill=tk.X, pady=(2,8))
         
         # Phone field
-        tk.Label(form_frame, text="Telefon:", font=self.normal_font, bg='white').pack(anchor='w')
+        tk.Label(form_frame, text=_("Telefon:"), font=self.normal_font, bg='white').pack(anchor='w')
         self.phone_entry = tk.Entry(form_frame, font=self.normal_font, bg='#f8f9fa')
         self.phone_entry.pack(fill=tk.X, pady=(2,8))
 
@@ -145,7 +148,7 @@ class BookingModal:
             widget.destroy()
         
         # Add day headers
-        days = ["Mån", "Tis", "Ons", "Tor", "Fre", "Lör", "Sön"]
+        days = day_abbreviations()
         for i, day in enumerate(days):
             tk.Label(self.calendar_grid, text=day, font=self.normal_font,
                     bg='#0066cc', fg='white', width=4).grid(row=0, column=i, padx=1, pady=1)
@@ -170,12 +173,12 @@ class BookingModal:
 
     def prev_month(self):
         self.current_date = self.current_date.replace(day=1) - timedelta(days=1)
-        self.month_label.config(text=self.current_date.strftime("%B %Y"))
+        self.month_label.config(text=format_date(self.current_date, "month_year"))
         self.update_calendar()
 
     def next_month(self):
         self.current_date = (self.current_date.replace(day=1) + timedelta(days=32)).replace(day=1)
-        self.month_label.config(text=self.current_date.strftime("%B %Y"))
+        self.month_label.config(text=format_date(self.current_date, "month_year"))
         self.update_calendar()
 
     def confirm_booking(self):
@@ -183,26 +186,28 @@ class BookingModal:
         email = self.email_entry.get()
         phone = self.phone_entry.get()
         
-        if name and email and phone:
+        error = (validate_required(name) or validate_email(email)
+                 or validate_phone(phone, required=True))
+        if not error:
             success_window = tk.Toplevel(self.window)
-            success_window.title("Bokning Bekräftad!")
+            success_window.title(_("Bokning Bekräftad!"))
             success_window.geometry("400x200")
             success_window.configure(bg='#00cc66')
             
-            tk.Label(success_window, text="🎉 Fantastiskt!", 
+            tk.Label(success_window, text=_("🎉 Fantastiskt!"), 
                     font=font.Font(size=16, weight="bold"),
                     bg='#00cc66', fg='white').pack(pady=20)
-            tk.Label(success_window, text=f"Tack {name}! Din bokning är bekräftad.",
+            tk.Label(success_window, text=_("Tack {name}! Din bokning är bekräftad.").format(name=name),
                     font=font.Font(size=12), bg='#00cc66', fg='white').pack()
-            tk.Label(success_window, text="Vi skickar en kalenderinbjudan till din e-post.",
+            tk.Label(success_window, text=_("Vi skickar en kalenderinbjudan till din e-post."),
                     font=font.Font(size=10), bg='#00cc66', fg='white').pack(pady=10)
             
-            tk.Button(success_window, text="Stäng", command=success_window.destroy,
+            tk.Button(success_window, text=_("Stäng"), command=success_window.destroy,
                      bg='white', fg='#00cc66', font=font.Font(weight="bold")).pack(pady=20)
             
             self.window.after(3000, self.animate_disappear)
         else:
-            error_label = tk.Label(self.window, text="⚠️ Vänligen fyll i alla fält!",
+            error_label = tk.Label(self.window, text=f"⚠️ {error}",
                                  bg='#ffcccc', fg='#cc0000', font=self.normal_font)
             error_label.pack(pady=5)
             self.window.after(3000, error_label.destroy)
@@ -226,7 +231,7 @@ class BookingModal:
 class AnimatedChatbot:
     def __init__(self, root):
         self.root = root
-        self.root.title("🤖 Axie Studio AI-Assistent")
+        self.root.title(_("🤖 Axie Studio AI-Assistent"))
         
         # Configure the window
         self.root.configure(bg='#ffffff')
@@ -254,6 +259,7 @@ class AnimatedChatbot:
             'user_text': '#333333',
             'success': '#00cc66'
         }
+        self.next_pane = None  # Next conversation's pane, built off-screen (see prepare_chat)
         
         self.setup_ui()
         self.setup_enhanced_conversation()
@@ -289,9 +295,9 @@ class AnimatedChatbot:
         header_text = tk.Frame(self.header_frame, bg=self.colors['primary'])
         header_text.pack(side=tk.LEFT, padx=10, pady=15)
         
-        tk.Label(header_text, text="Axie Studio AI-Assistent", font=self.header_font,
+        tk.Label(header_text, text=_("Axie Studio AI-Assistent"), font=self.header_font,
                 bg=self.colors['primary'], fg='white').pack(anchor='w')
-        tk.Label(header_text, text="🟢 Online • Redo att revolutionera ditt företag", 
+        tk.Label(header_text, text=_("🟢 Online • Redo att revolutionera ditt företag"), 
                 font=self.small_font, bg=self.colors['primary'], fg='#ccddff').pack(anchor='w')
 
         # Chat display with enhanced canvas
@@ -300,7 +306,7 @@ class AnimatedChatbot:
         
         self.canvas = tk.Canvas(self.chat_frame, bg='#f8f9fa', highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(self.chat_frame, orient=tk.VERTICAL, command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas, bg='#f8f9fa')
+        self.scrollable_frame, self.typing_frame, self.typing_dots = self.create_chat_pane()
 
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
         
@@ -309,21 +315,9 @@ class AnimatedChatbot:
         
         self.canvas_frame = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        self.scrollable_frame.bind('<Configure>', self.on_frame_configure)
+        self.scroll_keeper = ScrollRegionKeeper(self.canvas, self.scrollable_frame)
+        self.smooth_scroller = SmoothScroller(self.canvas, self.scroll_keeper)
         self.canvas.bind('<Configure>', self.on_canvas_configure)
-        
-        # Enhanced typing indicator
-        self.typing_frame = tk.Frame(self.scrollable_frame, bg='#f8f9fa')
-        self.typing_label = tk.Label(self.typing_frame, text="AI-assistenten skriver", 
-                                   font=self.small_font, bg='#f8f9fa', fg='#666')
-        self.typing_label.pack(side=tk.LEFT, padx=10)
-        
-        self.typing_dots = []
-        for _ in range(3):
-            dot = tk.Label(self.typing_frame, text="●", font=("Helvetica", 16), 
-                          bg='#f8f9fa', fg=self.colors['primary'])
-            dot.pack(side=tk.LEFT, padx=1)
-            self.typing_dots.append(dot)
 
         # Enhanced input area
         self.input_frame = tk.Frame(self.root, bg='white', height=60)
@@ -338,7 +332,7 @@ class AnimatedChatbot:
         self.input_field.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 15), pady=10)
         
         # Enhanced send button
-        self.send_button = tk.Button(self.input_frame, text="🚀 Skicka", font=self.custom_font,
+        self.send_button = tk.Button(self.input_frame, text=_("🚀 Skicka"), font=self.custom_font,
                                    bg=self.colors['primary'], fg='white', relief=tk.FLAT,
                                    bd=0, padx=20)
         self.send_button.pack(side=tk.RIGHT, padx=10, pady=10)
@@ -361,11 +355,46 @@ class AnimatedChatbot:
             ("system", "OPEN_BOOKING_MODAL")
         ]
 
+    def create_chat_pane(self):
+        """Message frame with its own typing indicator; off-screen until it is the canvas window"""
+        pane = tk.Frame(self.canvas, bg='#f8f9fa')
+        pane.bind('<Configure>', self.on_frame_configure)
+        
+        # Enhanced typing indicator
+        typing_frame = tk.Frame(pane, bg='#f8f9fa')
+        tk.Label(typing_frame, text=_("AI-assistenten skriver"), 
+                font=self.small_font, bg='#f8f9fa', fg='#666').pack(side=tk.LEFT, padx=10)
+        
+        typing_dots = []
+        for i in range(3):
+            dot = tk.Label(typing_frame, text="●", font=("Helvetica", 16), 
+                          bg='#f8f9fa', fg=self.colors['primary'])
+            dot.pack(side=tk.LEFT, padx=1)
+            typing_dots.append(dot)
+        return pane, typing_frame, typing_dots
+
+    def prepare_chat(self):
+        """Build the next conversation's pane while the current one is still on screen"""
+        if self.next_pane is None:
+            self.next_pane = self.create_chat_pane()
+
+    def swap_chat_pane(self):
+        """Show the prepared pane with one canvas item change and drop the old one when idle"""
+        self.prepare_chat()
+        retired = self.scrollable_frame
+        self.scrollable_frame, self.typing_frame, self.typing_dots = self.next_pane
+        self.next_pane = None
+        self.canvas.itemconfigure(self.canvas_frame, window=self.scrollable_frame)
+        self.canvas.yview_moveto(0)
+        self.scroll_keeper.reset(self.scrollable_frame)
+        self.root.after_idle(retired.destroy)
+
     def on_frame_configure(self, event=None):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.scroll_keeper.request()
 
     def on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_frame, width=event.width)
+        self.scroll_keeper.request()
 
     def fade_old_messages(self):
         """Enhanced message fading with better visual effects"""
@@ -441,7 +470,7 @@ class AnimatedChatbot:
         self.typing_frame.pack(anchor='w', padx=15, pady=5)
         
         # Enhanced scroll to bottom
-        self.root.after(100, lambda: self.canvas.yview_moveto(1.0))
+        self.smooth_scroller.scroll_to_bottom()
 
     def simulate_user_typing(self, text):
         """Enhanced user typing simulation"""
@@ -498,11 +527,8 @@ class AnimatedChatbot:
         """Enhanced automatic demo with better pacing"""
         def demo_loop():
             while True:
-                # Clear previous messages with fade effect
-                for widget in list(self.scrollable_frame.winfo_children()):
-                    if widget != self.typing_frame:
-                        self.fade_widget(widget, 0.0)
-                        self.root.after(100, widget.destroy)
+                # Swap in the pane prepared during the last pause
+                self.root.after(0, self.swap_chat_pane)
                 
                 time.sleep(1)
                 self.root.update()
@@ -530,6 +556,7 @@ class AnimatedChatbot:
                     
                     time.sleep(2)  # Better pacing between messages
                 
+                self.root.after(0, self.prepare_chat)
                 time.sleep(5)  # Longer pause before restarting
 
         # Start enhanced demo in separate thread
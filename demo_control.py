@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Local control plane for running demos
+Every demo process listens on a Unix domain socket; booth staff pause,
+resume, skip, jump between scenarios, open or close the booking modal,
+change the pacing and seek or speed up a replay with the CLI below instead
+of restarting the process
+"""
+
+import argparse
+import atexit
+import glob
+import json
+import os
+import queue
+import socket
+import sys
+import tempfile
+import threading
+import weakref
+
+from message_stream import FRAME_MS
+
+SOCKET_PATTERN = "control-*.sock"
+REPLY_TIMEOUT = 2.0   # Seconds a client waits for the UI thread to apply a command
+PACING = ("typing_speed", "message_delay", "conversation_delay")
+HIDDEN_POLL_MS = 250  # Poll interval while every window of the process is hidden (low-power mode)
+
+
+def default_control_dir():
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "axie-studio")
+    return os.path.join(tempfile.gettempdir(), f"axie-studio-{os.getuid()}")
+
+
+def control_dir():
+    """Socket directory: AXIE_CONTROL_DIR (empty turns the control plane off) or the runtime dir"""
+    directory = os.environ.get("AXIE_CONTROL_DIR")
+    return default_control_dir() if directory is None else directory
+
+
+# Commands run on the Tk thread: (chatbot, args) -> dict merged into the reply
+COMMANDS = {
+    "status": lambda chatbot, args: {},
+    "pause": lambda chatbot, args: chatbot.pause_demo(),
+    "resume": lambda chatbot, args: chatbot.resume_demo(),
+    "skip": lambda chatbot, args: chatbot.skip_message(),
+    "jump": lambda chatbot, args: chatbot.jump_to_scenario(int(args["scenario"]) - 1),
+    "booking": lambda chatbot, args: chatbot.control_booking(args.get("action", "open")),
+    "pacing": lambda chatbot, args: chatbot.set_pacing(**{name: float(args[name])
+                                                        for name in PACING if name in args}),
+    "seek": lambda chatbot, args: chatbot.control_seek(float(args["seconds"])),
+    "speed": lambda chatbot, args: chatbot.control_replay_speed(float(args["speed"])),
+}
+
+
+class ControlServer:
+    """Unix socket for the chat windows of one Tk interpreter"""
+
+    def __init__(self, root, path):
+        self.root = root
+        self.path = path
+        self.chatbots = []
+        self.requests = queue.Queue()
+        self.closed = False
+
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if os.path.exists(path):
+            os.unlink(path)  # Left behind by a crashed process with the same pid
+        self.sock.bind(path)
+        os.chmod(path, 0o600)
+        self.sock.listen(8)
+        threading.Thread(target=self.accept_loop, name="demo-control", daemon=True).start()
+
+        self.root.after(FRAME_MS, self.poll)
+        self.root.bind('<Destroy>', self.on_destroy, add='+')
+        atexit.register(self.close)
+
+    def accept_loop(self):
+        while True:
+            try:
+                conn, _address = self.sock.accept()
+            except OSError:
+                return  # Closed
+            threading.Thread(target=self.serve, args=(conn,), name="demo-control-client", daemon=True).start()
+
+    def serve(self, conn):
+        """One JSON request per line, one JSON reply per line"""
+        with conn, conn.makefile("rwb") as stream:
+            for line in stream:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    reply = {"ok": False, "error": "ogiltig JSON"}
+                else:
+                    if not isinstance(request, dict) or not isinstance(request.get("args") or {}, dict):
+                        reply = {"ok": False, "error": "förfrågan måste vara ett JSON-objekt"}
+                    else:
+                        done = queue.Queue(1)
+                        self.requests.put((request, done))
+                        try:
+                            reply = done.get(timeout=REPLY_TIMEOUT)
+                        except queue.Empty:
+                            reply = {"ok": False, "error": "gränssnittet svarar inte"}
+                try:
+                    stream.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+                    stream.flush()
+                except OSError:
+                    return
+
+    def poll(self):
+        # Client threads only queue requests: they are applied here, on the Tk thread, once per frame
+        try:
+            while True:
+                try:
+                    request, done = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    reply = self.dispatch(request)
+                except Exception as e:
+                    reply = {"ok": False, "error": f"internt fel: {e}"}
+                done.put(reply)
+        finally:
+            # One bad request must not stop the control plane for the rest of the process
+            if not self.closed:
+                hidden = all(chatbot.hidden for chatbot in self.chatbots)
+                self.root.after(HIDDEN_POLL_MS if hidden else FRAME_MS, self.poll)
+
+    def dispatch(self, request):
+        command = COMMANDS.get(request.get("command"))
+        if command is None:
+            return {"ok": False, "error": f"okänt kommando: {request.get('command')}"}
+        windows = [(number, chatbot) for number, chatbot in enumerate(self.chatbots, 1)
+                   if chatbot.root.winfo_exists()]
+        window = request.get("window")
+        if window is not None:
+            windows = [(number, chatbot) for number, chatbot in windows if number == window]
+            if not windows:
+                return {"ok": False, "error": f"fönster {window} finns inte"}
+
+        results = []
+        for number, chatbot in windows:
+            try:
+                result = dict(command(chatbot, request.get("args") or {}), ok=True)
+            except (KeyError, ValueError, TypeError) as e:
+                result = {"ok": False, "error": str(e)}
+            result.update(window=number, **chatbot.control_status())
+            results.append(result)
+        return {"ok": all(result["ok"] for result in results), "pid": os.getpid(), "windows": results}
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.sock.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+_servers = weakref.WeakKeyDictionary()  # Tk root -> ControlServer
+
+
+def install_control(chatbot):
+    """Make a chat window controllable through its process' control socket (None when off)"""
+    directory = control_dir()
+    if not directory or not hasattr(socket, "AF_UNIX"):
+        return None
+    root = chatbot.root._root()
+    server = _servers.get(root)
+    if server is None:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        suffix = f"-{len(_servers)}" if _servers else ""
+        try:
+            server = ControlServer(root, os.path.join(directory, f"control-{os.getpid()}{suffix}.sock"))
+        except OSError as e:
+            print(f"⚠️ Kontrollsocket kunde inte öppnas: {e}")
+            return None
+        _servers[root] = server
+    server.chatbots.append(chatbot)
+    return server
+
+
+def send_command(path, request, timeout=REPLY_TIMEOUT + 1.0):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def describe(window):
+    state = "⏸️ pausad" if window["paused"] else ("👤 live" if window["live"] else "▶️ kör")
+    if window.get("replay_speed"):
+        state = f"📼 uppspelning {window['replay_speed']:g}×"
+    if window.get("hidden"):
+        state += " (💤 dold, energisparläge)"
+    pacing = ", ".join(f"{name}={window[name]:g}" for name in PACING)
+    booking = ", 📅 bokning öppen" if window["booking"] else ""
+    line = (f"  fönster {window['window']}: {state}{booking}, "
+            f"scenario {window['scenario'] + 1}/{window['scenarios']}, {pacing}")
+    return line if window["ok"] else f"{line}\n    ❌ {window['error']}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Styr en körande demo via dess kontrollsocket")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("value", nargs="?",
+                        help="scenarionummer för jump, open/close för booking, sekund för seek, "
+                             "faktor för speed")
+    parser.add_argument("--window", type=int, help="bara detta fönster (standard: alla)")
+    parser.add_argument("--pid", type=int, help="bara denna demoprocess (standard: alla)")
+    parser.add_argument("--typing-speed", type=float, help="sekunder per tecken")
+    parser.add_argument("--message-delay", type=float, help="sekunder mellan meddelanden")
+    parser.add_argument("--conversation-delay", type=float, help="sekunder mellan konversationer")
+    parser.add_argument("--dir", default=control_dir() or default_control_dir(), help="socketkatalog")
+    args = parser.parse_args(argv)
+
+    request = {"command": args.command, "window": args.window, "args": {}}
+    if args.command == "jump":
+        if not args.value or not args.value.isdigit():
+            parser.error("jump kräver ett scenarionummer")
+        request["args"]["scenario"] = int(args.value)
+    elif args.command == "booking":
+        if args.value not in ("open", "close"):
+            parser.error("booking kräver open eller close")
+        request["args"]["action"] = args.value
+    elif args.command in ("seek", "speed"):
+        try:
+            value = float(args.value)
+        except (TypeError, ValueError):
+            parser.error(f"{args.command} kräver ett tal")
+        request["args"]["seconds" if args.command == "seek" else "speed"] = value
+    elif args.command == "pacing":
+        request["args"] = {name: getattr(args, name) for name in PACING if getattr(args, name) is not None}
+
+    pattern = f"control-{args.pid}.sock" if args.pid else SOCKET_PATTERN
+    paths = sorted(glob.glob(os.path.join(args.dir, pattern)))
+    if not paths:
+        print(f"❌ Ingen körande demo hittades i {args.dir}")
+        sys.exit(1)
+
+    failed = False
+    for path in paths:
+        try:
+            reply = send_command(path, request)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ {os.path.basename(path)}: {e}")
+            failed = True
+            continue
+        if "windows" not in reply:
+            print(f"❌ {os.path.basename(path)}: {reply.get('error')}")
+            failed = True
+            continue
+        print(f"{'✅' if reply['ok'] else '❌'} Demo {reply['pid']}")
+        for window in reply["windows"]:
+            print(describe(window))
+        failed = failed or not reply["ok"]
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
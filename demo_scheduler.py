@@ -0,0 +1,140 @@
+"""
+Cooperative scheduler for demo scripts
+Runs generator tasks on the Tk event loop: a task yields the number of
+seconds it wants to sleep, so any number of chat windows share one timer
+instead of one thread (and one time.sleep loop) per animation
+"""
+
+import heapq
+import itertools
+import time
+
+from message_stream import FRAME_MS
+
+
+class Task:
+    """A generator scheduled by DemoScheduler"""
+
+    def __init__(self, generator, name):
+        self.generator = generator
+        self.name = name
+        self.done = False
+        self.result = None
+        self.wake_time = 0.0
+        self.remaining = None  # Seconds left to sleep while paused
+        self.callbacks = []
+
+    @property
+    def paused(self):
+        return self.remaining is not None
+
+    def add_done_callback(self, callback):
+        if self.done:
+            callback(self)
+        else:
+            self.callbacks.append(callback)
+
+
+class DemoScheduler:
+    """Single timer driving every demo task on one Tk interpreter"""
+
+    def __init__(self, root, time_scale=1.0):
+        self.root = root
+        self.time_scale = time_scale
+        self.queue = []
+        self.tasks = set()
+        self.counter = itertools.count()
+        self.timer = None
+        self.timer_due = None
+        self.steps = 0
+
+    def spawn(self, generator, name=None, delay=0.0):
+        """Start a generator task after delay seconds"""
+        task = Task(generator, name or getattr(generator, '__name__', 'task'))
+        self.tasks.add(task)
+        self._push(task, time.monotonic() + delay * self.time_scale)
+        return task
+
+    def cancel(self, task):
+        if task.done:
+            return
+        task.generator.close()
+        self._finish(task, None)
+
+    def pause(self, task):
+        """Freeze a task, remembering how long it still had to sleep"""
+        if not task.done and not task.paused:
+            task.remaining = max(0.0, task.wake_time - time.monotonic())
+
+    def resume(self, task):
+        """Continue a paused task exactly where it stopped"""
+        if task.done or not task.paused:
+            return
+        remaining, task.remaining = task.remaining, None
+        self._push(task, time.monotonic() + remaining)
+
+    def wake(self, task):
+        """Cut the current sleep of a task short"""
+        if task.done:
+            return
+        if task.paused:
+            task.remaining = 0.0
+        else:
+            self._push(task, time.monotonic())
+
+    def _push(self, task, wake_time):
+        task.wake_time = wake_time
+        heapq.heappush(self.queue, (wake_time, next(self.counter), task))
+        self._arm(wake_time)
+
+    def _arm(self, due):
+        """Keep exactly one Tk timer, set for the earliest wake time"""
+        if self.timer is not None:
+            if self.timer_due <= due:
+                return
+            self.root.after_cancel(self.timer)
+        delay_ms = max(0, int((due - time.monotonic()) * 1000))
+        self.timer_due = due
+        self.timer = self.root.after(delay_ms, self._run)
+
+    def _run(self):
+        self.timer = None
+        now = time.monotonic()
+        while self.queue and self.queue[0][0] <= now:
+            wake_time, _, task = heapq.heappop(self.queue)
+            # Entries from before a pause, wake or cancel are stale
+            if task.done or task.paused or wake_time != task.wake_time:
+                continue
+            self._step(task)
+        # Drop stale heads so the timer is armed for a live task
+        while self.queue and self._stale(self.queue[0]):
+            heapq.heappop(self.queue)
+        if self.queue:
+            self._arm(self.queue[0][0])
+
+    def _stale(self, entry):
+        wake_time, _, task = entry
+        return task.done or task.paused or wake_time != task.wake_time
+
+    def _step(self, task):
+        self.steps += 1
+        try:
+            delay = next(task.generator)
+        except StopIteration as stop:
+            self._finish(task, stop.value)
+            return
+        except Exception as e:
+            print(f"⚠️ Demo-uppgiften {task.name} kraschade: {e}")
+            self._finish(task, None)
+            return
+        if delay is None:
+            delay = FRAME_MS / 1000
+        self._push(task, time.monotonic() + delay * self.time_scale)
+
+    def _finish(self, task, result):
+        task.done = True
+        task.result = result
+        self.tasks.discard(task)
+        for callback in task.callbacks:
+            callback(task)
+        task.callbacks = []
@@ -0,0 +1,114 @@
+"""
+Scripted demo shared by every front-end
+The scenario loop and its pacing run here as a scheduler generator; Tk and
+terminal front-ends only implement the DemoView methods that put it on screen
+"""
+
+import random
+
+# Default pacing in seconds (changed per window through set_pacing)
+TYPING_SPEED = 0.05  # Per character of a bot message
+MESSAGE_DELAY = 2.0  # Between messages
+CONVERSATION_DELAY = 5.0  # Between conversations
+BOOKING_WAIT = 10  # Time left for the booking step before the next conversation
+
+
+def word_delay(word, typing_speed):
+    """Seconds before the next word of a bot message appears"""
+    return len(word) * typing_speed + random.uniform(0.1, 0.3)
+
+
+def keystroke_delays(text):
+    """Seconds after each character the simulated visitor types"""
+    for char in text:
+        if char == ' ':
+            yield 0.2
+        elif char in '.,!?':
+            yield 0.3
+        else:
+            yield random.uniform(0.05, 0.15)
+
+
+class DemoView:
+    """What a front-end provides to automation_script (methods with side effects only, no pacing)"""
+
+    conversations = ()
+    current_conversation = 0
+    live_mode = False
+    typing_speed = TYPING_SPEED
+    message_delay = MESSAGE_DELAY
+    conversation_delay = CONVERSATION_DELAY
+
+    def start_conversation(self, index):
+        """A scenario begins: update the counter, sessions and listeners"""
+        raise NotImplementedError
+
+    def prepare_chat(self):
+        """Get the next conversation's screen ready during the pause (optional)"""
+
+    def clear_chat(self):
+        raise NotImplementedError
+
+    def add_message_with_animation(self, text, is_bot, animate_typing=True):
+        raise NotImplementedError
+
+    def simulate_user_typing(self, text):
+        """Type text into the input field (generator, yields seconds to wait)"""
+        raise NotImplementedError
+
+    def open_booking_modal(self):
+        raise NotImplementedError
+
+    def generated_reply(self, prompt):
+        """Generated bot reply for the last user turn, None for the scripted one (generator)"""
+        return None
+        yield
+
+
+def automation_script(view, first=0):
+    """Play every scenario forever, starting at scenario first (generator for DemoScheduler)"""
+    count = len(view.conversations)
+    while True:
+        # Kiosk walls start each screen at a different scenario
+        for step in range(count):
+            conv_index = (first + step) % count
+            conversation = view.conversations[conv_index]
+            view.current_conversation = conv_index
+            view.start_conversation(conv_index)
+
+            # Clear chat for new conversation
+            view.clear_chat()
+            yield 1
+
+            # Run conversation
+            prompt = None
+            skip_scripted = False
+            for sender, message in conversation:
+                # Hold the script while a visitor is chatting
+                while view.live_mode:
+                    yield 0.2
+                if sender == "system" and message == "OPEN_BOOKING_MODAL":
+                    yield 1.5
+                    view.open_booking_modal()
+                    yield BOOKING_WAIT  # Wait for booking interaction
+                    break
+                elif sender == "bot":
+                    # A generated reply replaces the whole scripted bot block
+                    if skip_scripted:
+                        continue
+                    generated = yield from view.generated_reply(prompt)
+                    if generated:
+                        skip_scripted = True
+                    view.add_message_with_animation(generated or message, True)
+                    prompt = None
+                    yield view.message_delay
+                else:
+                    yield from view.simulate_user_typing(message)
+                    view.add_message_with_animation(message, False, animate_typing=False)
+                    prompt = message
+                    skip_scripted = False
+                    yield view.message_delay
+
+            # Pause between conversations, building the next screen meanwhile
+            view.prepare_chat()
+            yield view.conversation_delay
@@ -0,0 +1,225 @@
+"""
+Pre-rasterised emoji sprites for Tk
+Emoji used by the scenarios and the UI are drawn once with PIL into a sprite
+atlas cached on disk; widgets show shared PhotoImage crops of it instead of
+going through Tk's per-render font fallback
+"""
+
+import hashlib
+import json
+import os
+import re
+import tkinter as tk
+import weakref
+
+from PIL import Image, ImageDraw, ImageFont
+
+ATLAS_VERSION = "1"
+CACHE_DIR = os.environ.get("AXIE_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "axie-studio")
+POT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locale", "axie.pot")
+
+# Pixel size of each named sprite size
+SIZES = {"icon": 16, "avatar": 22, "logo": 40, "large": 64}
+COLUMNS = 16
+
+# Emoji drawn by the UI outside translated strings (avatars, buttons, time slots)
+UI_EMOJI = ("🤖", "👤", "🚀", "🎉", "💰", "⚠️", "🌅", "☕", "🍽️", "🌞", "🌆")
+
+# (path, pixel size) - bitmap colour fonts only load at their native strike size
+FONT_CANDIDATES = (
+    ("/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf", 109),
+    ("/usr/share/fonts/noto/NotoColorEmoji.ttf", 109),
+    ("/usr/share/fonts/google-noto-emoji/NotoColorEmoji.ttf", 109),
+    ("/usr/share/fonts/noto-emoji/NotoColorEmoji.ttf", 109),
+    ("/System/Library/Fonts/Apple Color Emoji.ttc", 160),
+    ("C:/Windows/Fonts/seguiemj.ttf", 109),
+    ("/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf", 96),
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 96),
+)
+MONO_COLOR = (51, 51, 51, 255)
+
+_BASE = ("[\u203c\u2049\u2122\u2139\u2194-\u21aa\u231a-\u23ff\u24c2\u25aa-\u25fe\u2600-\u27bf"
+         "\u2934\u2935\u2b05-\u2b55\u3030\u303d\u3297\u3299\U0001f000-\U0001faff]")
+_MODIFIER = "(?:\ufe0f|[\U0001f3fb-\U0001f3ff])?"
+EMOJI = re.compile(rf"[\U0001f1e6-\U0001f1ff]{{2}}|[#*0-9]\ufe0f?\u20e3"
+                   rf"|{_BASE}{_MODIFIER}(?:\u200d{_BASE}{_MODIFIER})*")
+
+
+def find_emoji(texts):
+    """Distinct emoji sequences in the given strings, in order of appearance"""
+    found = {}
+    for text in texts:
+        for match in EMOJI.finditer(text):
+            found.setdefault(match.group(), None)
+    return list(found)
+
+
+def split_leading_emoji(text):
+    """('🎯', 'Rest of text') when text starts with an emoji, else (None, text)"""
+    match = EMOJI.match(text)
+    if not match:
+        return None, text
+    return match.group(), text[match.end():].lstrip()
+
+
+def ui_strings():
+    """String lines of the extracted catalogue template, i.e. every translatable UI text"""
+    try:
+        with open(POT_PATH, encoding="utf-8") as f:
+            return [line for line in f.read().splitlines() if line.startswith(('msgid "', '"'))]
+    except OSError:
+        return []
+
+
+def find_font():
+    """(ImageFont, path, colour) of the first usable emoji font, or None"""
+    override = os.environ.get("AXIE_EMOJI_FONT")
+    candidates = ((override, 109), (override, 96)) if override else FONT_CANDIDATES
+    for path, size in candidates:
+        if not os.path.exists(path):
+            continue
+        try:
+            emoji_font = ImageFont.truetype(path, size)
+        except OSError:
+            continue
+        colour = "Color" in os.path.basename(path) or path.endswith("seguiemj.ttf")
+        return emoji_font, path, colour
+    return None
+
+
+def render_glyph(emoji_font, text, colour):
+    size = emoji_font.size
+    image = Image.new("RGBA", (size * 3, size * 2), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    try:
+        draw.text((size // 2, size // 2), text, font=emoji_font, embedded_color=colour,
+                  fill=None if colour else MONO_COLOR)
+    except (OSError, ValueError):
+        return None
+    box = image.getbbox()
+    return image.crop(box) if box else None
+
+
+class EmojiAtlas:
+    """Sprite sheet PNG plus the position of every emoji at every size"""
+
+    def __init__(self, path, positions, font_path):
+        self.path = path
+        self.positions = positions  # pixel size -> emoji -> (x, y)
+        self.font_path = font_path
+
+    def position(self, emoji, pixels):
+        return self.positions.get(pixels, {}).get(emoji)
+
+    @classmethod
+    def build(cls, emoji, sizes=SIZES.values(), cache_dir=CACHE_DIR):
+        """Load the atlas for these emoji from the disk cache, rasterising it on a miss"""
+        found = find_font()
+        if not found:
+            print("⚠️ Inget emoji-typsnitt hittades - emoji visas som text")
+            return None
+        emoji_font, font_path, colour = found
+        sizes = sorted(set(sizes))
+        emoji = sorted(set(emoji))
+        stat = os.stat(font_path)
+        key = hashlib.sha256(json.dumps([ATLAS_VERSION, font_path, stat.st_size, int(stat.st_mtime),
+                                         sizes, emoji]).encode("utf-8")).hexdigest()[:16]
+        png_path = os.path.join(cache_dir, f"emoji-{key}.png")
+        index_path = os.path.join(cache_dir, f"emoji-{key}.json")
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            if os.path.exists(png_path):
+                return cls(png_path, {int(pixels): {text: tuple(xy) for text, xy in entries.items()}
+                                      for pixels, entries in index.items()}, font_path)
+        except (OSError, ValueError):
+            pass
+
+        # Missing glyphs render as the .notdef box, like a private-use code point does
+        notdef = render_glyph(emoji_font, "\U0010fffd", colour)
+        glyphs = {}
+        for text in emoji:
+            glyph = render_glyph(emoji_font, text, colour)
+            if glyph is not None and (notdef is None or glyph.tobytes() != notdef.tobytes()):
+                glyphs[text] = glyph
+        if not glyphs:
+            print(f"⚠️ {os.path.basename(font_path)} saknar emoji - emoji visas som text")
+            return None
+
+        names = sorted(glyphs)
+        rows_per_size = -(-len(names) // COLUMNS)
+        width = COLUMNS * sizes[-1]
+        height = sum(rows_per_size * pixels for pixels in sizes)
+        sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        positions = {}
+        y0 = 0
+        for pixels in sizes:
+            positions[pixels] = {}
+            for i, text in enumerate(names):
+                glyph = glyphs[text]
+                scale = pixels / max(glyph.size)
+                fitted = glyph.resize((max(1, round(glyph.width * scale)), max(1, round(glyph.height * scale))),
+                                      Image.Resampling.LANCZOS)
+                x, y = (i % COLUMNS) * pixels, y0 + (i // COLUMNS) * pixels
+                sheet.paste(fitted, (x + (pixels - fitted.width) // 2, y + (pixels - fitted.height) // 2), fitted)
+                positions[pixels][text] = (x, y)
+            y0 += rows_per_size * pixels
+
+        os.makedirs(cache_dir, exist_ok=True)
+        sheet.save(png_path + ".tmp", "PNG", optimize=True)
+        os.replace(png_path + ".tmp", png_path)
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(positions, f, ensure_ascii=False)
+        os.replace(index_path + ".tmp", index_path)
+        return cls(png_path, positions, font_path)
+
+
+class EmojiSprites:
+    """Shared PhotoImage crops of one atlas for one Tk interpreter"""
+
+    def __init__(self, root, atlas):
+        self.root = root
+        self.atlas = atlas
+        self.sheet = tk.PhotoImage(master=root, file=atlas.path) if atlas else None
+        self.crops = {}
+
+    def image(self, emoji, size="avatar"):
+        """PhotoImage of emoji at a named size, or None when it is not in the atlas"""
+        key = (emoji, size)
+        if key not in self.crops:
+            pixels = SIZES[size]
+            position = self.atlas.position(emoji, pixels) if self.atlas else None
+            crop = None
+            if position:
+                x, y = position
+                crop = tk.PhotoImage(master=self.root, width=pixels, height=pixels)
+                crop.tk.call(crop, "copy", self.sheet, "-from", x, y, x + pixels, y + pixels, "-to", 0, 0)
+            self.crops[key] = crop
+        return self.crops[key]
+
+    def options(self, text, size="icon"):
+        """Widget options showing a leading emoji as an image next to the remaining text"""
+        emoji, rest = split_leading_emoji(text)
+        image = self.image(emoji, size) if emoji else None
+        if image is None:
+            return {"text": text}
+        if rest:
+            return {"image": image, "text": " " + rest, "compound": tk.LEFT}
+        return {"image": image, "text": ""}
+
+
+_sprites = weakref.WeakKeyDictionary()  # Tk root -> EmojiSprites
+
+
+def install_sprites(root, texts=()):
+    """Build (or load) the atlas for the UI and the given texts and attach it to root"""
+    emoji = find_emoji(list(texts) + ui_strings()) + list(UI_EMOJI)
+    sprites = EmojiSprites(root, EmojiAtlas.build(emoji))
+    _sprites[root] = sprites
+    return sprites
+
+
+def emoji_options(widget, text, size="icon"):
+    """Options for a Label/Button showing text, using the sprites of the widget's root if any"""
+    sprites = _sprites.get(widget._root())
+    return sprites.options(text, size) if sprites else {"text": text}
@@ -8,30 +8,72 @@ import tkinter as tk
 from tkinter import ttk, font, messagebox
 import time
 import threading
-from PIL import Image, ImageTk, ImageDraw, ImageFilter
-import requests
-from io import BytesIO
 import math
 from datetime import datetime, timedelta
 import calendar
-import random
 import json
+import os
+from scenarios import FALLBACK_REPLY
+from responder import ResponderService, HTTPResponder
+from message_stream import ChunkPump, FRAME_MS
+from shared_assets import SharedAssets
+from demo_scheduler import DemoScheduler
+from smooth_scroll import ScrollRegionKeeper, SmoothScroller
+from event_log import emit, new_session_id
+from i18n import _, N_, format_date, weekday_name
+from form_validation import FIELD_VALIDATORS, DEBOUNCE_MS, email_domain, get_domain_checker
+from emoji_atlas import emoji_options
+from transcript import open_recorder, TranscriptReader, SESSION, CLEAR, MESSAGE
+from demo_control import install_control
+from reminders import get_reminders, LEAD_SECONDS
+from particles import ParticleSystem
+from visibility import track_visibility
+from visitor_directory import get_visitors, describe as describe_visitor, SEARCHABLE
+from demo_script import DemoView, automation_script, word_delay, keystroke_delays, TYPING_SPEED, MESSAGE_DELAY, CONVERSATION_DELAY
+
+# Wrap width of chat bubble text in pixels
+BUBBLE_WRAPLENGTH = 350
+
+# Filled in by the demo; never stored in the visitor directory
+DEMO_VISITOR = {
+    "Namn": "Anna Andersson",
+    "E-post": "anna.andersson@företag.se",
+    "Telefon": "070-123 45 67",
+    "Företag": "Innovativa Lösningar AB",
+    "Befattning": "VD"
+}
 
 class AdvancedBookingModal:
     """Advanced booking modal with enhanced automation and visual effects"""
     
-    def __init__(self, parent):
+    def __init__(self, parent, session=None, scenario=None, live=False, recorder=None, scheduler=None):
         self.window = tk.Toplevel(parent)
-        self.window.title("🚀 AI-Powered Booking System - Axie Studio")
+        self.window.title(_("🚀 AI-Powered Booking System - Axie Studio"))
         self.parent = parent
         
-        # Enhanced window configuration
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
+        # Animations and demo typing run on the chat window's scheduler, suspended while hidden
+        self.scheduler = scheduler or DemoScheduler(self.window)
+        self.tasks = []
+        self.visibility = track_visibility(self.window, self.on_visibility_change)
+        
+        # Returning visitors: autocomplete from earlier bookings (also those made in other processes)
+        self.visitors = get_visitors()
+        if self.visitors:
+            self.visitors.refresh()
+        
+        # Funnel analytics
+        self.session = session
+        self.scenario = scenario
+        self.progress = 0
+        self.confirmed = False
+        self.recorder = recorder  # Transcript of the chat window, for the booking outcome
+        emit("modal_opened", session=session, scenario=scenario, live=live)
+        
+        # Enhanced window configuration, centered over the chat window it belongs to
         window_width = 600
         window_height = 700
-        x = (screen_width - window_width) // 2
-        y = (screen_height - window_height) // 2
+        x = max(0, parent.winfo_rootx() + (parent.winfo_width() - window_width) // 2)
+        y = max(0, parent.winfo_rooty() + (parent.winfo_height() - window_height) // 2)
         self.window.geometry(f'{window_width}x{window_height}+{x}+{y}')
         
         # Advanced styling
@@ -61,6 +103,7 @@ class AdvancedBookingModal:
         self.booking_data = {}
         
         self.setup_advanced_ui()
+        self.window.bind('<Destroy>', self.on_destroy, add='+')
         self.start_entrance_animation()
         self.auto_populate_demo_data()
 
@@ -92,12 +135,12 @@ class AdvancedBookingModal:
         title_frame = tk.Frame(header, bg='#0066cc')
         title_frame.pack(expand=True, fill=tk.BOTH)
         
-        self.title_label = tk.Label(title_frame, text="🎯 Boka Din AI-Transformation", 
+        self.title_label = tk.Label(title_frame, **emoji_options(title_frame, _("🎯 Boka Din AI-Transformation")),
                                    font=self.title_font, bg='#0066cc', fg='white')
         self.title_label.pack(pady=20)
         
         self.subtitle_label = tk.Label(title_frame, 
-                                      text="Upptäck hur AI kan revolutionera ditt företag på bara 30 minuter",
+                                      text=_("Upptäck hur AI kan revolutionera ditt företag på bara 30 minuter"),
                                       font=self.normal_font, bg='#0066cc', fg='#ccddff')
         self.subtitle_label.pack()
         
@@ -118,6 +161,7 @@ class AdvancedBookingModal:
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.content_frame, anchor="nw")
         
+        self.scroll_keeper = ScrollRegionKeeper(self.canvas, self.content_frame)
         self.content_frame.bind('<Configure>', self.on_frame_configure)
         self.canvas.bind('<Configure>', self.on_canvas_configure)
 
@@ -126,7 +170,7 @@ class AdvancedBookingModal:
         progress_frame = tk.Frame(self.content_frame, bg='white', pady=20)
         progress_frame.pack(fill=tk.X, padx=30)
         
-        tk.Label(progress_frame, text="📊 Bokningsprocess", font=self.header_font,
+        tk.Label(progress_frame, **emoji_options(progress_frame, _("📊 Bokningsprocess")), font=self.header_font,
                 bg='white', fg=self.colors['text_dark']).pack(anchor='w')
         
         # Progress bar
@@ -135,7 +179,7 @@ class AdvancedBookingModal:
                                           maximum=100, length=400, mode='determinate')
         self.progress_bar.pack(fill=tk.X, pady=10)
         
-        self.progress_label = tk.Label(progress_frame, text="Steg 1 av 4: Välj datum",
+        self.progress_label = tk.Label(progress_frame, text=_("Steg 1 av 4: Välj datum"),
                                       font=self.small_font, bg='white', fg=self.colors['text_light'])
         self.progress_label.pack(anchor='w')
 
@@ -159,10 +203,10 @@ class AdvancedBookingModal:
         date_frame = tk.Frame(self.content_frame, bg='white', pady=20)
         date_frame.pack(fill=tk.X, padx=30)
         
-        tk.Label(date_frame, text="📅 Välj Datum för Din AI-Konsultation", 
+        tk.Label(date_frame, **emoji_options(date_frame, _("📅 Välj Datum för Din AI-Konsultation")),
                 font=self.header_font, bg='white', fg=self.colors['primary']).pack(anchor='w')
         
-        tk.Label(date_frame, text="Vi har lediga tider nästa vecka - välj det som passar dig bäst:",
+        tk.Label(date_frame, text=_("Vi har lediga tider nästa vecka - välj det som passar dig bäst:"),
                 font=self.normal_font, bg='white', fg=self.colors['text_light']).pack(anchor='w', pady=(5,15))
         
         # Quick date options
@@ -181,7 +225,7 @@ class AdvancedBookingModal:
         
         for i, date in enumerate(business_days):
             date_btn = tk.Button(quick_dates_frame, 
-                               text=f"{date.strftime('%A')}\n{date.strftime('%d %B')}",
+                               text=f"{weekday_name(date)}\n{format_date(date)}",
                                font=self.normal_font, bg=self.colors['bg_light'], 
                                fg=self.colors['text_dark'], width=12, height=3,
                                relief=tk.FLAT, bd=2,
@@ -196,19 +240,19 @@ class AdvancedBookingModal:
         time_frame = tk.Frame(self.content_frame, bg='white', pady=20)
         time_frame.pack(fill=tk.X, padx=30)
         
-        tk.Label(time_frame, text="⏰ Välj Tid som Passar Dig", 
+        tk.Label(time_frame, **emoji_options(time_frame, _("⏰ Välj Tid som Passar Dig")),
                 font=self.header_font, bg='white', fg=self.colors['primary']).pack(anchor='w')
         
-        tk.Label(time_frame, text="Alla tider är 30 minuter och helt kostnadsfria:",
+        tk.Label(time_frame, text=_("Alla tider är 30 minuter och helt kostnadsfria:"),
                 font=self.normal_font, bg='white', fg=self.colors['text_light']).pack(anchor='w', pady=(5,15))
         
         # Time slots with availability
         times_data = [
-            ("09:00", "Morgonmöte", "🌅", "Perfekt för att starta dagen med AI-inspiration"),
-            ("10:30", "Förmiddagssamtal", "☕", "Kaffe och AI - en perfekt kombination"),
-            ("13:00", "Lunchmöte", "🍽️", "Diskutera AI över lunch"),
-            ("14:30", "Eftermiddagssamtal", "🌞", "Mitt på dagen när hjärnan är skarp"),
-            ("16:00", "Kvällsmöte", "🌆", "Avsluta arbetsdagen med framtidstankar")
+            ("09:00", _("Morgonmöte"), "🌅", _("Perfekt för att starta dagen med AI-inspiration")),
+            ("10:30", _("Förmiddagssamtal"), "☕", _("Kaffe och AI - en perfekt kombination")),
+            ("13:00", _("Lunchmöte"), "🍽️", _("Diskutera AI över lunch")),
+            ("14:30", _("Eftermiddagssamtal"), "🌞", _("Mitt på dagen när hjärnan är skarp")),
+            ("16:00", _("Kvällsmöte"), "🌆", _("Avsluta arbetsdagen med framtidstankar"))
         ]
         
         for i, (time, title, emoji, description) in enumerate(times_data):
@@ -216,7 +260,7 @@ class AdvancedBookingModal:
             time_container.pack(fill=tk.X, pady=5)
             
             time_btn = tk.Button(time_container, 
-                               text=f"{emoji} {time} - {title}",
+                               **emoji_options(time_container, f"{emoji} {time} - {title}"),
                                font=self.normal_font, bg=self.colors['bg_light'],
                                fg=self.colors['text_dark'], anchor='w',
                                relief=tk.FLAT, padx=20, pady=10,
@@ -235,17 +279,17 @@ class AdvancedBookingModal:
         service_frame = tk.Frame(self.content_frame, bg='white', pady=20)
         service_frame.pack(fill=tk.X, padx=30)
         
-        tk.Label(service_frame, text="🎯 Vad Vill Du Fokusera På?", 
+        tk.Label(service_frame, **emoji_options(service_frame, _("🎯 Vad Vill Du Fokusera På?")),
                 font=self.header_font, bg='white', fg=self.colors['primary']).pack(anchor='w')
         
-        tk.Label(service_frame, text="Välj det område där AI kan ha störst impact för ditt företag:",
+        tk.Label(service_frame, text=_("Välj det område där AI kan ha störst impact för ditt företag:"),
                 font=self.normal_font, bg='white', fg=self.colors['text_light']).pack(anchor='w', pady=(5,15))
         
         services = [
-            ("🤖 Intelligent Kundservice", "Automatisera kundinteraktioner med AI-chatbots", "Spara 40+ timmar/vecka"),
-            ("📊 Smart Dataanalys", "Förvandla data till actionable insights", "Öka beslutskvalitet med 200%"),
-            ("⚡ Processautomatisering", "Automatisera repetitiva uppgifter", "Frigör tid för strategiskt arbete"),
-            ("💡 Skräddarsydd AI-lösning", "Helt anpassad efter dina behov", "Maximal ROI för ditt företag")
+            (N_("🤖 Intelligent Kundservice"), _("Automatisera kundinteraktioner med AI-chatbots"), _("Spara 40+ timmar/vecka")),
+            (N_("📊 Smart Dataanalys"), _("Förvandla data till actionable insights"), _("Öka beslutskvalitet med 200%")),
+            (N_("⚡ Processautomatisering"), _("Automatisera repetitiva uppgifter"), _("Frigör tid för strategiskt arbete")),
+            (N_("💡 Skräddarsydd AI-lösning"), _("Helt anpassad efter dina behov"), _("Maximal ROI för ditt företag"))
         ]
         
         self.service_var = tk.StringVar()
@@ -254,8 +298,8 @@ class AdvancedBookingModal:
             service_container = tk.Frame(service_frame, bg='white', relief=tk.SOLID, bd=1)
             service_container.pack(fill=tk.X, pady=5)
             
-            radio_btn = tk.Radiobutton(service_container, text=title, font=self.normal_font,
-                                     variable=self.service_var, value=title,
+            radio_btn = tk.Radiobutton(service_container, text=_(title), font=self.normal_font,
+                                     variable=self.service_var, value=title, command=self.select_service,
                                      bg='white', fg=self.colors['text_dark'],
                                      selectcolor=self.colors['primary'], anchor='w')
             radio_btn.pack(fill=tk.X, padx=15, pady=(10,5))
@@ -263,7 +307,7 @@ class AdvancedBookingModal:
             tk.Label(service_container, text=description, font=self.small_font,
                     bg='white', fg=self.colors['text_light'], anchor='w').pack(fill=tk.X, padx=35)
             
-            benefit_label = tk.Label(service_container, text=f"💰 {benefit}", 
+            benefit_label = tk.Label(service_container, **emoji_options(service_container, f"💰 {benefit}"),
                                    font=font.Font(size=9, weight="bold"),
                                    bg='white', fg=self.colors['secondary'], anchor='w')
             benefit_label.pack(fill=tk.X, padx=35, pady=(2,10))
@@ -273,28 +317,33 @@ class AdvancedBookingModal:
         contact_frame = tk.Frame(self.content_frame, bg='white', pady=20)
         contact_frame.pack(fill=tk.X, padx=30)
         
-        tk.Label(contact_frame, text="📝 Dina Kontaktuppgifter", 
+        tk.Label(contact_frame, **emoji_options(contact_frame, _("📝 Dina Kontaktuppgifter")),
                 font=self.header_font, bg='white', fg=self.colors['primary']).pack(anchor='w')
         
-        tk.Label(contact_frame, text="Vi behöver dessa uppgifter för att skicka kalenderinbjudan:",
+        tk.Label(contact_frame, text=_("Vi behöver dessa uppgifter för att skicka kalenderinbjudan:"),
                 font=self.normal_font, bg='white', fg=self.colors['text_light']).pack(anchor='w', pady=(5,15))
         
-        # Form fields with enhanced styling
+        # Form fields with enhanced styling (keys stay Swedish, labels are translated)
         fields = [
-            ("Namn", "Ditt fullständiga namn"),
-            ("E-post", "Din e-postadress för kalenderinbjudan"),
-            ("Telefon", "Ditt telefonnummer (valfritt)"),
-            ("Företag", "Ditt företags namn"),
-            ("Befattning", "Din roll i företaget")
+            ("Namn", _("Namn"), _("Ditt fullständiga namn")),
+            ("E-post", _("E-post"), _("Din e-postadress för kalenderinbjudan")),
+            ("Telefon", _("Telefon"), _("Ditt telefonnummer (valfritt)")),
+            ("Företag", _("Företag"), _("Ditt företags namn")),
+            ("Befattning", _("Befattning"), _("Din roll i företaget"))
         ]
         
         self.form_entries = {}
+        self.suggestion_lists = {}
+        self.suggestions = {}
+        self.placeholders = {field_name: placeholder for field_name, _label, placeholder in fields}
+        self.error_labels = {}
+        self.validation_timers = {}
         
-        for field_name, placeholder in fields:
+        for field_name, label, placeholder in fields:
             field_frame = tk.Frame(contact_frame, bg='white')
             field_frame.pack(fill=tk.X, pady=8)
             
-            tk.Label(field_frame, text=f"{field_name}:", font=self.normal_font,
+            tk.Label(field_frame, text=f"{label}:", font=self.normal_font,
                     bg='white', fg=self.colors['text_dark']).pack(anchor='w')
             
             entry = tk.Entry(field_frame, font=self.normal_font, bg=self.colors['bg_light'],
@@ -304,7 +353,82 @@ class AdvancedBookingModal:
             entry.bind('<FocusIn>', lambda e, entry=entry, ph=placeholder: self.on_entry_focus(entry, ph))
             entry.bind('<FocusOut>', lambda e, entry=entry, ph=placeholder: self.on_entry_unfocus(entry, ph))
             
+            # Live validation: debounced while typing, immediate when leaving the field
+            entry.bind('<KeyRelease>', lambda e, name=field_name: self.schedule_validation(name))
+            entry.bind('<FocusOut>', lambda e, name=field_name: self.validate_field(name), add='+')
+            self.error_labels[field_name] = tk.Label(field_frame, font=self.small_font, bg='white',
+                                                     fg=self.colors['accent'], anchor='w')
+            
             self.form_entries[field_name] = entry
+            if self.visitors and field_name in SEARCHABLE:
+                self.create_suggestion_list(field_frame, field_name, entry)
+
+    def create_suggestion_list(self, parent, field_name, entry):
+        """Autocomplete list under a field, shown while earlier visitors match what is typed"""
+        listbox = tk.Listbox(parent, font=self.small_font, bg='white', fg=self.colors['text_dark'],
+                             selectbackground=self.colors['primary'], relief=tk.SOLID, bd=1,
+                             activestyle='none')
+        self.suggestion_lists[field_name] = listbox
+        self.suggestions[field_name] = []
+        
+        entry.bind('<KeyRelease>', lambda e, name=field_name: self.suggest_visitors(name, e), add='+')
+        entry.bind('<Down>', lambda e, name=field_name: self.focus_suggestions(name))
+        entry.bind('<Escape>', lambda e, name=field_name: self.hide_suggestions(name))
+        entry.bind('<FocusOut>', lambda e, name=field_name: self.window.after(
+            200, self.hide_suggestions_unless_focused, name), add='+')
+        listbox.bind('<Return>', lambda e, name=field_name: self.choose_suggestion(name))
+        listbox.bind('<ButtonRelease-1>', lambda e, name=field_name: self.choose_suggestion(name))
+        listbox.bind('<Escape>', lambda e, name=field_name: [self.hide_suggestions(name), entry.focus()])
+
+    def suggest_visitors(self, field_name, event):
+        """Look up what has been typed so far (prefix index, well under a millisecond)"""
+        if event.keysym in ('Down', 'Up', 'Return', 'Escape', 'Tab'):
+            return
+        records = self.visitors.lookup(field_name, self.field_value(field_name))
+        self.suggestions[field_name] = records
+        listbox = self.suggestion_lists[field_name]
+        if not records:
+            self.hide_suggestions(field_name)
+            return
+        listbox.delete(0, tk.END)
+        for record in records:
+            listbox.insert(tk.END, describe_visitor(record))
+        listbox.configure(height=len(records))
+        if not listbox.winfo_ismapped():
+            listbox.pack(fill=tk.X, after=self.form_entries[field_name])
+
+    def focus_suggestions(self, field_name):
+        listbox = self.suggestion_lists[field_name]
+        if listbox.winfo_ismapped():
+            listbox.focus_set()
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(0)
+            listbox.activate(0)
+        return 'break'
+
+    def choose_suggestion(self, field_name):
+        """Fill in the whole form from the chosen visitor"""
+        listbox = self.suggestion_lists[field_name]
+        selection = listbox.curselection()
+        if not selection:
+            return
+        record = self.suggestions[field_name][selection[0]]
+        self.hide_suggestions(field_name)
+        for name, entry in self.form_entries.items():
+            if record.get(name):
+                entry.delete(0, tk.END)
+                entry.insert(0, record[name])
+                entry.configure(fg=self.colors['text_dark'])
+                self.validate_field(name)
+        self.form_entries[field_name].focus_set()
+
+    def hide_suggestions(self, field_name):
+        self.suggestion_lists[field_name].pack_forget()
+
+    def hide_suggestions_unless_focused(self, field_name):
+        listbox = self.suggestion_lists[field_name]
+        if listbox.winfo_exists() and self.window.focus_get() is not listbox:
+            listbox.pack_forget()
 
     def create_action_buttons(self):
         """Create action buttons with enhanced styling"""
@@ -312,7 +436,7 @@ class AdvancedBookingModal:
         button_frame.pack(fill=tk.X, padx=30)
         
         # Main booking button
-        self.book_button = tk.Button(button_frame, text="🚀 Bekräfta Min AI-Konsultation",
+        self.book_button = tk.Button(button_frame, **emoji_options(button_frame, _("🚀 Bekräfta Min AI-Konsultation")),
                                    font=font.Font(size=14, weight="bold"),
                                    bg=self.colors['secondary'], fg='white',
                                    relief=tk.FLAT, padx=30, pady=15,
@@ -323,39 +447,32 @@ class AdvancedBookingModal:
         button_row = tk.Frame(button_frame, bg='white')
         button_row.pack(fill=tk.X, pady=10)
         
-        tk.Button(button_row, text="📞 Ring Oss Istället", font=self.normal_font,
+        tk.Button(button_row, **emoji_options(button_row, _("📞 Ring Oss Istället")), font=self.normal_font,
                  bg=self.colors['bg_light'], fg=self.colors['text_dark'],
                  relief=tk.FLAT, padx=20, pady=8,
                  command=self.show_contact_info).pack(side=tk.LEFT, padx=(0,10))
         
-        tk.Button(button_row, text="❌ Avbryt", font=self.normal_font,
+        tk.Button(button_row, **emoji_options(button_row, _("❌ Avbryt")), font=self.normal_font,
                  bg=self.colors['bg_light'], fg=self.colors['text_dark'],
                  relief=tk.FLAT, padx=20, pady=8,
                  command=self.close_modal).pack(side=tk.RIGHT)
 
     def auto_populate_demo_data(self):
         """Automatically populate demo data for demonstration"""
-        demo_data = {
-            "Namn": "Anna Andersson",
-            "E-post": "anna.andersson@företag.se", 
-            "Telefon": "070-123 45 67",
-            "Företag": "Innovativa Lösningar AB",
-            "Befattning": "VD"
-        }
+        demo_data = DEMO_VISITOR
         
         # Populate after a delay for demo effect
         def populate():
-            time.sleep(2)
+            yield 2
             for field_name, value in demo_data.items():
                 if field_name in self.form_entries:
                     entry = self.form_entries[field_name]
                     entry.delete(0, tk.END)
                     entry.insert(0, value)
                     entry.configure(fg=self.colors['text_dark'])
-                    self.window.update()
-                    time.sleep(0.3)
+                    yield 0.3
         
-        threading.Thread(target=populate, daemon=True).start()
+        self.spawn(populate(), "populate")
 
     def animate_header_text(self):
         """Animate header text with color transitions"""
@@ -363,17 +480,32 @@ class AdvancedBookingModal:
             colors = ['#ffffff', '#ccddff', '#99bbff', '#ffffff']
             while True:
                 for color in colors:
-                    try:
-                        self.title_label.configure(fg=color)
-                        self.window.update()
-                        time.sleep(0.5)
-                    except:
-                        break
+                    self.title_label.configure(fg=color)
+                    yield 0.5
         
-        threading.Thread(target=animate, daemon=True).start()
+        self.spawn(animate(), "header-text")
+
+    def spawn(self, generator, name):
+        """Run a generator on the scheduler until the modal closes"""
+        self.tasks = [task for task in self.tasks if not task.done]
+        task = self.scheduler.spawn(generator, name)
+        if self.visibility and not self.visibility.visible:
+            self.scheduler.pause(task)
+        self.tasks.append(task)
+        return task
+
+    def on_visibility_change(self, visible):
+        """Low-power mode: freeze the modal's animations while it cannot be seen"""
+        for task in self.tasks:
+            if visible:
+                self.scheduler.resume(task)
+            else:
+                self.scheduler.pause(task)
 
     def animate_button_appear(self, widget):
         """Animate button appearance with scale effect"""
+        if not widget.winfo_exists():
+            return  # Modal was closed before the button's turn
         original_bg = widget.cget('bg')
         widget.configure(bg=self.colors['primary'])
         self.window.update()
@@ -391,17 +523,29 @@ class AdvancedBookingModal:
     def select_date(self, date):
         """Handle date selection with visual feedback"""
         self.selected_date = date
-        self.update_progress(25, f"Steg 2 av 4: Valt datum {date.strftime('%d %B')}")
-        print(f"📅 Valt datum: {date.strftime('%A, %d %B %Y')}")
+        self.update_progress(25, _("Steg 2 av 4: Valt datum {date}").format(date=format_date(date)))
+        self.complete_step(1, date.date().isoformat())
+        print(f"📅 Valt datum: {format_date(date, 'long', 'sv')}")
 
     def select_time(self, time, title):
         """Handle time selection with visual feedback"""
         self.selected_time = (time, title)
-        self.update_progress(50, f"Steg 3 av 4: Vald tid {time}")
+        self.update_progress(50, _("Steg 3 av 4: Vald tid {time}").format(time=time))
+        self.complete_step(2, time)
         print(f"⏰ Vald tid: {time} - {title}")
 
+    def select_service(self):
+        """Handle service selection"""
+        self.complete_step(3, self.service_var.get())
+
+    def complete_step(self, step, label):
+        """Funnel event for a finished booking step: 1 date, 2 time, 3 service, 4 contact details"""
+        emit("step_completed", session=self.session, scenario=self.scenario,
+             step=step, progress=self.progress, label=label)
+
     def update_progress(self, value, text):
         """Update progress bar and text"""
+        self.progress = value
         self.progress_var.set(value)
         self.progress_label.configure(text=text)
         self.window.update()
@@ -418,41 +562,140 @@ class AdvancedBookingModal:
             entry.insert(0, placeholder)
             entry.configure(fg=self.colors['text_light'])
 
+    def field_value(self, field_name):
+        """Entry text, with the placeholder counting as empty"""
+        value = self.form_entries[field_name].get()
+        return "" if value == self.placeholders[field_name] else value
+
+    def schedule_validation(self, field_name):
+        """Validate a field once typing pauses for DEBOUNCE_MS"""
+        timer = self.validation_timers.get(field_name)
+        if timer:
+            self.window.after_cancel(timer)
+        self.validation_timers[field_name] = self.window.after(
+            DEBOUNCE_MS, lambda: self.validate_field(field_name))
+
+    def validate_field(self, field_name):
+        """Show the field's error inline and return it (None when valid)"""
+        self.validation_timers.pop(field_name, None)
+        value = self.field_value(field_name)
+        error = FIELD_VALIDATORS[field_name](value)
+        
+        if not error and field_name == "E-post":
+            # Domain lookups run off-thread; a cached verdict applies at once
+            checker = get_domain_checker()
+            domain = email_domain(value)
+            if checker and domain:
+                future = checker.check(domain)
+                if future.done():
+                    error = self.domain_error(domain, future.result())
+                else:
+                    self.window.after(50, self.poll_domain_check, field_name, value, domain, future)
+        
+        self.show_field_error(field_name, error)
+        return error
+
+    def poll_domain_check(self, field_name, value, domain, future):
+        if not self.window.winfo_exists() or self.field_value(field_name) != value:
+            return  # Closed, or the visitor kept typing
+        if not future.done():
+            self.window.after(50, self.poll_domain_check, field_name, value, domain, future)
+            return
+        self.show_field_error(field_name, self.domain_error(domain, future.result()))
+
+    def domain_error(self, domain, accepts_mail):
+        # Unknown (resolver offline) is not held against the visitor
+        if accepts_mail is False:
+            return _("Domänen {domain} tar inte emot e-post").format(domain=domain.encode('ascii').decode('idna'))
+        return None
+
+    def show_field_error(self, field_name, error):
+        label = self.error_labels[field_name]
+        entry = self.form_entries[field_name]
+        if error:
+            label.configure(text=f"⚠️ {error}")
+            if not label.winfo_ismapped():
+                label.pack(anchor='w', after=entry)
+            entry.configure(bg='#fff3ee')
+        else:
+            label.pack_forget()
+            entry.configure(bg=self.colors['bg_light'])
+
     def show_contact_info(self):
         """Show contact information popup"""
-        messagebox.showinfo("Kontakta Oss", 
-                          "📞 Telefon: 08-123 456 78\n"
-                          "📧 E-post: info@axiestudio.se\n"
-                          "🌐 Webb: www.axiestudio.se\n\n"
-                          "Vi svarar inom 2 timmar!")
+        messagebox.showinfo(_("Kontakta Oss"), 
+                          _("📞 Telefon: 08-123 456 78\n"
+                            "📧 E-post: info@axiestudio.se\n"
+                            "🌐 Webb: www.axiestudio.se\n\n"
+                            "Vi svarar inom 2 timmar!"))
 
     def confirm_booking(self):
         """Enhanced booking confirmation with validation"""
-        # Validate required fields
-        required_fields = ["Namn", "E-post", "Företag"]
-        for field in required_fields:
-            entry = self.form_entries[field]
-            if not entry.get() or entry.get() in ["Ditt fullständiga namn", "Din e-postadress för kalenderinbjudan", "Ditt företags namn"]:
-                messagebox.showerror("Ofullständig Information", 
-                                   f"Vänligen fyll i {field.lower()}")
-                entry.focus()
-                return
+        # Validate every field inline; focus the first one that needs attention
+        invalid = [field for field in self.form_entries if self.validate_field(field)]
+        if invalid:
+            self.form_entries[invalid[0]].focus()
+            self.progress_label.configure(text=_("⚠️ Kontrollera de markerade fälten"))
+            return
+        self.complete_step(4, "contact")
         
         if not self.selected_date or not self.selected_time:
-            messagebox.showerror("Ofullständig Bokning", 
-                               "Vänligen välj både datum och tid")
+            self.progress_label.configure(text=_("⚠️ Välj både datum och tid"))
             return
         
         # Update progress
-        self.update_progress(100, "Bokning bekräftad! 🎉")
+        self.confirmed = True
+        emit("booking_confirmed", session=self.session, scenario=self.scenario,
+             date=self.selected_date.isoformat(), time=self.selected_time[0],
+             service=self.service_var.get() or None)
+        if self.recorder:
+            self.recorder.event("booking_confirmed")
+        self.schedule_call_reminder()
+        self.remember_visitor()
+        self.update_progress(100, _("Bokning bekräftad! 🎉"))
         
         # Show success animation
         self.show_success_animation()
 
+    def schedule_call_reminder(self):
+        """Keep the promise of the success screen: a call reminder before the meeting"""
+        reminders = get_reminders()
+        if not reminders or self.demo_filled():
+            return  # Nobody to call back for the auto-filled demo visitor
+        start = datetime.combine(self.selected_date.date(),
+                                 datetime.strptime(self.selected_time[0], "%H:%M").time())
+        if start <= datetime.now():
+            return
+        try:
+            reminders.add(start.timestamp() - LEAD_SECONDS, {
+                "session": self.session,
+                "meeting": start.isoformat(),
+                "service": self.service_var.get() or None,
+                "name": self.field_value("Namn"),
+                "email": self.field_value("E-post"),
+                "phone": self.field_value("Telefon"),
+                "company": self.field_value("Företag"),
+            })
+        except OSError as e:
+            # The visitor has already confirmed; a missing reminder must not look like a failed booking
+            print(f"⚠️ Påminnelsen kunde inte sparas: {e}")
+
+    def demo_filled(self):
+        """True while the form still holds the auto-filled demo visitor"""
+        return {name: self.field_value(name) for name in self.form_entries} == DEMO_VISITOR
+
+    def remember_visitor(self):
+        """Offer this visitor's details the next time they book"""
+        if self.visitors and not self.demo_filled():
+            try:
+                self.visitors.add({name: self.field_value(name) for name in self.form_entries})
+            except OSError as e:
+                print(f"⚠️ Besöksregistret kunde inte uppdateras: {e}")
+
     def show_success_animation(self):
         """Show animated success confirmation"""
         success_window = tk.Toplevel(self.window)
-        success_window.title("Bokning Bekräftad!")
+        success_window.title(_("Bokning Bekräftad!"))
         success_window.geometry("500x400")
         success_window.configure(bg='#00cc66')
         success_window.attributes('-alpha', 0.0)
@@ -461,51 +704,57 @@ class AdvancedBookingModal:
         success_window.transient(self.window)
         success_window.grab_set()
         
-        # Success content
-        tk.Label(success_window, text="🎉", font=font.Font(size=48),
-                bg='#00cc66', fg='white').pack(pady=30)
+        # Success content on a canvas, so the confetti falls over the text
+        canvas = tk.Canvas(success_window, bg='#00cc66', highlightthickness=0, width=500, height=400)
+        canvas.pack(fill=tk.BOTH, expand=True)
+        canvas.create_window(250, 20, anchor='n',
+                             window=tk.Label(canvas, **emoji_options(success_window, "🎉", "large"),
+                                             font=font.Font(size=48), bg='#00cc66', fg='white'))
         
-        tk.Label(success_window, text="Fantastiskt!", 
-                font=font.Font(size=20, weight="bold"),
-                bg='#00cc66', fg='white').pack()
+        canvas.create_text(250, 125, text=_("Fantastiskt!"), 
+                           font=font.Font(size=20, weight="bold"), fill='white')
         
         name = self.form_entries["Namn"].get()
-        tk.Label(success_window, text=f"Tack {name}!", 
-                font=font.Font(size=16),
-                bg='#00cc66', fg='white').pack(pady=10)
+        canvas.create_text(250, 165, text=_("Tack {name}!").format(name=name), 
+                           font=font.Font(size=16), fill='white')
         
-        date_str = self.selected_date.strftime('%A, %d %B')
+        date_str = format_date(self.selected_date, "weekday_day_month")
         time_str = self.selected_time[0]
         
-        tk.Label(success_window, 
-                text=f"Din AI-konsultation är bokad:\n{date_str} kl {time_str}",
-                font=font.Font(size=12), bg='#00cc66', fg='white',
-                justify=tk.CENTER).pack(pady=20)
-        
-        tk.Label(success_window, 
-                text="📧 Kalenderinbjudan skickas inom 5 minuter\n"
-                     "📞 Vi ringer 5 minuter före mötet\n"
-                     "🚀 Förbered dig på en fantastisk AI-resa!",
-                font=font.Font(size=10), bg='#00cc66', fg='white',
-                justify=tk.CENTER).pack(pady=20)
-        
-        tk.Button(success_window, text="Perfekt! Stäng", 
-                 font=font.Font(size=12, weight="bold"),
-                 bg='white', fg='#00cc66', padx=30, pady=10,
-                 command=lambda: [success_window.destroy(), self.close_modal()]).pack(pady=30)
-        
-        # Animate success window appearance
-        def animate_success():
-            alpha = 0.0
-            while alpha < 1.0:
-                alpha += 0.1
-                try:
-                    success_window.attributes('-alpha', alpha)
-                    time.sleep(0.05)
-                except:
-                    break
+        canvas.create_text(250, 215, 
+                           text=_("Din AI-konsultation är bokad:\n{date} kl {time}").format(date=date_str, time=time_str),
+                           font=font.Font(size=12), fill='white', justify=tk.CENTER)
+        
+        canvas.create_text(250, 280, 
+                           text=_("📧 Kalenderinbjudan skickas inom 5 minuter\n"
+                                  "📞 Vi ringer 5 minuter före mötet\n"
+                                  "🚀 Förbered dig på en fantastisk AI-resa!"),
+                           font=font.Font(size=10), fill='white', justify=tk.CENTER)
+        
+        canvas.create_window(250, 380, anchor='s',
+                             window=tk.Button(canvas, text=_("Perfekt! Stäng"), 
+                                              font=font.Font(size=12, weight="bold"),
+                                              bg='white', fg='#00cc66', padx=30, pady=10,
+                                              command=lambda: [success_window.destroy(), self.close_modal()]))
+        
+        # Confetti like js/ending-animation.js: two cannons from the bottom corners, then a shower from the top
+        confetti = ParticleSystem(canvas)
+        confetti.burst(0.4, rate=600, x=0, y=400, direction=-math.pi / 3, spread=math.pi / 6, speed=(500, 800))
+        confetti.burst(0.4, rate=600, x=500, y=400, direction=-2 * math.pi / 3, spread=math.pi / 6, speed=(500, 800))
+        confetti.burst(1.5, rate=300, x=0, y=-10, width=500, direction=math.pi / 2, spread=math.pi / 4,
+                       speed=(50, 150))
+        
+        # Fade the window in on the Tk event loop
+        def animate_success(alpha=0.0):
+            alpha = min(1.0, alpha + 0.1)
+            try:
+                success_window.attributes('-alpha', alpha)
+            except tk.TclError:
+                return
+            if alpha < 1.0:
+                success_window.after(FRAME_MS * 3, animate_success, alpha)
         
-        threading.Thread(target=animate_success, daemon=True).start()
+        animate_success()
 
     def start_entrance_animation(self):
         """Animate modal entrance"""
@@ -539,18 +788,42 @@ class AdvancedBookingModal:
         
         threading.Thread(target=animate_exit, daemon=True).start()
 
+    def on_destroy(self, event):
+        if event.widget is self.window:
+            for task in self.tasks:
+                self.scheduler.cancel(task)
+        # Closed (or replaced by the next demo cycle) without a confirmed booking
+        if event.widget is self.window and not self.confirmed:
+            self.confirmed = True
+            emit("booking_abandoned", session=self.session, scenario=self.scenario,
+                 step=self.progress // 25 + 1, progress=self.progress)
+            if self.recorder:
+                self.recorder.event("booking_abandoned", step=self.progress // 25 + 1)
+
     def on_frame_configure(self, event=None):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self.scroll_keeper.request()
 
     def on_canvas_configure(self, event):
         self.canvas.itemconfig(self.canvas_window, width=event.width)
+        self.scroll_keeper.request()
 
-class SuperAutomatedChatbot:
+class SuperAutomatedChatbot(DemoView):
     """Super automated chatbot with advanced Python features and minimal CSS/JS"""
     
-    def __init__(self, root):
+    def __init__(self, root, assets=None, scheduler=None, start_offset=0, start_delay=0.0,
+                 autostart=True, intent_index=None):
         self.root = root
-        self.root.title("🤖 Axie Studio AI-Assistent - Automatisk Demo")
+        self.root.title(_("🤖 Axie Studio AI-Assistent - Automatisk Demo"))
+        
+        # Fonts, images and scenarios can be shared between windows (kiosk wall)
+        self.assets = assets or SharedAssets(root, intent_index_path=intent_index)
+        self.scheduler = scheduler or DemoScheduler(root)
+        self.start_offset = start_offset
+        self.start_delay = start_delay
+        self.tasks = []
+        self.hidden = False  # Low-power mode (see on_visibility_change)
+        self.suspended_tasks = []
+        self.next_chat_content = None  # Pane for the next conversation, built off-screen (see prepare_chat)
         
         # Enhanced window configuration
         self.root.configure(bg='#f0f2f5')
@@ -563,10 +836,10 @@ class SuperAutomatedChatbot:
         self.root.geometry(f'{window_width}x{window_height}+{x}+{y}')
         
         # Advanced fonts
-        self.title_font = font.Font(family="Helvetica", size=16, weight="bold")
-        self.header_font = font.Font(family="Helvetica", size=12, weight="bold")
-        self.message_font = font.Font(family="Helvetica", size=11)
-        self.small_font = font.Font(family="Helvetica", size=9)
+        self.title_font = self.assets.title_font
+        self.header_font = self.assets.header_font
+        self.message_font = self.assets.message_font
+        self.small_font = self.assets.small_font
         
         # Enhanced color scheme
         self.colors = {
@@ -588,62 +861,40 @@ class SuperAutomatedChatbot:
         self.message_index = 0
         self.is_demo_running = False
         self.conversations = self.setup_multiple_conversations()
+        self.intent_matcher = self.assets.intent_matcher
         
         # UI Setup
         self.setup_advanced_ui()
         self.setup_auto_features()
+        self.root.bind('<Destroy>', self.on_destroy, add='+')
         
-        # Start super automation
-        self.start_super_automation()
+        # Start super automation (pre-warmed windows start when shown)
+        self.automation_task = None
+        if autostart:
+            self.start_super_automation()
 
     def setup_multiple_conversations(self):
         """Setup multiple conversation scenarios for variety"""
-        return [
-            # Conversation 1: Enthusiastic startup
-            [
-                ("bot", "🤖 Hej! Välkommen till Axie Studio - Sveriges ledande AI-byrå!"),
-                ("bot", "Vi hjälper företag att öka produktiviteten med 300% genom intelligenta AI-lösningar! 🚀"),
-                ("user", "Hej! Det låter fantastiskt. Vi är ett startup som behöver automatisera vår kundservice."),
-                ("bot", "Perfekt! Startups är våra favoriter! 💡 Vi kan implementera en AI-chatbot som hanterar 80% av era kundförfrågningar automatiskt."),
-                ("bot", "En av våra startup-kunder minskade sina supportkostnader med 70% på bara 3 veckor! 📊"),
-                ("user", "Wow! Hur snabbt kan ni implementera något liknande för oss?"),
-                ("bot", "För startups har vi en speciallösning som kan vara igång på 5 arbetsdagar! ⚡"),
-                ("bot", "Vill du boka en kostnadsfri 30-minuters demo där jag visar exakt hur det fungerar?"),
-                ("user", "Ja, absolut! Det låter som precis vad vi behöver."),
-                ("bot", "Fantastiskt! Jag öppnar vårt bokningssystem så du kan välja en tid som passar. Detta kommer att förändra ert företag! 🎯"),
-                ("system", "OPEN_BOOKING_MODAL")
-            ],
-            
-            # Conversation 2: Established company
-            [
-                ("bot", "🤖 Välkommen till Axie Studio! Vi revolutionerar företag med AI-teknik."),
-                ("bot", "Sedan 2020 har vi hjälpt över 200 företag att automatisera sina processer och öka effektiviteten dramatiskt! 📈"),
-                ("user", "Hej! Vi är ett etablerat företag med 50 anställda. Kan AI verkligen hjälpa oss?"),
-                ("bot", "Absolut! Etablerade företag ser ofta de största fördelarna! 🏢 Ni har redan processer som kan optimeras."),
-                ("bot", "Ett liknande företag sparade 25 timmar per vecka genom att automatisera sin orderhantering med vår AI-lösning."),
-                ("user", "Det låter intressant. Vilka andra områden kan ni hjälpa med?"),
-                ("bot", "Vi specialiserar oss på: 📋\n• Intelligent dokumenthantering\n• Automatisk dataanalys\n• Prediktiv underhåll\n• Smart personalplanering"),
-                ("bot", "Vad säger du om en djupgående konsultation där vi analyserar era specifika behov?"),
-                ("user", "Ja, det vore värdefullt. När kan vi träffas?"),
-                ("bot", "Perfekt! Låt mig öppna vårt bokningssystem så du kan välja en tid som passar era scheman. 🗓️"),
-                ("system", "OPEN_BOOKING_MODAL")
-            ],
-            
-            # Conversation 3: Skeptical customer
-            [
-                ("bot", "🤖 Hej och välkommen till Axie Studio! Vi gör AI tillgängligt för alla företag."),
-                ("bot", "Oavsett bransch eller storlek kan vi hjälpa er att dra nytta av AI:s kraft! 💪"),
-                ("user", "Hej. Jag är lite skeptisk till AI. Är det verkligen värt investeringen?"),
-                ("bot", "Jag förstår din skepsis helt! 🤔 Många av våra mest nöjda kunder var skeptiska från början."),
-                ("bot", "Därför erbjuder vi alltid en kostnadsfri analys först. Inga löften - bara konkreta siffror på vad AI kan göra för ert företag."),
-                ("user", "Okej, det låter rimligt. Men hur vet jag att ni kan leverera?"),
-                ("bot", "Bra fråga! Vi har en 100% nöjd-kund-garanti. 🛡️ Om ni inte ser resultat inom 30 dagar får ni pengarna tillbaka."),
-                ("bot", "Plus att vi kan visa er exakt ROI innan ni investerar en krona. Vill du se hur?"),
-                ("user", "Ja, det skulle övertyga mig. Hur gör vi det?"),
-                ("bot", "Perfekt! Jag bokar in en ROI-analys där vi räknar på era specifika siffror. Helt kostnadsfritt! 📊"),
-                ("system", "OPEN_BOOKING_MODAL")
-            ]
-        ]
+        return self.assets.conversations
+
+    def spawn(self, generator, name, delay=0.0):
+        """Run a generator on the shared scheduler and stop it with this window"""
+        self.tasks = [task for task in self.tasks if not task.done]
+        task = self.scheduler.spawn(generator, name, delay)
+        if self.hidden:
+            self.scheduler.pause(task)
+            self.suspended_tasks.append(task)
+        self.tasks.append(task)
+        return task
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            for task in self.tasks:
+                self.scheduler.cancel(task)
+            if self.recorder:
+                self.recorder.close()
+            if self.replay_reader:
+                self.replay_reader.close()
 
     def setup_advanced_ui(self):
         """Setup advanced UI with enhanced styling"""
@@ -670,21 +921,14 @@ class SuperAutomatedChatbot:
         header_content = tk.Frame(header, bg=self.colors['primary'])
         header_content.pack(expand=True, fill=tk.BOTH, padx=20)
         
-        # Company logo (animated)
-        try:
-            logo_url = "https://www.axiestudio.se/logo.jpg"
-            logo_response = requests.get(logo_url, timeout=3)
-            logo_image = Image.open(BytesIO(logo_response.content))
-            logo_image = logo_image.resize((60, 60), Image.Resampling.LANCZOS)
-            
-            # Add glow effect
-            glow = logo_image.filter(ImageFilter.GaussianBlur(radius=2))
-            self.logo_photo = ImageTk.PhotoImage(logo_image)
-            
+        # Company logo (animated), fetched once per process
+        self.logo_photo = self.assets.logo_photo(60)
+        if self.logo_photo:
             self.logo_label = tk.Label(header_content, image=self.logo_photo, bg=self.colors['primary'])
             self.logo_label.pack(side=tk.LEFT, pady=15)
-        except:
-            self.logo_label = tk.Label(header_content, text="🤖", font=font.Font(size=32), 
+        else:
+            self.logo_label = tk.Label(header_content, **self.assets.emoji.options("🤖", "logo"),
+                                     font=self.assets.logo_font,
                                      bg=self.colors['primary'], fg='white')
             self.logo_label.pack(side=tk.LEFT, pady=15)
         
@@ -692,11 +936,11 @@ class SuperAutomatedChatbot:
         text_frame = tk.Frame(header_content, bg=self.colors['primary'])
         text_frame.pack(side=tk.LEFT, padx=15, pady=15)
         
-        self.company_label = tk.Label(text_frame, text="Axie Studio AI-Assistent", 
+        self.company_label = tk.Label(text_frame, text=_("Axie Studio AI-Assistent"), 
                                     font=self.title_font, bg=self.colors['primary'], fg='white')
         self.company_label.pack(anchor='w')
         
-        self.status_label = tk.Label(text_frame, text="🟢 Automatisk Demo Aktiv", 
+        self.status_label = tk.Label(text_frame, text=_("🟢 Automatisk Demo Aktiv"), 
                                    font=self.small_font, bg=self.colors['primary'], fg='#ccddff')
         self.status_label.pack(anchor='w')
         
@@ -713,7 +957,7 @@ class SuperAutomatedChatbot:
                                    highlightthickness=0, bd=0)
         self.chat_scrollbar = ttk.Scrollbar(chat_frame, orient=tk.VERTICAL, 
                                           command=self.chat_canvas.yview)
-        self.chat_content = tk.Frame(self.chat_canvas, bg=self.colors['bg_chat'])
+        self.chat_content = self.create_chat_pane()
         
         self.chat_canvas.configure(yscrollcommand=self.chat_scrollbar.set)
         
@@ -722,12 +966,19 @@ class SuperAutomatedChatbot:
         
         self.chat_window = self.chat_canvas.create_window((0, 0), window=self.chat_content, anchor="nw")
         
+        # Scroll region follows the content at most once per frame
+        self.scroll_keeper = ScrollRegionKeeper(self.chat_canvas, self.chat_content)
+        self.smooth_scroller = SmoothScroller(self.chat_canvas, self.scroll_keeper)
+        
         # Bind events
-        self.chat_content.bind('<Configure>', self.on_chat_configure)
         self.chat_canvas.bind('<Configure>', self.on_canvas_configure)
-        
-        # Welcome message
-        self.add_welcome_message()
+
+    def create_chat_pane(self):
+        """Content frame with the welcome message; stays off-screen until it is the canvas window"""
+        pane = tk.Frame(self.chat_canvas, bg=self.colors['bg_chat'])
+        pane.bind('<Configure>', self.on_chat_configure)
+        self.add_welcome_message(pane)
+        return pane
 
     def create_enhanced_input_area(self):
         """Create enhanced input area with typing simulation"""
@@ -747,10 +998,16 @@ class SuperAutomatedChatbot:
         self.input_field.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Send button with animation
-        self.send_button = tk.Button(input_container, text="🚀", font=font.Font(size=16),
+        self.send_button = tk.Button(input_container, **self.assets.emoji.options("🚀", "avatar"),
+                                   font=self.assets.avatar_font,
                                    bg=self.colors['primary'], fg='white', relief=tk.FLAT,
                                    bd=0, padx=15, command=self.simulate_send)
         self.send_button.pack(side=tk.RIGHT, pady=5, padx=5)
+        
+        # Visitor input switches the kiosk into live mode
+        self.input_field.bind('<FocusIn>', lambda e: self.enable_live_mode())
+        self.input_field.bind('<Return>', lambda e: self.simulate_send())
+        self.input_field.bind('<Escape>', lambda e: self.disable_live_mode())
 
     def create_status_controls(self):
         """Create status and control panel"""
@@ -759,15 +1016,15 @@ class SuperAutomatedChatbot:
         control_frame.pack_propagate(False)
         
         # Demo controls
-        tk.Label(control_frame, text="Demo Status:", font=self.small_font,
+        tk.Label(control_frame, text=_("Demo Status:"), font=self.small_font,
                 bg=self.colors['bg_main'], fg=self.colors['text_secondary']).pack(side=tk.LEFT, padx=5)
         
-        self.demo_status = tk.Label(control_frame, text="Kör automatiskt", font=self.small_font,
+        self.demo_status = tk.Label(control_frame, text=_("Kör automatiskt"), font=self.small_font,
                                   bg=self.colors['secondary'], fg='white', padx=10, pady=2)
         self.demo_status.pack(side=tk.LEFT, padx=5)
         
         # Conversation counter
-        self.conv_counter = tk.Label(control_frame, text="Konversation 1/3", font=self.small_font,
+        self.conv_counter = tk.Label(control_frame, text=_("Konversation {current}/{total}").format(current=1, total=len(self.conversations)), font=self.small_font,
                                    bg=self.colors['bg_main'], fg=self.colors['text_secondary'])
         self.conv_counter.pack(side=tk.RIGHT, padx=5)
 
@@ -777,21 +1034,60 @@ class SuperAutomatedChatbot:
         self.auto_scroll_enabled = True
         
         # Message timing
-        self.typing_speed = 0.05  # Seconds per character
-        self.message_delay = 2.0  # Seconds between messages
-        self.conversation_delay = 5.0  # Seconds between conversations
+        self.typing_speed = TYPING_SPEED  # Seconds per character
+        self.message_delay = MESSAGE_DELAY  # Seconds between messages
+        self.conversation_delay = CONVERSATION_DELAY  # Seconds between conversations
         
         # Visual effects
         self.enable_message_animations = True
+        self.layout_cache = self.assets.layout_cache
+        self.bubble_insets = None
         self.enable_typing_indicators = True
+        
+        # Live visitor input pauses the scripted demo
+        self.live_mode = False
+        
+        # Funnel session of the scenario (or live visitor) on screen
+        self.session = None
+        
+        # Optional external reply generator (see set_responder)
+        self.responder = None
+        self.history = []
+        self.last_stream_stats = None
+        
+        # Called with the scenario index whenever a new conversation starts
+        self.conversation_listeners = []
+        
+        # Transcript of everything shown (AXIE_TRANSCRIPT_DIR), and replay state
+        self.recorder = open_recorder()
+        self.replay_reader = None
+        self.replay_task = None
+        self.replay_speed = 1.0
+        
+        # Booth staff control (demo_control.py): pause, skip, jump, booking, pacing
+        self.booking_modal = None
+        self.demo_paused = False
+        self.paused_tasks = []
+        self.skip_pending = False  # Sleeps are skipped until the next message is shown
+        self.typing_skips = 0
+        self.control = install_control(self)
+        
+        # Low-power mode: the script and animations stop while the window cannot be seen
+        self.visibility = track_visibility(self.root, self.on_visibility_change)
+        
+        # Rebuild pending call reminders now, not at the first booking after a restart
+        get_reminders()
+        
+        # Map the visitor directory index for booking-form autocomplete
+        get_visitors()
 
-    def add_welcome_message(self):
+    def add_welcome_message(self, pane):
         """Add animated welcome message"""
-        welcome_frame = tk.Frame(self.chat_content, bg=self.colors['bg_chat'])
+        welcome_frame = tk.Frame(pane, bg=self.colors['bg_chat'])
         welcome_frame.pack(fill=tk.X, pady=20)
         
         welcome_text = tk.Label(welcome_frame, 
-                              text="🎯 Automatisk AI-Demo Startar\n\nDu kommer att se olika kundscenarier som visar hur vår AI-assistent hanterar olika typer av förfrågningar.",
+                              text=_("🎯 Automatisk AI-Demo Startar\n\nDu kommer att se olika kundscenarier som visar hur vår AI-assistent hanterar olika typer av förfrågningar."),
                               font=self.message_font, bg=self.colors['bg_chat'], 
                               fg=self.colors['text_secondary'], justify=tk.CENTER,
                               wraplength=400)
@@ -808,15 +1104,93 @@ class SuperAutomatedChatbot:
                         self.logo_label.configure(bg=color)
                         self.company_label.configure(bg=color)
                         self.status_label.configure(bg=color)
-                        self.root.update()
-                        time.sleep(1.0)
-                    except:
-                        break
+                    except tk.TclError:
+                        return
+                    yield 1.0
         
-        threading.Thread(target=animate, daemon=True).start()
+        self.spawn(animate(), "header")
 
     def add_message_with_animation(self, text, is_bot, animate_typing=True):
         """Add message with advanced animations"""
+        # Final line breaks and bubble size are known before the first word appears
+        layout = self.layout_cache.layout(self.message_font, text, BUBBLE_WRAPLENGTH)
+        msg_container, message_label = self.create_message_bubble(is_bot, layout)
+        self.skip_pending = False
+        
+        self.history.append(("bot" if is_bot else "user", text))
+        self.log_message_shown(is_bot, text)
+        
+        # Animate text appearance
+        if animate_typing:
+            self.animate_text_typing(message_label, text, layout)
+        else:
+            message_label.configure(text=layout.text)
+        
+        self.add_message_timestamp(msg_container, is_bot)
+        
+        # Auto-scroll (the scroller follows the bottom as the region catches up)
+        if self.auto_scroll_enabled:
+            self.scroll_to_bottom()
+
+    def add_message_stream(self, chunks, is_bot=True, on_done=None):
+        """Add a message whose text arrives as a (sync or async) iterator of chunks"""
+        msg_container, message_label = self.create_message_bubble(is_bot)
+        pump = ChunkPump(chunks).start()
+        stats = pump.stats
+        state = {"version": 0, "height": 0}
+        
+        def repaint():
+            # At most one label update per frame, however many chunks arrived;
+            # done is read first so a snapshot taken after it holds every chunk
+            done = pump.done
+            version, text = pump.snapshot()
+            if version != state["version"]:
+                state["version"] = version
+                message_label.configure(text=text)
+                stats.repaints += 1
+                if stats.first_visible is None:
+                    stats.first_visible = time.monotonic()
+                
+                # Only scroll when the bubble actually grew a line
+                height = message_label.winfo_reqheight()
+                if height != state["height"]:
+                    state["height"] = height
+                    if self.auto_scroll_enabled:
+                        self.scroll_to_bottom()
+            
+            if done:
+                stats.finished = time.monotonic()
+                self.history.append(("bot" if is_bot else "user", text))
+                self.log_message_shown(is_bot, text)
+                self.add_message_timestamp(msg_container, is_bot)
+                self.last_stream_stats = stats
+                if on_done:
+                    on_done(stats)
+            else:
+                self.root.after(FRAME_MS, repaint)
+        
+        self.root.after(0, repaint)
+        return stats
+
+    def log_message_shown(self, is_bot, text):
+        if self.replay_reader:
+            return
+        if self.recorder:
+            self.recorder.message("bot" if is_bot else "user", text)
+        emit("message_shown", session=self.session, scenario=self.current_conversation,
+             sender="bot" if is_bot else "user", chars=len(text), live=self.live_mode)
+
+    def open_booking_modal(self):
+        """Open the booking modal as the next step of the current funnel session"""
+        if self.recorder:
+            self.recorder.event("modal_opened")
+        self.booking_modal = AdvancedBookingModal(self.root, session=self.session,
+                                                  scenario=self.current_conversation, live=self.live_mode,
+                                                  recorder=self.recorder, scheduler=self.scheduler)
+        return self.booking_modal
+
+    def create_message_bubble(self, is_bot, layout=None):
+        """Create an empty message bubble and return (container, text label)"""
         # Create message container
         msg_container = tk.Frame(self.chat_content, bg=self.colors['bg_chat'])
         msg_container.pack(fill=tk.X, padx=15, pady=8)
@@ -827,7 +1201,8 @@ class SuperAutomatedChatbot:
             bubble_frame.pack(anchor='w')
             
             # Bot avatar
-            avatar = tk.Label(bubble_frame, text="🤖", font=font.Font(size=16),
+            avatar = tk.Label(bubble_frame, **self.assets.emoji.options("🤖", "avatar"),
+                            font=self.assets.avatar_font,
                             bg=self.colors['bg_chat'])
             avatar.pack(side=tk.LEFT, padx=(0,10))
             
@@ -838,7 +1213,7 @@ class SuperAutomatedChatbot:
             
             message_label = tk.Label(content_frame, text="", font=self.message_font,
                                    bg=self.colors['bot_bg'], fg=self.colors['bot_text'],
-                                   wraplength=350, justify=tk.LEFT, padx=15, pady=10)
+                                   wraplength=BUBBLE_WRAPLENGTH, justify=tk.LEFT, padx=15, pady=10)
             message_label.pack()
             
         else:
@@ -852,133 +1227,397 @@ class SuperAutomatedChatbot:
             
             message_label = tk.Label(content_frame, text="", font=self.message_font,
                                    bg=self.colors['user_bg'], fg=self.colors['user_text'],
-                                   wraplength=350, justify=tk.LEFT, padx=15, pady=10)
+                                   wraplength=BUBBLE_WRAPLENGTH, justify=tk.LEFT, padx=15, pady=10)
             message_label.pack()
             
             # User avatar
-            avatar = tk.Label(bubble_frame, text="👤", font=font.Font(size=16),
+            avatar = tk.Label(bubble_frame, **self.assets.emoji.options("👤", "avatar"),
+                            font=self.assets.avatar_font,
                             bg=self.colors['bg_chat'])
             avatar.pack(side=tk.RIGHT, padx=(10,0))
         
-        # Animate text appearance
-        if animate_typing:
-            self.animate_text_typing(message_label, text)
-        else:
-            message_label.configure(text=text)
+        if layout:
+            self.reserve_bubble_size(message_label, layout)
+            self.scroll_keeper.expect(layout.height + self.bubble_insets[1] + 16)
         
-        # Add timestamp
+        return msg_container, message_label
+
+    def reserve_bubble_size(self, message_label, layout):
+        """Fix the bubble at its final size so revealing text never triggers relayout"""
+        if self.bubble_insets is None:
+            border = int(message_label.cget('borderwidth')) + int(message_label.cget('highlightthickness'))
+            self.bubble_insets = (2 * (int(message_label.cget('padx')) + border),
+                                  2 * (int(message_label.cget('pady')) + border))
+        
+        content_frame = message_label.master
+        content_frame.configure(width=layout.width + self.bubble_insets[0],
+                                height=layout.height + self.bubble_insets[1])
+        content_frame.pack_propagate(False)
+        
+        # Breaks are already in the text, so Tk must not re-wrap it
+        message_label.configure(wraplength=0)
+        message_label.pack_configure(anchor='nw')
+
+    def add_message_timestamp(self, msg_container, is_bot):
+        """Add the time label under a finished message"""
         timestamp = tk.Label(msg_container, text=datetime.now().strftime("%H:%M"),
-                           font=font.Font(size=8), bg=self.colors['bg_chat'],
+                           font=self.assets.timestamp_font, bg=self.colors['bg_chat'],
                            fg=self.colors['text_secondary'])
         timestamp.pack(anchor='e' if is_bot else 'w', padx=15)
-        
-        # Auto-scroll
-        if self.auto_scroll_enabled:
-            self.root.after(100, self.scroll_to_bottom)
 
-    def animate_text_typing(self, label, text):
+    def animate_text_typing(self, label, text, layout=None):
         """Animate text typing with realistic speed"""
+        if layout is None:
+            layout = self.layout_cache.layout(self.message_font, text, BUBBLE_WRAPLENGTH)
+        
         def type_text():
-            words = text.split(' ')
-            current_text = ""
-            
-            for word in words:
-                current_text += word + " "
-                label.configure(text=current_text.strip())
-                self.root.update()
+            skips = self.typing_skips
+            for word, visible_text in layout.reveal_steps():
+                try:
+                    # A skip finishes the message at once
+                    label.configure(text=layout.text if self.typing_skips != skips else visible_text)
+                except tk.TclError:
+                    return  # Bubble was cleared mid-typing
+                if self.typing_skips != skips:
+                    return
                 
                 # Variable typing speed based on word length
-                delay = len(word) * self.typing_speed + random.uniform(0.1, 0.3)
-                time.sleep(delay)
+                yield word_delay(word, self.typing_speed)
         
-        threading.Thread(target=type_text, daemon=True).start()
+        self.spawn(type_text(), "typing")
 
     def simulate_user_typing(self, text):
-        """Simulate realistic user typing"""
+        """Simulate realistic user typing (generator, yields seconds to wait)"""
         self.message_var.set("")
         
-        # Show typing in input field
-        for i, char in enumerate(text):
+        # Show typing in input field, with realistic typing delays
+        for i, delay in enumerate(keystroke_delays(text)):
             self.message_var.set(text[:i+1])
-            self.root.update()
-            
-            # Realistic typing delays
-            if char == ' ':
-                time.sleep(0.2)
-            elif char in '.,!?':
-                time.sleep(0.3)
-            else:
-                time.sleep(random.uniform(0.05, 0.15))
+            yield delay
         
         # Simulate send button press
-        self.animate_send_button()
-        time.sleep(0.5)
+        yield from self.animate_send_button()
+        yield 0.5
         self.message_var.set("")
 
     def animate_send_button(self):
-        """Animate send button press"""
+        """Animate send button press (generator)"""
         original_bg = self.send_button.cget('bg')
         self.send_button.configure(bg=self.colors['secondary'])
-        self.root.update()
-        time.sleep(0.2)
+        yield 0.2
         self.send_button.configure(bg=original_bg)
 
     def simulate_send(self):
-        """Simulate send button functionality"""
-        pass  # Disabled during demo
+        """Send visitor input to the intent matcher (disabled during the scripted demo)"""
+        if not self.live_mode:
+            return
+        
+        text = self.message_var.get().strip()
+        if not text:
+            return
+        self.message_var.set("")
+        self.add_message_with_animation(text, False, animate_typing=False)
+        
+        intent, score = self.intent_matcher.match(text)
+        if intent:
+            replies = intent["responses"]
+            opens_booking = intent.get("opens_booking", False)
+        else:
+            replies = [FALLBACK_REPLY]
+            opens_booking = False
+        
+        if self.responder:
+            # Stream the generated answer, scripted intent replies as fallback
+            def finished(stats):
+                if opens_booking:
+                    self.root.after(1500, self.open_booking_modal)
+            
+            fallback = "\n\n".join(replies)
+            self.add_message_stream(self.responder.stream(text, self.history[:-1], fallback),
+                                    on_done=finished)
+            return
+        
+        def reply():
+            for message in replies:
+                yield self.message_delay / 2
+                self.add_message_with_animation(message, True)
+            if opens_booking:
+                yield 1.5
+                self.open_booking_modal()
+        
+        self.spawn(reply(), "live-reply")
+
+    def set_responder(self, backend, **options):
+        """Get bot replies from an external generator, falling back to the scripted lines"""
+        if self.responder:
+            self.responder.shutdown()
+        self.responder = ResponderService(backend, **options) if backend else None
+
+    def generated_reply(self, prompt):
+        """Ask the responder about the last user turn; None keeps the scripted block"""
+        if not self.responder or prompt is None:
+            return None
+        
+        # Poll once per frame instead of blocking the shared event loop
+        future = self.responder.submit(prompt, self.history[:-1])
+        deadline = time.monotonic() + self.responder.timeout
+        while not future.done():
+            if time.monotonic() >= deadline:
+                return None
+            yield None
+        if future.exception() is not None:
+            return None
+        return future.result()
+
+    def enable_live_mode(self):
+        """Let a visitor take over the input field"""
+        if self.live_mode:
+            return
+        self.live_mode = True
+        self.session = new_session_id()
+        emit("scenario_started", session=self.session, scenario=self.current_conversation, live=True)
+        if self.recorder:
+            self.recorder.event("live_mode")
+        self.message_var.set("")
+        self.demo_status.configure(text=_("Live-läge"), bg=self.colors['accent'])
+
+    def disable_live_mode(self):
+        """Hand the screen back to the scripted demo"""
+        self.live_mode = False
+        # The rest of the scenario is demo again; keep it out of the visitor's session
+        self.session = new_session_id()
+        emit("scenario_started", session=self.session, scenario=self.current_conversation, live=False)
+        if self.recorder:
+            self.recorder.event("demo_mode")
+        self.message_var.set("")
+        self.demo_status.configure(text=_("Kör automatiskt"), bg=self.colors['secondary'])
+        self.root.focus_set()
 
     def scroll_to_bottom(self):
         """Smooth scroll to bottom"""
-        self.chat_canvas.yview_moveto(1.0)
+        self.smooth_scroller.scroll_to_bottom()
 
-    def start_super_automation(self):
-        """Start the super automated demo"""
-        def automation_loop():
-            while True:
-                for conv_index, conversation in enumerate(self.conversations):
-                    self.current_conversation = conv_index
-                    self.conv_counter.configure(text=f"Konversation {conv_index + 1}/{len(self.conversations)}")
-                    
-                    # Clear chat for new conversation
-                    self.clear_chat()
-                    time.sleep(1)
-                    
-                    # Run conversation
-                    for sender, message in conversation:
-                        if sender == "system" and message == "OPEN_BOOKING_MODAL":
-                            time.sleep(1.5)
-                            self.root.after(0, lambda: AdvancedBookingModal(self.root))
-                            time.sleep(10)  # Wait for booking interaction
-                            break
-                        elif sender == "bot":
-                            self.add_message_with_animation(message, True)
-                            time.sleep(self.message_delay)
-                        else:
-                            self.simulate_user_typing(message)
-                            self.add_message_with_animation(message, False, animate_typing=False)
-                            time.sleep(self.message_delay)
-                    
-                    # Pause between conversations
-                    time.sleep(self.conversation_delay)
-        
-        # Start automation thread
-        automation_thread = threading.Thread(target=automation_loop, daemon=True)
-        automation_thread.start()
+    def start_conversation(self, conv_index):
+        """Start the funnel session and counter of a scripted scenario"""
+        self.session = new_session_id()
+        emit("scenario_started", session=self.session, scenario=conv_index, live=False)
+        if self.recorder:
+            self.recorder.session(self.session, conv_index, live=False)
+        self.conv_counter.configure(text=_("Konversation {current}/{total}").format(
+            current=conv_index + 1, total=len(self.conversations)))
+        for listener in self.conversation_listeners:
+            listener(conv_index)
+
+    def start_super_automation(self, scenario=None, delay=None):
+        """Start (or restart at scenario) the super automated demo"""
+        first = self.start_offset if scenario is None else scenario
+        
+        # Scripted demo runs as a task on the shared scheduler (no thread per window)
+        if self.automation_task:
+            self.scheduler.cancel(self.automation_task)
+        self.automation_task = self.spawn(self.skippable(automation_script(self, first)), "automation",
+                                          self.start_delay if delay is None else delay)
+
+    def skippable(self, script):
+        """Run a demo script, without its sleeps while a skip is pending"""
+        for delay in script:
+            yield 0 if self.skip_pending and delay is not None else delay
+
+    def pause_demo(self):
+        """Freeze the demo and its typing where they are"""
+        for task in self.tasks:
+            if not task.done and not task.paused and task.name != "header":
+                self.scheduler.pause(task)
+                self.paused_tasks.append(task)
+        self.demo_paused = True
+        self.demo_status.configure(text=_("Pausad"), bg=self.colors['text_secondary'])
+        return {}
+
+    def resume_demo(self):
+        """Continue a paused demo exactly where it stopped"""
+        for task in self.paused_tasks:
+            if self.hidden:
+                self.suspended_tasks.append(task)  # Continues when the window is shown again
+            else:
+                self.scheduler.resume(task)
+        self.paused_tasks = []
+        self.demo_paused = False
+        if self.replay_reader:
+            self.set_replay_speed(self.replay_speed)
+        elif self.live_mode:
+            self.demo_status.configure(text=_("Live-läge"), bg=self.colors['accent'])
+        else:
+            self.demo_status.configure(text=_("Kör automatiskt"), bg=self.colors['secondary'])
+        return {}
+
+    def on_visibility_change(self, visible):
+        """Suspend every task of this window while it is hidden, resume them exactly where they stopped"""
+        if not visible:
+            self.hidden = True
+            for task in self.tasks:
+                if not task.done and not task.paused:
+                    self.scheduler.pause(task)
+                    self.suspended_tasks.append(task)
+            return
+        self.hidden = False
+        for task in self.suspended_tasks:
+            if self.demo_paused and task.name != "header":
+                self.paused_tasks.append(task)  # Paused by staff while hidden: stays paused
+            else:
+                self.scheduler.resume(task)
+        self.suspended_tasks = []
+
+    def skip_message(self):
+        """Finish the message being typed and go straight on to the next one"""
+        if self.live_mode:
+            raise ValueError("en besökare chattar (live-läge)")
+        self.skip_pending = True
+        self.typing_skips += 1
+        for task in self.tasks:
+            self.scheduler.wake(task)
+        return {}
+
+    def jump_to_scenario(self, scenario):
+        """Restart the scripted demo at scenario (0-based)"""
+        if self.replay_reader:
+            raise ValueError("inte under uppspelning")
+        if not 0 <= scenario < len(self.conversations):
+            raise ValueError(f"scenario {scenario + 1} finns inte (1-{len(self.conversations)})")
+        if self.live_mode:
+            self.disable_live_mode()
+        self.resume_demo()
+        self.skip_pending = False
+        self.typing_skips += 1  # Stops typing in the chat that is about to be cleared
+        self.start_super_automation(scenario, delay=0)
+        return {}
+
+    def control_booking(self, action):
+        """Open the booking modal for the current session, or close an open one"""
+        modal = self.booking_modal
+        is_open = modal is not None and modal.window.winfo_exists()
+        if action == "open":
+            if not is_open:
+                self.open_booking_modal()
+        elif action == "close":
+            if is_open:
+                modal.close_modal()
+        else:
+            raise ValueError(f"okänd bokningsåtgärd: {action}")
+        return {"booking": action}
+
+    def set_pacing(self, **pacing):
+        """Change typing_speed, message_delay and conversation_delay; used from the next wait on"""
+        for name, value in pacing.items():
+            if name not in ("typing_speed", "message_delay", "conversation_delay"):
+                raise ValueError(f"okänd takt: {name}")
+            if not 0 <= value <= 60:
+                raise ValueError(f"{name} måste vara 0-60 sekunder")
+        for name, value in pacing.items():
+            setattr(self, name, value)
+        return {}
+
+    def control_seek(self, seconds):
+        """Jump the running replay to a second of the transcript"""
+        if not self.replay_reader:
+            raise ValueError("ingen uppspelning pågår")
+        self.replay_seek(seconds)
+        return {}
+
+    def control_replay_speed(self, speed):
+        """Change the speed of the running replay"""
+        if not self.replay_reader:
+            raise ValueError("ingen uppspelning pågår")
+        if not 0 < speed <= 100:
+            raise ValueError("hastigheten måste vara 0-100")
+        self.set_replay_speed(speed)
+        return {}
+
+    def control_status(self):
+        return {"scenario": self.current_conversation, "scenarios": len(self.conversations),
+                "paused": self.demo_paused, "live": self.live_mode, "hidden": self.hidden,
+                "booking": self.booking_modal is not None and self.booking_modal.window.winfo_exists(),
+                "typing_speed": self.typing_speed, "message_delay": self.message_delay,
+                "conversation_delay": self.conversation_delay,
+                "replay_speed": self.replay_speed if self.replay_reader else None}
+
+    def prepare_chat(self):
+        """Build the next conversation's pane while the current one is still on screen"""
+        if self.next_chat_content is None:
+            self.next_chat_content = self.create_chat_pane()
 
     def clear_chat(self):
         """Clear chat content for new conversation"""
-        for widget in self.chat_content.winfo_children():
-            widget.destroy()
-        self.add_welcome_message()
+        self.prepare_chat()
+        retired, self.chat_content = self.chat_content, self.next_chat_content
+        self.next_chat_content = None
+        # One canvas item change swaps the panes, so no half-cleared chat is ever drawn
+        self.chat_canvas.itemconfigure(self.chat_window, window=self.chat_content)
+        self.chat_canvas.yview_moveto(0)
+        self.history = []
+        self.scroll_keeper.reset(self.chat_content)
+        # destroy() takes the retired pane's whole subtree down in one call
+        self.root.after_idle(retired.destroy)
+        if self.recorder and not self.replay_reader:
+            self.recorder.clear()
+
+    def start_replay(self, path, speed=1.0, start=0.0):
+        """Replay a recorded transcript in place of the scripted demo"""
+        if self.automation_task:
+            self.scheduler.cancel(self.automation_task)
+            self.automation_task = None
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+        if self.replay_reader:
+            self.replay_reader.close()
+        self.replay_reader = TranscriptReader(path)
+        self.replay_speed = speed
+        self.replay_seek(start)
+
+    def replay_seek(self, seconds):
+        """Jump to a moment of the replay: rebuild the screen from the nearest checkpoint"""
+        if self.replay_task:
+            self.scheduler.cancel(self.replay_task)
+        self.replay_task = self.spawn(self.replay_loop(max(0.0, seconds)), "replay")
+
+    def set_replay_speed(self, speed):
+        """Change the playback speed; takes effect from the next record"""
+        self.replay_speed = max(0.01, speed)
+        self.demo_status.configure(text=_("Uppspelning {speed}×").format(speed=f"{self.replay_speed:g}"),
+                                   bg=self.colors['accent'])
+
+    def replay_loop(self, seconds):
+        """Show the records before `seconds` at once, then play the rest in recorded time"""
+        self.set_replay_speed(self.replay_speed)
+        position = seconds
+        for record in self.replay_reader.records(self.replay_reader.seek(seconds)):
+            live = record.t > seconds
+            if live:
+                yield (record.t - position) / self.replay_speed
+                position = record.t
+            self.apply_replay_record(record, animate=live and self.replay_speed <= 1)
+        self.demo_status.configure(text=_("Uppspelning klar"), bg=self.colors['secondary'])
+
+    def apply_replay_record(self, record, animate):
+        if record.kind == SESSION:
+            self.current_conversation = record.data["scenario"]
+            self.conv_counter.configure(text=_("Konversation {current}/{total}").format(
+                current=self.current_conversation + 1, total=len(self.conversations)))
+        elif record.kind == CLEAR:
+            self.clear_chat()
+        elif record.kind == MESSAGE:
+            sender, text = record.data
+            self.add_message_with_animation(text, sender == "bot", animate_typing=animate and sender == "bot")
 
     def on_chat_configure(self, event=None):
-        self.chat_canvas.configure(scrollregion=self.chat_canvas.bbox("all"))
+        self.scroll_keeper.request()
 
     def on_canvas_configure(self, event):
         self.chat_canvas.itemconfig(self.chat_window, width=event.width)
+        self.scroll_keeper.request()
 
-def main():
-    """Main application entry point"""
+def main(replay=None, speed=1.0, start=0.0, intent_index=None):
+    """Main application entry point (replay: transcript file to play instead of the demo)"""
     root = tk.Tk()
     
     # Enhanced window configuration
@@ -993,7 +1632,14 @@ def main():
         pass
     
     # Create application
-    app = SuperAutomatedChatbot(root)
+    app = SuperAutomatedChatbot(root, autostart=replay is None, intent_index=intent_index)
+    if replay:
+        app.start_replay(replay, speed, start)
+    
+    # Optional reply generator service
+    responder_url = os.environ.get('AXIE_RESPONDER_URL')
+    if responder_url:
+        app.set_responder(HTTPResponder(responder_url))
     
     # Start the application
     root.mainloop()
@@ -0,0 +1,198 @@
+"""
+Structured event log for the booking funnel
+Typed events go into a bounded in-memory ring buffer; a background writer
+batches them into gzip-compressed, size-rotated JSONL segments so the Tk
+thread never waits on the disk
+"""
+
+import atexit
+import glob
+import gzip
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+
+# Event type -> fields it may carry (session and scenario are common to all)
+EVENT_TYPES = {
+    "scenario_started": ("live",),
+    "message_shown": ("sender", "chars", "live"),
+    "modal_opened": ("live",),
+    "step_completed": ("step", "progress", "label"),
+    "booking_confirmed": ("date", "time", "service"),
+    "booking_abandoned": ("step", "progress"),
+}
+COMMON_FIELDS = ("session", "scenario")
+
+SEGMENT_PATTERN = "events-*.jsonl.gz"
+
+
+def new_session_id():
+    """Short random id tying the events of one visitor session together"""
+    return uuid.uuid4().hex[:12]
+
+
+class EventLog:
+    """Ring-buffered event sink with a background gzip JSONL writer"""
+
+    def __init__(self, directory, capacity=4096, batch_size=256, flush_interval=1.0,
+                 segment_bytes=8 * 1024 * 1024, max_segments=64):
+        self.directory = directory
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.source = f"{socket.gethostname()}-{os.getpid()}"
+
+        self.buffer = deque()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.stats = {"emitted": 0, "written": 0, "dropped": 0, "batches": 0,
+                      "segments": 0, "write_errors": 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self.segment = None
+        self.segment_path = None
+        self.writer = threading.Thread(target=self._write_loop, name="event-log", daemon=True)
+        self.writer.start()
+
+    def emit(self, kind, **fields):
+        """Queue one event; never blocks on I/O"""
+        allowed = EVENT_TYPES.get(kind)
+        if allowed is None:
+            raise ValueError(f"Okänd händelsetyp: {kind}")
+        for name in fields:
+            if name not in allowed and name not in COMMON_FIELDS:
+                raise ValueError(f"Fältet {name} hör inte till {kind}")
+        event = {"t": round(time.time(), 3), "type": kind, "source": self.source}
+        event.update(fields)
+
+        with self.lock:
+            if self.closed:
+                return
+            self.stats["emitted"] += 1
+            if len(self.buffer) >= self.capacity:
+                # Slow disk: keep the newest events, count what is lost
+                self.buffer.popleft()
+                self.stats["dropped"] += 1
+            self.buffer.append(event)
+            full_batch = len(self.buffer) >= self.batch_size
+        if full_batch:
+            self.wakeup.set()
+
+    def _take_batch(self):
+        with self.lock:
+            count = min(len(self.buffer), self.batch_size)
+            return [self.buffer.popleft() for _ in range(count)]
+
+    def _write_loop(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            stopping = self.closed
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    break
+                self._write_batch(batch)
+            if stopping:
+                break
+        if self.segment:
+            self.segment.close()
+            self.segment = None
+
+    def _write_batch(self, batch):
+        payload = "".join(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+                          for event in batch).encode("utf-8")
+        try:
+            if self.segment is None or self.segment.tell() >= self.segment_bytes:
+                self._rotate()
+            # One gzip member per batch keeps the segment readable while it grows
+            self.segment.write(gzip.compress(payload, compresslevel=6))
+            self.segment.flush()
+        except OSError as e:
+            self.stats["write_errors"] += 1
+            with self.lock:
+                self.stats["dropped"] += len(batch)
+            print(f"⚠️ Kunde inte skriva händelser: {e}")
+            self.segment = None
+            return
+        self.stats["written"] += len(batch)
+        self.stats["batches"] += 1
+
+    def _rotate(self):
+        if self.segment:
+            self.segment.close()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.segment_path = os.path.join(
+            self.directory, f"events-{stamp}-{self.source}-{self.stats['segments']:04d}.jsonl.gz")
+        self.segment = open(self.segment_path, "ab")
+        self.stats["segments"] += 1
+
+        # Bound disk usage: oldest segments go first
+        segments = sorted(glob.glob(os.path.join(self.directory, SEGMENT_PATTERN)), key=os.path.getmtime)
+        for path in segments[:max(0, len(segments) - self.max_segments)]:
+            if path != self.segment_path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def close(self, timeout=5.0):
+        """Flush what is buffered and stop the writer"""
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+        self.wakeup.set()
+        self.writer.join(timeout)
+        if self.stats["dropped"] or self.stats["write_errors"]:
+            print(f"⚠️ Händelselogg: {self.stats['written']} skrivna, {self.stats['dropped']} tappade, "
+                  f"{self.stats['write_errors']} skrivfel")
+
+
+def read_events(directory):
+    """Yield events from every segment in a directory, oldest segment first"""
+    for path in sorted(glob.glob(os.path.join(directory, SEGMENT_PATTERN)), key=os.path.getmtime):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+        except (EOFError, OSError, ValueError):
+            # Segment still being written or cut short by a crash
+            continue
+
+
+_event_log = None
+_configured = False
+
+
+def configure_event_log(directory, **options):
+    """Start logging funnel events of this process to directory"""
+    global _event_log, _configured
+    if _event_log:
+        _event_log.close()
+    _event_log = EventLog(directory, **options) if directory else None
+    _configured = True
+    if _event_log:
+        atexit.register(_event_log.close)
+    return _event_log
+
+
+def get_event_log():
+    """The process event log; AXIE_EVENT_DIR enables it in spawned workers too"""
+    if not _configured:
+        configure_event_log(os.environ.get("AXIE_EVENT_DIR"))
+    return _event_log
+
+
+def emit(kind, **fields):
+    """Record a funnel event if logging is enabled"""
+    event_log = get_event_log()
+    if event_log:
+        event_log.emit(kind, **fields)
@@ -0,0 +1,205 @@
+"""
+Booking form validation
+Compiled validators for Swedish phone numbers and internationalised e-mail
+addresses, plus an off-thread domain check with a TTL cache so live
+validation never blocks typing
+"""
+
+import re
+import socket
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from i18n import _
+
+# Milliseconds of typing silence before a field is validated
+DEBOUNCE_MS = 350
+
+PHONE_SEPARATORS = re.compile(r"[\s\-()/.]")
+# 0 or +46/0046, then area code or mobile prefix (no leading 0) and 6-8 more digits
+SWEDISH_PHONE = re.compile(r"^(?:\+46|0046|0)([1-9]\d{6,8})$")
+
+# Dot-atom local part with Unicode letters (RFC 6531) and a Unicode domain
+EMAIL = re.compile(r"^(?P<local>[\w!#$%&'*+/=?^`{|}~-]+(?:\.[\w!#$%&'*+/=?^`{|}~-]+)*)"
+                   r"@(?P<domain>[^\W_](?:[\w-]*[^\W_])?(?:\.[^\W_](?:[\w-]*[^\W_])?)+)$")
+TLD = re.compile(r"^(?:[^\W\d_]{2,63}|xn--[a-z0-9-]{1,59})$")
+
+
+@lru_cache(maxsize=1024)
+def ascii_domain(domain):
+    """IDNA-encode a domain ('företag.se' -> 'xn--fretag-wxa.se'), None if invalid"""
+    try:
+        encoded = domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+    if len(encoded) > 253 or any(len(label) > 63 for label in encoded.split(".")):
+        return None
+    return encoded.lower()
+
+
+def normalize_phone(value):
+    """Digits-only E.164 form of a Swedish number, or None"""
+    match = SWEDISH_PHONE.match(PHONE_SEPARATORS.sub("", value))
+    return f"+46{match.group(1)}" if match else None
+
+
+def validate_required(value):
+    if len(value.strip()) < 2:
+        return _("Fältet måste fyllas i")
+    return None
+
+
+def validate_optional(value):
+    return None
+
+
+def validate_email(value):
+    value = value.strip()
+    if not value:
+        return _("Ange din e-postadress")
+    match = EMAIL.match(value)
+    if not match or len(match.group("local")) > 64:
+        return _("Ogiltig e-postadress")
+    domain = match.group("domain")
+    if not ascii_domain(domain) or not TLD.match(domain.rsplit(".", 1)[1]):
+        return _("Ogiltig domän: {domain}").format(domain=domain)
+    return None
+
+
+def validate_phone(value, required=False):
+    value = value.strip()
+    if not value:
+        return _("Ange ditt telefonnummer") if required else None
+    if not normalize_phone(value):
+        return _("Ange ett svenskt nummer, t.ex. 070-123 45 67")
+    return None
+
+
+# Validator per AdvancedBookingModal form field
+FIELD_VALIDATORS = {
+    "Namn": validate_required,
+    "E-post": validate_email,
+    "Telefon": validate_phone,
+    "Företag": validate_required,
+    "Befattning": validate_optional,
+}
+
+
+def email_domain(value):
+    """ASCII domain of a syntactically valid address, for the domain check"""
+    if validate_email(value):
+        return None
+    return ascii_domain(value.strip().rsplit("@", 1)[1])
+
+
+class SocketResolver:
+    """Domain check via the system resolver (A/AAAA; MX when dnspython is installed)"""
+
+    def __init__(self, timeout=3.0):
+        self.timeout = timeout
+        try:
+            import dns.resolver
+            self.dns = dns.resolver
+        except ImportError:
+            self.dns = None
+
+    def __call__(self, domain):
+        if self.dns:
+            try:
+                self.dns.resolve(domain, "MX", lifetime=self.timeout)
+                return True
+            except (self.dns.NXDOMAIN, self.dns.NoAnswer):
+                pass
+            except Exception:
+                return None  # Resolver trouble says nothing about the domain
+        try:
+            socket.getaddrinfo(domain, None)
+            return True
+        except socket.gaierror as e:
+            if e.errno in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", socket.EAI_NONAME)):
+                return False
+            return None
+
+
+class StaticResolver:
+    """Offline resolver for tests and demos: only the listed domains exist"""
+
+    def __init__(self, domains=("axiestudio.se", "xn--fretag-wxa.se", "gmail.com")):
+        self.domains = {domain.lower() for domain in domains}
+        self.lookups = 0
+
+    def __call__(self, domain):
+        self.lookups += 1
+        return domain.lower() in self.domains
+
+
+class DomainChecker:
+    """Runs resolver lookups off the UI thread with an LRU+TTL cache and in-flight coalescing"""
+
+    def __init__(self, resolver=None, ttl=3600.0, max_workers=2, max_entries=512):
+        self.resolver = resolver or SocketResolver()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache = OrderedDict()  # domain -> (expires, accepts mail: True/False/None), oldest use first
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="domain-check")
+
+    def check(self, domain):
+        """Future resolving to True, False or None (unknown); cached hits are already done"""
+        domain = domain.lower()
+        with self.lock:
+            cached = self.cache.get(domain)
+            if cached and cached[0] > time.monotonic():
+                self.cache.move_to_end(domain)
+                future = Future()
+                future.set_result(cached[1])
+                return future
+            if cached:
+                del self.cache[domain]
+            if domain in self.pending:
+                return self.pending[domain]
+            future = self.executor.submit(self._lookup, domain)
+            self.pending[domain] = future
+            return future
+
+    def _lookup(self, domain):
+        try:
+            result = self.resolver(domain)
+        except Exception:
+            result = None
+        with self.lock:
+            self.pending.pop(domain, None)
+            # Unknown results are retried sooner than definite answers
+            ttl = self.ttl if result is not None else min(self.ttl, 60.0)
+            self.cache[domain] = (time.monotonic() + ttl, result)
+            self.cache.move_to_end(domain)
+            # Every domain anyone typed would otherwise stay for the life of the kiosk
+            while len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return result
+
+    def cached(self, domain):
+        """Cached result without triggering a lookup"""
+        entry = self.cache.get(domain.lower())
+        return entry[1] if entry and entry[0] > time.monotonic() else None
+
+
+_domain_checker = None
+
+
+def get_domain_checker():
+    """Process-wide checker shared by every booking modal"""
+    global _domain_checker
+    if _domain_checker is None:
+        _domain_checker = DomainChecker()
+    return _domain_checker
+
+
+def set_domain_resolver(resolver, **options):
+    """Swap the resolver (e.g. StaticResolver offline); None disables domain checks"""
+    global _domain_checker
+    _domain_checker = DomainChecker(resolver, **options) if resolver else False
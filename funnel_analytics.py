@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Columnar funnel analytics over recorded kiosk event logs
+Ingests event_log segments into memory-mapped NumPy columns indexed by
+(day, scenario, event type) and answers conversion, step drop-off and
+time-to-confirm queries without rescanning the JSONL
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import shutil
+from datetime import date, datetime
+
+import numpy as np
+
+from event_log import EVENT_TYPES, SEGMENT_PATTERN
+
+TYPE_CODES = {kind: code for code, kind in enumerate(EVENT_TYPES)}
+COLUMNS = {
+    "t": np.float64,
+    "session": np.int64,
+    "step": np.int8,
+    "live": np.bool_,
+}
+MANIFEST = "manifest.json"
+
+
+def parse_day(text):
+    return date.fromisoformat(text).toordinal() if text else None
+
+
+def read_segment(path):
+    """Decode one segment into (day, scenario, type) keys and column lists"""
+    keys, columns = [], {name: [] for name in COLUMNS}
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                code = TYPE_CODES.get(event.get("type"))
+                if code is None:
+                    continue
+                scenario = event.get("scenario")
+                keys.append((datetime.fromtimestamp(event["t"]).toordinal(),
+                             -1 if scenario is None else scenario, code))
+                columns["t"].append(event["t"])
+                session = event.get("session")
+                columns["session"].append(int(session, 16) if session else 0)
+                step = event.get("step")
+                columns["step"].append(-1 if step is None else step)
+                columns["live"].append(bool(event.get("live")))
+    except (EOFError, OSError, ValueError):
+        pass  # Keep what was readable; the segment is re-ingested when it grows
+    return keys, columns
+
+
+def write_chunk(directory, keys, columns):
+    """Sort rows by (day, scenario, type, t) and store columns plus the key index"""
+    key_array = np.array(keys, dtype=np.int32).reshape(-1, 3)
+    arrays = {name: np.array(values, dtype=COLUMNS[name]) for name, values in columns.items()}
+    order = np.lexsort((arrays["t"], key_array[:, 2], key_array[:, 1], key_array[:, 0]))
+    key_array = key_array[order]
+    for name in arrays:
+        np.save(os.path.join(directory, f"{name}.npy"), arrays[name][order])
+
+    # One index row per distinct key: the rows of a key are one contiguous slice
+    if len(key_array):
+        change = np.any(key_array[1:] != key_array[:-1], axis=1)
+        starts = np.concatenate(([0], np.flatnonzero(change) + 1))
+    else:
+        starts = np.zeros(0, dtype=np.int64)
+    np.save(os.path.join(directory, "keys.npy"), key_array[starts])
+    np.save(os.path.join(directory, "offsets.npy"), np.append(starts, len(key_array)).astype(np.int64))
+
+
+class FunnelStore:
+    """Directory of per-segment columnar chunks with a manifest for incremental ingest"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.chunks = None
+        self.live = None
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {"segments": {}}
+
+    def ingest(self, events_dir):
+        """Convert new or grown segments; returns the number of rows added"""
+        added = 0
+        for path in sorted(glob.glob(os.path.join(events_dir, SEGMENT_PATTERN))):
+            name = os.path.basename(path)
+            size = os.path.getsize(path)
+            known = self.manifest["segments"].get(name)
+            if known and known["size"] == size:
+                continue
+
+            keys, columns = read_segment(path)
+            chunk = os.path.join(self.directory, name.replace(".jsonl.gz", ""))
+            staging = chunk + ".tmp"
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+            write_chunk(staging, keys, columns)
+            shutil.rmtree(chunk, ignore_errors=True)
+            os.replace(staging, chunk)
+
+            added += len(keys) - (known["rows"] if known else 0)
+            self.manifest["segments"][name] = {"size": size, "rows": len(keys)}
+            self.save_manifest()
+        self.chunks = None
+        self.live = None
+        return added
+
+    def save_manifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(path + ".tmp", path)
+
+    def load(self):
+        """Memory-map every chunk (pruned event segments stay in the store)"""
+        if self.chunks is None:
+            self.chunks = []
+            for name in sorted(self.manifest["segments"]):
+                chunk = os.path.join(self.directory, name.replace(".jsonl.gz", ""))
+                columns = {column: np.load(os.path.join(chunk, f"{column}.npy"), mmap_mode="r")
+                           for column in list(COLUMNS) + ["keys", "offsets"]}
+                self.chunks.append(columns)
+        return self.chunks
+
+    def live_sessions(self):
+        """Sorted ids of visitor sessions: those with a row flagged live (scenario start, modal)"""
+        if self.live is None:
+            parts = [chunk["session"][np.asarray(chunk["live"])] for chunk in self.load()]
+            self.live = np.unique(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
+        return self.live
+
+    def select(self, types, day_from=None, day_to=None, scenario=None, live=None):
+        """Rows of the given event types; live=True keeps visitor sessions, False the demo, None both"""
+        codes = [TYPE_CODES[kind] for kind in types]
+        parts = {name: [] for name in list(COLUMNS) + ["day", "scenario", "type"]}
+        for chunk in self.load():
+            keys, offsets = chunk["keys"], chunk["offsets"]
+            mask = np.isin(keys[:, 2], codes)
+            if day_from is not None:
+                mask &= keys[:, 0] >= day_from
+            if day_to is not None:
+                mask &= keys[:, 0] <= day_to
+            if scenario is not None:
+                mask &= keys[:, 1] == scenario
+            for index in np.flatnonzero(mask):
+                start, end = offsets[index], offsets[index + 1]
+                for name in COLUMNS:
+                    parts[name].append(chunk[name][start:end])
+                for column, name in enumerate(("day", "scenario", "type")):
+                    parts[name].append(np.full(end - start, keys[index, column], dtype=np.int32))
+        rows = {name: np.concatenate(values) if values else np.zeros(0, dtype=COLUMNS.get(name, np.int32))
+                for name, values in parts.items()}
+        if live is not None:
+            # Step and outcome events carry no live flag, so whole sessions are kept or dropped
+            keep = np.isin(rows["session"], self.live_sessions()) == live
+            rows = {name: values[keep] for name, values in rows.items()}
+        return rows
+
+
+SESSION_BITS = 48  # Session ids are 12 hex digits
+
+
+def sessions_per_group(rows, group=None):
+    """Distinct sessions per scenario (and optional small group column) in one sort"""
+    packed = (rows["scenario"].astype(np.int64) + 1) << (SESSION_BITS + 4)
+    if group is not None:
+        packed |= (group.astype(np.int64) + 1) << SESSION_BITS
+    packed |= rows["session"]
+    # Sort-based distinct: much faster than hashing for random 48-bit ids
+    packed.sort()
+    distinct = packed[np.concatenate(([True], packed[1:] != packed[:-1]))] if len(packed) else packed
+    # Group key: scenario + 1 in the high bits, group + 1 in the low four bits
+    groups = distinct >> SESSION_BITS
+    starts = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1]))) if len(groups) else groups
+    return groups[starts], np.diff(np.append(starts, len(groups)))
+
+
+def funnel(store, day_from=None, day_to=None, scenario=None, live=True):
+    """Sessions per funnel stage and drop-off per booking step, per scenario (visitors only by default)"""
+    def count(kind, by_step=False):
+        rows = store.select([kind], day_from, day_to, scenario, live)
+        keys, counts = sessions_per_group(rows, rows["step"] if by_step else None)
+        result = {}
+        for key, value in zip(keys.tolist(), counts.tolist()):
+            index, step = (key >> 4) - 1, (key & 15) - 1
+            if by_step:
+                result.setdefault(index, {})[step] = value
+            else:
+                result[index] = value
+        return result
+
+    started = count("scenario_started")
+    opened = count("modal_opened")
+    confirmed = count("booking_confirmed")
+    steps = count("step_completed", by_step=True)
+    abandoned = count("booking_abandoned", by_step=True)
+
+    report = {}
+    for index in sorted(started.keys() | opened.keys() | confirmed.keys()):
+        sessions = started.get(index, 0)
+        report[index] = {
+            "sessions": sessions,
+            "modal_opened": opened.get(index, 0),
+            "steps_completed": steps.get(index, {}),
+            "confirmed": confirmed.get(index, 0),
+            "abandoned_at_step": abandoned.get(index, {}),
+            "conversion": round(confirmed.get(index, 0) / sessions, 4) if sessions else 0.0,
+        }
+    return report
+
+
+def time_to_confirm(store, day_from=None, day_to=None, scenario=None, percentiles=(50, 90, 99), live=True):
+    """Seconds from scenario start to booking confirmation, per scenario (visitors only by default)"""
+    rows = store.select(["scenario_started", "booking_confirmed"], day_from, day_to, scenario, live)
+    report = {}
+    for index in np.unique(rows["scenario"]).tolist():
+        in_scenario = rows["scenario"] == index
+        start_mask = in_scenario & (rows["type"] == TYPE_CODES["scenario_started"])
+        confirm_mask = in_scenario & (rows["type"] == TYPE_CODES["booking_confirmed"])
+
+        # Join confirmations to their session start by binary search on session id
+        order = np.argsort(rows["session"][start_mask], kind="stable")
+        start_sessions = rows["session"][start_mask][order]
+        start_times = rows["t"][start_mask][order]
+        if not len(start_sessions):
+            continue
+        sessions, times = rows["session"][confirm_mask], rows["t"][confirm_mask]
+        position = np.minimum(np.searchsorted(start_sessions, sessions), len(start_sessions) - 1)
+        matched = start_sessions[position] == sessions
+        durations = times[matched] - start_times[position[matched]]
+        if not len(durations):
+            continue
+        values = np.percentile(durations, percentiles)
+        report[index] = {"confirmed": int(len(durations)),
+                         **{f"p{p}": round(float(v), 2) for p, v in zip(percentiles, values)}}
+    return report
+
+
+def scenario_label(index):
+    """First visitor line of a scenario from scenarios.py"""
+    from scenarios import CONVERSATIONS
+    if 0 <= index < len(CONVERSATIONS):
+        for sender, message in CONVERSATIONS[index]:
+            if sender == "user":
+                return f"{index + 1}: {message[:40].rstrip()}"
+    return str(index + 1) if index >= 0 else "-"
+
+
+def print_funnel(report):
+    for index, row in sorted(report.items()):
+        print(f"🎯 Scenario {scenario_label(index)}")
+        print(f"   Sessioner {row['sessions']}  →  bokningsfönster {row['modal_opened']}  →  "
+              f"bekräftade {row['confirmed']}  ({row['conversion'] * 100:.1f}%)")
+        for step, count in sorted(row["steps_completed"].items()):
+            print(f"   Steg {step} klart: {count}")
+        for step, count in sorted(row["abandoned_at_step"].items()):
+            print(f"   Avbrutna vid steg {step}: {count}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tratt-analys av kioskens händelseloggar")
+    parser.add_argument("command", choices=["ingest", "funnel", "time-to-confirm"])
+    parser.add_argument("events", help="katalog med händelsesegment (run_demo.py --events)")
+    parser.add_argument("--store", help="kolumnlager (standard: EVENTS/columnar)")
+    parser.add_argument("--from", dest="day_from", help="första dag, ÅÅÅÅ-MM-DD")
+    parser.add_argument("--to", dest="day_to", help="sista dag, ÅÅÅÅ-MM-DD")
+    parser.add_argument("--scenario", type=int, help="scenario (1-baserat)")
+    parser.add_argument("--include-demo", action="store_true",
+                        help="räkna med demoslingans sessioner (standard: bara riktiga besökare)")
+    parser.add_argument("--json", action="store_true", help="skriv resultatet som JSON")
+    args = parser.parse_args(argv)
+
+    store = FunnelStore(args.store or os.path.join(args.events, "columnar"))
+    added = store.ingest(args.events)
+    if args.command == "ingest":
+        print(f"✅ {added} nya händelser inlästa")
+        return
+
+    filters = (parse_day(args.day_from), parse_day(args.day_to),
+               args.scenario - 1 if args.scenario else None)
+    if args.command == "funnel":
+        report = funnel(store, *filters, live=None if args.include_demo else True)
+        if not args.json:
+            print_funnel(report)
+    else:
+        report = time_to_confirm(store, *filters, live=None if args.include_demo else True)
+        if not args.json:
+            for index, row in sorted(report.items()):
+                print(f"⏱️ Scenario {scenario_label(index)}: {row['confirmed']} bokningar, "
+                      f"p50 {row['p50']} s, p90 {row['p90']} s, p99 {row['p99']} s")
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
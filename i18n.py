@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Message catalogues and locale-independent date names
+Swedish source strings are translated through gettext .mo catalogues that
+are loaded lazily, one locale at a time; day and month names come from
+precomputed tables instead of strftime and the process locale
+"""
+
+import ast
+import gettext
+import os
+import struct
+import sys
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locale")
+DOMAIN = "axie"
+SOURCE_LOCALE = "sv"
+LOCALES = ("sv", "en", "fi")
+
+# Monday first, as datetime.weekday() counts
+DAY_NAMES = {
+    "sv": ("måndag", "tisdag", "onsdag", "torsdag", "fredag", "lördag", "söndag"),
+    "en": ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+    "fi": ("maanantai", "tiistai", "keskiviikko", "torstai", "perjantai", "lauantai", "sunnuntai"),
+}
+DAY_ABBREVIATIONS = {
+    "sv": ("Mån", "Tis", "Ons", "Tor", "Fre", "Lör", "Sön"),
+    "en": ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"),
+    "fi": ("Ma", "Ti", "Ke", "To", "Pe", "La", "Su"),
+}
+MONTH_NAMES = {
+    "sv": ("januari", "februari", "mars", "april", "maj", "juni", "juli",
+           "augusti", "september", "oktober", "november", "december"),
+    "en": ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December"),
+    "fi": ("tammikuu", "helmikuu", "maaliskuu", "huhtikuu", "toukokuu", "kesäkuu", "heinäkuu",
+           "elokuu", "syyskuu", "lokakuu", "marraskuu", "joulukuu"),
+}
+# Finnish dates use the partitive month: "20. lokakuuta"
+MONTH_IN_DATE = dict(MONTH_NAMES, fi=tuple(month + "ta" for month in MONTH_NAMES["fi"]))
+
+DATE_PATTERNS = {
+    "sv": {"day_month": "{day} {month}", "weekday_day_month": "{weekday}, {day} {month}",
+           "long": "{weekday}, {day} {month} {year}", "month_year": "{Month} {year}"},
+    "en": {"day_month": "{day} {month}", "weekday_day_month": "{weekday}, {day} {month}",
+           "long": "{weekday}, {day} {month} {year}", "month_year": "{Month} {year}"},
+    "fi": {"day_month": "{day}. {month}", "weekday_day_month": "{weekday} {day}. {month}",
+           "long": "{weekday} {day}. {month} {year}", "month_year": "{Month} {year}"},
+}
+
+_translations = {}  # locale -> translations, filled on first use
+_active = os.environ.get("AXIE_LOCALE", SOURCE_LOCALE)
+if _active not in LOCALES:
+    _active = SOURCE_LOCALE
+
+
+class CatalogTranslations(gettext.NullTranslations):
+    """Translations read straight from a .po file when no compiled .mo exists"""
+
+    def __init__(self, catalog):
+        super().__init__()
+        self.catalog = catalog
+
+    def gettext(self, message):
+        return self.catalog.get(message) or message
+
+
+def catalogue_paths(locale):
+    base = os.path.join(LOCALE_DIR, locale, "LC_MESSAGES", DOMAIN)
+    return base + ".po", base + ".mo"
+
+
+def load_translations(locale):
+    if locale == SOURCE_LOCALE:
+        return gettext.NullTranslations()
+    po_path, mo_path = catalogue_paths(locale)
+    try:
+        with open(mo_path, "rb") as f:
+            return gettext.GNUTranslations(f)
+    except OSError:
+        pass
+    if os.path.exists(po_path):
+        print(f"⚠️ {mo_path} saknas - läser {po_path} (kör python i18n.py compile)")
+        return CatalogTranslations(parse_po(po_path))
+    print(f"⚠️ Ingen katalog för {locale} - visar svenska")
+    return gettext.NullTranslations()
+
+
+def translations(locale=None):
+    locale = locale or _active
+    if locale not in _translations:
+        _translations[locale] = load_translations(locale)
+    return _translations[locale]
+
+
+def set_locale(locale):
+    """Switch language at runtime; a catalogue is read the first time it is used"""
+    global _active
+    if locale not in LOCALES:
+        raise ValueError(f"Språket {locale} stöds inte (välj {', '.join(LOCALES)})")
+    _active = locale
+    translations(locale)
+
+
+def get_locale():
+    return _active
+
+
+def _(message):
+    """Translate a Swedish source string into the active language"""
+    return translations().gettext(message)
+
+
+def N_(message):
+    """Mark a string for extraction where it is translated later (e.g. a stored key)"""
+    return message
+
+
+def format_date(date, style="day_month", locale=None):
+    """Format a date with the precomputed name tables (no strftime, no setlocale)"""
+    locale = locale or _active
+    weekday = DAY_NAMES[locale][date.weekday()]
+    month = MONTH_IN_DATE[locale][date.month - 1]
+    return DATE_PATTERNS[locale][style].format(
+        day=date.day, year=date.year,
+        weekday=weekday, Weekday=weekday[0].upper() + weekday[1:],
+        month=month, Month=MONTH_NAMES[locale][date.month - 1].capitalize(),
+    )
+
+
+def day_abbreviations(locale=None):
+    return DAY_ABBREVIATIONS[locale or _active]
+
+
+def weekday_name(date, locale=None):
+    name = DAY_NAMES[locale or _active][date.weekday()]
+    return name[0].upper() + name[1:]
+
+
+# Catalogue tooling: python i18n.py extract | compile
+
+def unquote(text):
+    return ast.literal_eval(text)
+
+
+def parse_po(path):
+    """msgid -> msgstr of a .po file (fuzzy and untranslated entries skipped)"""
+    catalog = {}
+    msgid = msgstr = None
+    section = None
+    fuzzy = False
+
+    def finish():
+        if msgid is not None and msgstr and not fuzzy:
+            catalog[msgid] = msgstr
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("#,") and "fuzzy" in line:
+                fuzzy = True
+            elif line.startswith("msgid "):
+                finish()
+                msgid, msgstr, section = unquote(line[6:]), None, "msgid"
+            elif line.startswith("msgstr "):
+                msgstr, section = unquote(line[7:]), "msgstr"
+            elif line.startswith('"'):
+                if section == "msgid":
+                    msgid += unquote(line)
+                elif section == "msgstr":
+                    msgstr += unquote(line)
+            elif not line:
+                finish()
+                msgid = msgstr = section = None
+                fuzzy = False
+    finish()
+    return catalog
+
+
+def write_mo(catalog, path):
+    """Write a GNU .mo file (the header entry "" carries the charset)"""
+    entries = sorted((key.encode("utf-8"), value.encode("utf-8")) for key, value in catalog.items())
+    count = len(entries)
+    key_table_offset = 7 * 4
+    value_table_offset = key_table_offset + count * 8
+    data_offset = value_table_offset + count * 8
+
+    tables, data = [], b""
+    for strings in (tuple(key for key, _ in entries), tuple(value for _, value in entries)):
+        table = []
+        for string in strings:
+            table.append((len(string), data_offset + len(data)))
+            data += string + b"\0"
+        tables.append(table)
+
+    with open(path, "wb") as f:
+        f.write(struct.pack("<7I", 0x950412de, 0, count, key_table_offset, value_table_offset, 0, 0))
+        for table in tables:
+            for length, offset in table:
+                f.write(struct.pack("<2I", length, offset))
+        f.write(data)
+
+
+def extract(paths):
+    """Every literal passed to _() or N_() in the given Python files"""
+    messages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in ("_", "N_")
+                    and node.args and isinstance(node.args[0], ast.Constant)
+                    and isinstance(node.args[0].value, str) and node.args[0].value not in messages):
+                messages.append(node.args[0].value)
+    return messages
+
+
+def po_string(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command == "compile":
+        for locale in LOCALES:
+            po_path, mo_path = catalogue_paths(locale)
+            if not os.path.exists(po_path):
+                continue
+            catalog = parse_po(po_path)
+            write_mo(catalog, mo_path)
+            print(f"✅ {locale}: {len(catalog) - 1} översättningar → {mo_path}")
+    elif command == "extract":
+        here = os.path.dirname(os.path.abspath(__file__))
+        sources = [os.path.join(here, name) for name in sorted(os.listdir(here)) if name.endswith(".py")]
+        messages = extract(sources)
+        pot_path = os.path.join(LOCALE_DIR, DOMAIN + ".pot")
+        os.makedirs(LOCALE_DIR, exist_ok=True)
+        with open(pot_path, "w", encoding="utf-8") as f:
+            f.write('msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n')
+            for message in messages:
+                f.write(f"msgid {po_string(message)}\nmsgstr \"\"\n\n")
+        print(f"✅ {len(messages)} texter → {pot_path}")
+        for locale in LOCALES[1:]:
+            po_path, _mo = catalogue_paths(locale)
+            if os.path.exists(po_path):
+                missing = [message for message in messages if message not in parse_po(po_path)]
+                if missing:
+                    print(f"⚠️ {locale}: {len(missing)} saknade översättningar")
+    else:
+        print("Användning: python i18n.py extract|compile")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Swedish intent matcher for live visitor input
+Normalises Swedish text, builds a TF-IDF inverted index over an intent
+catalogue and scores queries with vectorized cosine similarity
+"""
+
+import json
+import re
+import sys
+import threading
+import unicodedata
+from collections import Counter
+
+import numpy as np
+
+# Letters from neighbouring alphabets that visitors type instead of å/ä/ö
+NORDIC_FOLDS = str.maketrans({'æ': 'ä', 'ø': 'ö', 'ß': 'ss'})
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+")
+
+# Swedish suffixes for light stemming, longest first (Snowball step 1)
+SWEDISH_SUFFIXES = (
+    "heterna", "hetens", "anden", "andes", "andet", "arens", "arnas",
+    "ernas", "heten", "heter", "ornas", "ande", "aren", "arna", "arne",
+    "aste", "ades", "erna", "erns", "orna", "ade", "are", "ast", "ens",
+    "ern", "het", "ad", "ar", "as", "at", "en", "er", "es", "or", "a", "e",
+)
+S_ENDINGS = "bcdfghjklmnoprtvy"
+MIN_STEM_LENGTH = 3
+
+STOPWORDS = frozenset("""
+och det att i en jag hon som han pa den med var sig for sa till ar men ett
+om hade de av icke mig du henne da sin nu har inte hans honom skulle hennes
+dar min man ej vid kunde nagot fran ut nar efter upp vi dem vara vad over an
+dig kan sina har ha mot alla under nagon eller allt mycket sedan ju denna
+sjalv detta at utan varit hur ingen mitt ni bli blev oss din dessa nagra deras
+blir mina samma vilken er sadan var blivit dess inom mellan sadant varfor
+varje vilka ditt vem vilket sitta sadana vart dina vars vart vara ert era
+""".split())
+
+
+def normalize_text(text):
+    """Case fold and strip diacritics so 'Företag', 'foretag' and 'FÖRETAG' match"""
+    text = unicodedata.normalize('NFC', text).casefold().translate(NORDIC_FOLDS)
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def stem(token):
+    """Strip the longest common Swedish suffix while keeping a usable stem"""
+    for suffix in SWEDISH_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+            return token[:-len(suffix)]
+    if token.endswith('s') and len(token) > MIN_STEM_LENGTH + 1 and token[-2] in S_ENDINGS:
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Normalise, split and stem text into index terms"""
+    tokens = TOKEN_PATTERN.findall(normalize_text(text))
+    return [stem(token) for token in tokens if token not in STOPWORDS]
+
+
+def build_intents_from_conversations(conversations):
+    """Turn scripted scenarios into intents: each user turn answered by the bot turns after it"""
+    intents = []
+    for conv_index, conversation in enumerate(conversations):
+        for i, (sender, message) in enumerate(conversation):
+            if sender != "user":
+                continue
+            replies = []
+            opens_booking = False
+            for next_sender, next_message in conversation[i + 1:]:
+                if next_sender == "bot":
+                    replies.append(next_message)
+                elif next_sender == "system":
+                    opens_booking = next_message == "OPEN_BOOKING_MODAL"
+                    break
+                else:
+                    break
+            if replies:
+                intents.append({
+                    "id": f"scenario{conv_index + 1}-turn{i}",
+                    "patterns": [message],
+                    "responses": replies,
+                    "opens_booking": opens_booking,
+                })
+    return intents
+
+
+def load_intent_catalogue(path):
+    """Load an intent catalogue JSON file (a list of {id, patterns, responses})"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class IntentMatcher:
+    """TF-IDF intent matcher over a CSR inverted index (term -> pattern postings)"""
+
+    def __init__(self, min_score=0.15):
+        self.min_score = min_score
+        self.intents = []
+        self.vocabulary = {}
+        self.idf = np.zeros(0, dtype=np.float32)
+        self.term_offsets = np.zeros(1, dtype=np.int64)
+        self.posting_docs = np.zeros(0, dtype=np.int32)
+        self.posting_weights = np.zeros(0, dtype=np.float32)
+        self.doc_intents = np.zeros(0, dtype=np.int32)
+        self.ready = threading.Event()
+
+    def build(self, intents):
+        """Build the inverted index from a list of intents"""
+        doc_terms = []
+        doc_intents = []
+        for intent_index, intent in enumerate(intents):
+            for pattern in intent["patterns"]:
+                doc_terms.append(Counter(tokenize(pattern)))
+                doc_intents.append(intent_index)
+
+        vocabulary = {}
+        for terms in doc_terms:
+            for term in terms:
+                vocabulary.setdefault(term, len(vocabulary))
+
+        n_docs = len(doc_terms)
+        doc_freq = np.zeros(len(vocabulary), dtype=np.float64)
+        for terms in doc_terms:
+            for term in terms:
+                doc_freq[vocabulary[term]] += 1
+        idf = np.log((1 + n_docs) / (1 + doc_freq)) + 1.0
+
+        # Collect (term, doc, weight) triples with L2-normalised document vectors
+        rows, cols, weights = [], [], []
+        for doc_index, terms in enumerate(doc_terms):
+            if not terms:
+                continue
+            term_ids = np.fromiter((vocabulary[t] for t in terms), dtype=np.int64, count=len(terms))
+            counts = np.fromiter(terms.values(), dtype=np.float64, count=len(terms))
+            vector = (1.0 + np.log(counts)) * idf[term_ids]
+            vector /= np.linalg.norm(vector)
+            rows.append(term_ids)
+            cols.append(np.full(len(terms), doc_index, dtype=np.int32))
+            weights.append(vector)
+
+        if rows:
+            rows = np.concatenate(rows)
+            cols = np.concatenate(cols)
+            weights = np.concatenate(weights)
+        else:
+            rows = np.zeros(0, dtype=np.int64)
+            cols = np.zeros(0, dtype=np.int32)
+            weights = np.zeros(0, dtype=np.float64)
+
+        order = np.argsort(rows, kind='stable')
+        self._install(
+            intents,
+            vocabulary,
+            idf.astype(np.float32),
+            np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=len(vocabulary))))).astype(np.int64),
+            cols[order],
+            weights[order].astype(np.float32),
+            np.asarray(doc_intents, dtype=np.int32),
+        )
+        return self
+
+    def build_async(self, intents, on_ready=None):
+        """Build the index on a background thread so the Tk loop never waits"""
+        def worker():
+            self.build(intents)
+            if on_ready:
+                on_ready(self)
+
+        threading.Thread(target=worker, daemon=True).start()
+        return self
+
+    def _install(self, intents, vocabulary, idf, term_offsets, posting_docs, posting_weights, doc_intents):
+        self.intents = intents
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.term_offsets = term_offsets
+        self.posting_docs = posting_docs
+        self.posting_weights = posting_weights
+        self.doc_intents = doc_intents
+        self.ready.set()
+
+    def save(self, path):
+        """Write the prebuilt index to an .npz file"""
+        terms = sorted(self.vocabulary, key=self.vocabulary.get)
+        np.savez(path,
+                 terms=np.array(terms, dtype=np.str_),
+                 idf=self.idf,
+                 term_offsets=self.term_offsets,
+                 posting_docs=self.posting_docs,
+                 posting_weights=self.posting_weights,
+                 doc_intents=self.doc_intents,
+                 intents=np.array(json.dumps(self.intents, ensure_ascii=False)))
+
+    @classmethod
+    def load(cls, path, min_score=0.15):
+        """Load an index written by save()"""
+        matcher = cls(min_score=min_score)
+        with np.load(path, allow_pickle=False) as data:
+            terms = data["terms"].tolist()
+            matcher._install(
+                json.loads(str(data["intents"])),
+                {term: i for i, term in enumerate(terms)},
+                data["idf"],
+                data["term_offsets"],
+                data["posting_docs"],
+                data["posting_weights"],
+                data["doc_intents"],
+            )
+        return matcher
+
+    def score(self, text):
+        """Return cosine scores per pattern for the query text"""
+        n_docs = len(self.doc_intents)
+        query = Counter(t for t in tokenize(text) if t in self.vocabulary)
+        if not query or not n_docs:
+            return np.zeros(n_docs, dtype=np.float32)
+
+        term_ids = np.fromiter((self.vocabulary[t] for t in query), dtype=np.int64, count=len(query))
+        counts = np.fromiter(query.values(), dtype=np.float32, count=len(query))
+        query_weights = (1.0 + np.log(counts)) * self.idf[term_ids]
+        query_weights /= np.linalg.norm(query_weights)
+
+        starts = self.term_offsets[term_ids]
+        lengths = self.term_offsets[term_ids + 1] - starts
+        # Gather every posting of every query term in one vectorized step
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        contributions = self.posting_weights[positions] * np.repeat(query_weights, lengths)
+        return np.bincount(self.posting_docs[positions], weights=contributions, minlength=n_docs)
+
+    def match(self, text):
+        """Return (intent, score) for the best match, or (None, score) below min_score"""
+        if not self.ready.is_set():
+            return None, 0.0
+        scores = self.score(text)
+        if not len(scores):
+            return None, 0.0
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+        if best_score < self.min_score:
+            return None, best_score
+        return self.intents[self.doc_intents[best]], best_score
+
+
+def main():
+    """Prebuild an index file: intent_matcher.py build OUT.npz [CATALOGUE.json]"""
+    if len(sys.argv) < 3 or sys.argv[1] != "build":
+        print("Användning: python intent_matcher.py build OUT.npz [KATALOG.json]")
+        sys.exit(1)
+
+    if len(sys.argv) > 3:
+        intents = load_intent_catalogue(sys.argv[3])
+    else:
+        from scenarios import CONVERSATIONS
+        intents = build_intents_from_conversations(CONVERSATIONS)
+
+    IntentMatcher().build(intents).save(sys.argv[2])
+    print(f"✅ Index med {len(intents)} intents sparat till {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
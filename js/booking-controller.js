@@ -282,7 +282,13 @@ class BookingController {
     }
 }
 
-// Initialize booking controller when DOM is loaded
-document.addEventListener('DOMContentLoaded', () => {
+// Initialize booking controller when DOM is loaded (or right away when loaded on demand)
+function initBookingController() {
     window.bookingController = new BookingController();
-});
\ No newline at end of file
+}
+
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', initBookingController);
+} else {
+    initBookingController();
+}
\ No newline at end of file
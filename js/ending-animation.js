@@ -161,7 +161,11 @@ style.textContent = `
 `;
 document.head.appendChild(style);
 
-// Initialize when DOM is loaded
-document.addEventListener('DOMContentLoaded', () => {
+// Initialize when DOM is loaded (or right away when loaded on demand)
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', () => {
+        new EndingAnimation();
+    });
+} else {
     new EndingAnimation();
-});
\ No newline at end of file
+}
\ No newline at end of file
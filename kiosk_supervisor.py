@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Kiosk supervisor for long-running demo screens
+Launches demo worker processes, collects heartbeats and resource metrics,
+restarts crashed workers and recycles bloated ones between conversations
+with a pre-warmed replacement so the screen never goes blank
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import threading
+import time
+from multiprocessing.connection import wait
+
+from message_stream import FRAME_MS
+
+STOP_GRACE_SECONDS = 5.0  # A stopped worker gets this long to exit before it is terminated
+
+
+class SupervisorConfig:
+    """Recycling thresholds and timing"""
+
+    def __init__(self, max_rss_mb=400, max_threads=64, max_frame_latency_ms=250,
+                 latency_strikes=5, max_uptime_hours=24.0, heartbeat_interval=2.0,
+                 heartbeat_timeout=30.0, prewarm_timeout=60.0, min_uptime_seconds=300.0):
+        self.max_rss_mb = max_rss_mb
+        self.max_threads = max_threads
+        self.max_frame_latency_ms = max_frame_latency_ms
+        self.latency_strikes = latency_strikes  # Consecutive slow heartbeats before recycling
+        self.max_uptime_hours = max_uptime_hours
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.prewarm_timeout = prewarm_timeout
+        self.min_uptime_seconds = min_uptime_seconds  # Guards against recycle storms
+
+
+def read_rss_mb():
+    """Resident set size of this process in MB"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        # Peak instead of current RSS, but better than nothing off Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def read_thread_count():
+    """OS threads of this process (Tk, PIL and Python threads alike)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('Threads:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return threading.active_count()
+
+
+class DemoWorker:
+    """Runs inside a worker process: one chatbot plus heartbeat and command handling"""
+
+    def __init__(self, conn, worker_id, geometry, prewarm, heartbeat_interval):
+        import tkinter as tk
+        from enhanced_chatbot import SuperAutomatedChatbot
+
+        self.conn = conn
+        self.worker_id = worker_id
+        self.heartbeat_interval = heartbeat_interval
+        self.draining = False
+        self.cycles = 0
+        self.latencies = []
+
+        self.root = tk.Tk()
+        self.root.configure(bg='#f0f2f5')
+        self.root.minsize(400, 500)
+        if prewarm:
+            self.root.withdraw()
+        self.chatbot = SuperAutomatedChatbot(self.root, autostart=not prewarm)
+        if geometry:
+            self.root.geometry(geometry)
+        self.chatbot.conversation_listeners.append(self.on_conversation_start)
+
+        self.expected_tick = time.monotonic() + FRAME_MS / 1000
+        self.root.after(FRAME_MS, self.frame_tick)
+        self.root.after(int(heartbeat_interval * 1000), self.heartbeat)
+        self.root.after(100, self.poll_commands)
+        self.send({"type": "ready" if prewarm else "started"})
+
+    def send(self, message):
+        message.update(id=self.worker_id, pid=os.getpid(), time=time.time())
+        try:
+            self.conn.send(message)
+        except (OSError, EOFError):
+            self.root.destroy()  # Supervisor is gone
+
+    def frame_tick(self):
+        """Measure how late the event loop runs a frame-rate timer"""
+        now = time.monotonic()
+        self.latencies.append(max(0.0, now - self.expected_tick))
+        self.expected_tick = now + FRAME_MS / 1000
+        self.root.after(FRAME_MS, self.frame_tick)
+
+    def heartbeat(self):
+        latencies, self.latencies = self.latencies, []
+        self.send({
+            "type": "heartbeat",
+            "rss_mb": round(read_rss_mb(), 1),
+            "threads": read_thread_count(),
+            "frame_latency_ms": round(max(latencies, default=0.0) * 1000, 1),
+            "frame_latency_avg_ms": round(sum(latencies) / max(len(latencies), 1) * 1000, 2),
+            "cycles": self.cycles,
+        })
+        self.root.after(int(self.heartbeat_interval * 1000), self.heartbeat)
+
+    def on_conversation_start(self, conv_index):
+        self.cycles += 1
+        if self.draining:
+            # Hold the demo at the cycle boundary until the replacement is shown
+            self.chatbot.scheduler.pause(self.chatbot.automation_task)
+            self.send({"type": "drained"})
+
+    def poll_commands(self):
+        while self.conn.poll():
+            try:
+                command = self.conn.recv()
+            except (OSError, EOFError):
+                self.root.destroy()
+                return
+            action = command.get("action")
+            if action == "show":
+                self.root.deiconify()
+                self.root.lift()
+                self.chatbot.start_super_automation()
+            elif action == "drain":
+                self.draining = True
+            elif action == "stop":
+                self.root.destroy()
+                return
+        self.root.after(100, self.poll_commands)
+
+    def run(self):
+        self.root.mainloop()
+
+
+def worker_main(conn, worker_id, geometry=None, prewarm=False, heartbeat_interval=2.0):
+    """Process entry point for one demo worker"""
+    DemoWorker(conn, worker_id, geometry, prewarm, heartbeat_interval).run()
+
+
+class WorkerHandle:
+    """Supervisor-side state of one worker process"""
+
+    def __init__(self, process, conn, slot, prewarm):
+        self.process = process
+        self.conn = conn
+        self.slot = slot
+        self.started = time.monotonic()
+        self.last_heartbeat = time.monotonic()
+        self.ready = not prewarm
+        self.metrics = {}
+        self.latency_strikes = 0
+        self.replacement = None
+        self.recycle_reason = None
+        self.drained = False
+
+
+class Supervisor:
+    """Keeps one demo worker alive per screen slot"""
+
+    def __init__(self, slots, config=None):
+        self.slots = slots  # One geometry (or None) per screen
+        self.config = config or SupervisorConfig()
+        self.context = multiprocessing.get_context('spawn')
+        self.workers = {}  # slot -> active WorkerHandle
+        self.retired = []  # (process, kill-after time) of stopped workers not yet reaped
+        self.next_id = 0
+        self.running = True
+
+    def launch(self, slot, prewarm=False):
+        parent_conn, child_conn = self.context.Pipe()
+        self.next_id += 1
+        process = self.context.Process(
+            target=worker_main,
+            args=(child_conn, self.next_id, self.slots[slot], prewarm, self.config.heartbeat_interval),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        print(f"🚀 Startade demo-arbetare {self.next_id} (pid {process.pid}) för skärm {slot + 1}"
+              + (" (förvärmd)" if prewarm else ""))
+        return WorkerHandle(process, parent_conn, slot, prewarm)
+
+    def handles(self):
+        for worker in list(self.workers.values()):
+            yield worker
+            if worker.replacement:
+                yield worker.replacement
+
+    def run(self):
+        for slot in range(len(self.slots)):
+            self.workers[slot] = self.launch(slot)
+        try:
+            while self.running:
+                connections = {worker.conn: worker for worker in self.handles()}
+                for conn in wait(list(connections), timeout=1.0):
+                    self.receive(connections[conn])
+                self.check_health()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def receive(self, worker):
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):
+            return  # Exit is noticed by check_health
+        kind = message["type"]
+        worker.last_heartbeat = time.monotonic()
+        if kind == "heartbeat":
+            worker.metrics = message
+            self.check_thresholds(worker)
+        elif kind == "ready":
+            worker.ready = True
+        elif kind == "drained":
+            worker.drained = True
+        self.try_swap(self.workers[worker.slot])
+
+    def check_thresholds(self, worker):
+        if worker.recycle_reason or worker is not self.workers.get(worker.slot):
+            return
+        if time.monotonic() - worker.started < self.config.min_uptime_seconds:
+            return
+        config = self.config
+        metrics = worker.metrics
+        if metrics["frame_latency_ms"] > config.max_frame_latency_ms:
+            worker.latency_strikes += 1
+        else:
+            worker.latency_strikes = 0
+
+        reason = None
+        if metrics["rss_mb"] > config.max_rss_mb:
+            reason = f"minne {metrics['rss_mb']} MB"
+        elif metrics["threads"] > config.max_threads:
+            reason = f"{metrics['threads']} trådar"
+        elif worker.latency_strikes >= config.latency_strikes:
+            reason = f"bildfördröjning {metrics['frame_latency_ms']} ms"
+        elif time.monotonic() - worker.started > config.max_uptime_hours * 3600:
+            reason = "maximal drifttid"
+        if reason:
+            self.begin_recycle(worker, reason)
+
+    def begin_recycle(self, worker, reason):
+        """Pre-warm a hidden replacement, then drain the old worker at its next cycle boundary"""
+        print(f"♻️ Återvinner arbetare på skärm {worker.slot + 1}: {reason}")
+        worker.recycle_reason = reason
+        worker.replacement = self.launch(worker.slot, prewarm=True)
+        worker.conn.send({"action": "drain"})
+
+    def try_swap(self, worker):
+        """Show the replacement once the old worker sits at a cycle boundary"""
+        replacement = worker.replacement
+        if not (worker.drained and replacement):
+            return
+        # Keep the old screen up until the replacement has built its UI
+        waited = time.monotonic() - replacement.started
+        if not replacement.ready and waited < self.config.prewarm_timeout:
+            return
+
+        replacement.conn.send({"action": "show"})
+        self.workers[worker.slot] = replacement
+        self.retire(worker)
+
+    def retire(self, worker):
+        """Ask a worker to stop and close its pipe; check_health reaps the process"""
+        try:
+            worker.conn.send({"action": "stop"})
+        except OSError:
+            pass
+        worker.conn.close()
+        self.retired.append((worker.process, time.monotonic() + STOP_GRACE_SECONDS))
+
+    def reap(self):
+        """Collect exited workers without blocking the loop; terminate, then kill, stragglers"""
+        waiting = []
+        for process, deadline in self.retired:
+            if not process.is_alive():
+                process.join()
+                process.close()
+                continue
+            if time.monotonic() >= deadline:
+                process.terminate()  # Repeated every round until it is gone
+            waiting.append((process, deadline))
+        self.retired = waiting
+
+    def check_health(self):
+        self.reap()
+        for slot in list(self.workers):
+            worker = self.workers[slot]
+            replacement = worker.replacement
+            if replacement and not replacement.process.is_alive():
+                print(f"❌ Förvärmd ersättare för skärm {slot + 1} avslutades - försöker igen")
+                self.retire(replacement)
+                worker.replacement = self.launch(slot, prewarm=True)
+            self.try_swap(worker)
+            worker = self.workers[slot]
+
+            silent = time.monotonic() - worker.last_heartbeat
+            if not worker.process.is_alive() or silent > self.config.heartbeat_timeout:
+                reason = "avslutades" if not worker.process.is_alive() else f"tyst i {silent:.0f} s"
+                print(f"❌ Arbetare på skärm {slot + 1} {reason} - startar om")
+                if worker.process.is_alive():
+                    worker.process.kill()
+                self.retire(worker)
+                if worker.replacement and worker.replacement.process.is_alive():
+                    # A pre-warmed replacement is already waiting
+                    worker.replacement.conn.send({"action": "show"})
+                    self.workers[slot] = worker.replacement
+                else:
+                    self.workers[slot] = self.launch(slot)
+
+    def shutdown(self):
+        for worker in self.handles():
+            try:
+                worker.conn.send({"action": "stop"})
+            except OSError:
+                pass
+        processes = [worker.process for worker in self.handles()] + [process for process, _ in self.retired]
+        for process in processes:
+            process.join(timeout=STOP_GRACE_SECONDS)
+            if process.is_alive():
+                process.terminate()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Övervakare för Axie Studio-kioskdemo")
+    parser.add_argument("--workers", type=int, default=1, help="antal demo-fönster/processer")
+    parser.add_argument("--geometry", action="append", help="fönstergeometri WxH+X+Y, en per arbetare")
+    parser.add_argument("--max-rss-mb", type=float, default=400)
+    parser.add_argument("--max-threads", type=int, default=64)
+    parser.add_argument("--max-frame-latency-ms", type=float, default=250)
+    parser.add_argument("--max-uptime-hours", type=float, default=24.0)
+    parser.add_argument("--heartbeat", type=float, default=2.0, help="sekunder mellan hjärtslag")
+    args = parser.parse_args(argv)
+
+    geometries = args.geometry or []
+    slots = [geometries[i] if i < len(geometries) else None for i in range(args.workers)]
+    config = SupervisorConfig(max_rss_mb=args.max_rss_mb,
+                              max_threads=args.max_threads,
+                              max_frame_latency_ms=args.max_frame_latency_ms,
+                              max_uptime_hours=args.max_uptime_hours,
+                              heartbeat_interval=args.heartbeat)
+    Supervisor(slots, config).run()
+
+
+if __name__ == "__main__":
+    main()
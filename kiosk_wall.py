@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Kiosk wall mode: one process driving several demo screens
+Every screen is a Toplevel running its own SuperAutomatedChatbot, sharing
+fonts, images, compiled scenarios and a single demo scheduler
+"""
+
+import argparse
+import tkinter as tk
+
+from enhanced_chatbot import SuperAutomatedChatbot
+from shared_assets import SharedAssets
+from demo_scheduler import DemoScheduler
+
+# Seconds between the start of neighbouring screens
+STAGGER_SECONDS = 1.5
+
+
+def tile_geometries(root, screens):
+    """Split the (multi-monitor) X screen into one full-height column per screen"""
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+    width = screen_width // screens
+    return [f"{width}x{screen_height}+{i * width}+0" for i in range(screens)]
+
+
+class KioskWall:
+    """Hosts N chat windows on one Tk interpreter"""
+
+    def __init__(self, root, screens, geometries=None, intent_index=None):
+        self.root = root
+        self.assets = SharedAssets(root, intent_index_path=intent_index)
+        self.scheduler = DemoScheduler(root)
+        self.windows = []
+        self.chatbots = []
+
+        geometries = geometries or tile_geometries(root, screens)
+        scenario_count = len(self.assets.conversations)
+        for i in range(screens):
+            window = tk.Toplevel(root)
+            window.configure(bg='#f0f2f5')
+            window.minsize(400, 500)
+            chatbot = SuperAutomatedChatbot(window,
+                                            assets=self.assets,
+                                            scheduler=self.scheduler,
+                                            start_offset=i % scenario_count,
+                                            start_delay=i * STAGGER_SECONDS)
+            # Geometry after construction, which centers the window by default
+            window.geometry(geometries[i % len(geometries)])
+            window.protocol("WM_DELETE_WINDOW", self.close)
+            self.windows.append(window)
+            self.chatbots.append(chatbot)
+
+    def close(self):
+        self.root.destroy()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Axie Studio kiosk wall")
+    parser.add_argument("--screens", type=int, default=4, help="antal skärmar (fönster)")
+    parser.add_argument("--geometry", action="append",
+                        help="fönstergeometri WxH+X+Y, en per skärm (standard: kolumner)")
+    parser.add_argument("--intents", metavar="FIL",
+                        help="förbyggt intent-index (python intent_matcher.py build FIL)")
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    root.withdraw()  # Only the Toplevels are shown
+    KioskWall(root, args.screens, args.geometry, args.intents)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Streaming text support for chat bubbles
+Consumes sync or async chunk iterators off the Tk thread and exposes the
+accumulated text so the UI can repaint at most once per frame
+"""
+
+import asyncio
+import threading
+import time
+
+# Frame interval for stream repaints (~60 fps)
+FRAME_MS = 16
+
+
+class StreamStats:
+    """Timing for one streamed message (all times from time.monotonic)"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.first_chunk = None
+        self.first_visible = None
+        self.finished = None
+        self.chunks = 0
+        self.characters = 0
+        self.repaints = 0
+
+    @property
+    def time_to_first_token(self):
+        return None if self.first_chunk is None else self.first_chunk - self.started
+
+    @property
+    def time_to_first_visible(self):
+        return None if self.first_visible is None else self.first_visible - self.started
+
+    @property
+    def duration(self):
+        return None if self.finished is None else self.finished - self.started
+
+    def as_dict(self):
+        return {
+            "ttft": self.time_to_first_token,
+            "ttfv": self.time_to_first_visible,
+            "duration": self.duration,
+            "chunks": self.chunks,
+            "characters": self.characters,
+            "repaints": self.repaints,
+        }
+
+
+class ChunkPump:
+    """Reads a chunk iterator on a worker thread into a shared text buffer"""
+
+    def __init__(self, chunks, stats=None):
+        self.chunks = chunks
+        self.stats = stats or StreamStats()
+        self.parts = []
+        self.version = 0
+        self.done = False
+        self.error = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def _run(self):
+        try:
+            if hasattr(self.chunks, '__aiter__'):
+                asyncio.run(self._consume_async())
+            else:
+                for chunk in self.chunks:
+                    self._append(chunk)
+        except Exception as e:
+            self.error = e
+            print(f"⚠️ Strömningen avbröts: {e}")
+        finally:
+            self.done = True
+
+    async def _consume_async(self):
+        async for chunk in self.chunks:
+            self._append(chunk)
+
+    def _append(self, chunk):
+        if not chunk:
+            return
+        with self.lock:
+            if self.stats.first_chunk is None:
+                self.stats.first_chunk = time.monotonic()
+            self.parts.append(chunk)
+            self.stats.chunks += 1
+            self.stats.characters += len(chunk)
+            self.version += 1
+
+    def snapshot(self):
+        """Return (version, text) of everything received so far"""
+        with self.lock:
+            if len(self.parts) > 1:
+                self.parts[:] = [''.join(self.parts)]
+            return self.version, self.parts[0] if self.parts else ''
@@ -0,0 +1,197 @@
+"""
+NumPy particle effects for Tk canvases
+Particle state lives in parallel NumPy arrays updated in bulk every frame;
+a fixed pool of canvas polygons is moved with one Tcl call per frame, and
+the number of live particles adapts to a frame-time budget
+"""
+
+import math
+import time
+import tkinter as tk
+
+import numpy as np
+
+from message_stream import FRAME_MS
+
+# Same palette as the confetti of js/ending-animation.js
+CONFETTI_COLORS = ('#ff6b35', '#f7931e', '#ffd700', '#00cc66', '#0066cc')
+
+# Tcl lambdas: a whole frame of canvas updates per call instead of one call per item
+TCL_MOVE = "{w data} {foreach {id a b c d e f g h} $data {$w coords $id $a $b $c $d $e $f $g $h}}"
+TCL_SHOW = "{w data} {foreach {id colour} $data {$w itemconfigure $id -fill $colour -state normal}}"
+TCL_HIDE = "{w ids} {foreach id $ids {$w itemconfigure $id -state hidden}}"
+
+# Corners of a unit rectangle, rotated and scaled per particle
+CORNERS = np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]])
+
+
+class ParticleSystem:
+    """Confetti on a canvas: bulk physics in NumPy, drawing through a reused item pool"""
+
+    def __init__(self, canvas, capacity=3000, budget_ms=8.0, gravity=420.0, drag=1.1, seed=None):
+        self.canvas = canvas
+        self.capacity = capacity
+        self.budget_ms = budget_ms
+        self.gravity = gravity
+        self.drag = drag
+        self.random = np.random.default_rng(seed)
+
+        # Particle state, one row per pool slot
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.angle = np.zeros(capacity)      # Rotation in the canvas plane
+        self.spin = np.zeros(capacity)
+        self.tilt = np.zeros(capacity)       # Rotation out of the plane: the flutter
+        self.tilt_speed = np.zeros(capacity)
+        self.size = np.zeros((capacity, 2))
+        self.colour = np.zeros(capacity, dtype=np.int8)
+        self.age = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        # Canvas polygon per slot, created the first time the slot is used and only hidden after
+        self.items = np.zeros(capacity, dtype=np.int64)
+        self.limit = min(capacity, 400)  # Live particles the frame budget currently allows
+        self.emitters = []
+        self.timer = None
+        self.last_frame = None
+        self.on_done = None
+        self.stats = {"frames": 0, "peak": 0, "frame_ms": 0.0, "over_budget": 0}
+
+    def emit(self, count, x, y, width=0.0, speed=(150.0, 450.0), direction=-math.pi / 2, spread=math.pi / 3,
+             life=(2.5, 4.0), size=(6.0, 12.0)):
+        """Launch up to count particles from the line x..x+width at y, within the frame budget"""
+        free = np.flatnonzero(~self.alive)[:max(0, min(count, self.limit - int(self.alive.sum())))]
+        n = len(free)
+        if not n:
+            return 0
+        rng = self.random
+        heading = direction + rng.uniform(-spread / 2, spread / 2, n)
+        velocity = rng.uniform(*speed, n)
+        self.position[free, 0] = x + rng.uniform(0, width, n)
+        self.position[free, 1] = y
+        self.velocity[free, 0] = np.cos(heading) * velocity
+        self.velocity[free, 1] = np.sin(heading) * velocity
+        self.angle[free] = rng.uniform(0, 2 * math.pi, n)
+        self.spin[free] = rng.uniform(-6, 6, n)
+        self.tilt[free] = rng.uniform(0, 2 * math.pi, n)
+        self.tilt_speed[free] = rng.uniform(4, 12, n)
+        self.size[free, 0] = rng.uniform(*size, n)
+        self.size[free, 1] = self.size[free, 0] * rng.uniform(0.4, 0.7, n)
+        self.colour[free] = rng.integers(0, len(CONFETTI_COLORS), n)
+        self.age[free] = 0.0
+        self.life[free] = rng.uniform(*life, n)
+        self.alive[free] = True
+
+        new = free[self.items[free] == 0]
+        for slot in new:
+            self.items[slot] = self.canvas.create_polygon(0, 0, 0, 0, 0, 0, 0, 0, outline='', state='hidden')
+        data = " ".join(f"{item} {CONFETTI_COLORS[colour]}"
+                        for item, colour in zip(self.items[free].tolist(), self.colour[free].tolist()))
+        self.canvas.tk.call("apply", TCL_SHOW, str(self.canvas), data)
+        return n
+
+    def burst(self, duration=1.5, rate=900.0, **options):
+        """Keep emitting rate particles per second for duration seconds (options as for emit)"""
+        self.emitters.append({"until": time.monotonic() + duration, "rate": rate, "carry": 0.0,
+                              "options": options})
+        self.start()
+
+    def start(self, on_done=None):
+        if on_done:
+            self.on_done = on_done
+        if self.timer is None:
+            self.last_frame = time.monotonic()
+            self.timer = self.canvas.after(FRAME_MS, self.frame)
+
+    def stop(self):
+        if self.timer is not None:
+            self.canvas.after_cancel(self.timer)
+            self.timer = None
+
+    def step(self, dt):
+        """Advance the particles by dt seconds in one pass of whole-array operations"""
+        # Free slots are updated too: cheaper than gathering the live rows, and never drawn
+        self.velocity[:, 1] += self.gravity * dt
+        self.velocity[:, 0] += np.sin(self.tilt) * 60.0 * dt  # Sway as the confetti tumbles
+        self.velocity *= max(0.0, 1.0 - self.drag * dt)
+        self.position += self.velocity * dt
+        self.angle += self.spin * dt
+        self.tilt += self.tilt_speed * dt
+        self.age += dt
+
+        height = self.canvas.winfo_height()
+        dead = self.alive & ((self.age >= self.life) | (self.position[:, 1] > height + 20))
+        if dead.any():
+            self.alive &= ~dead
+            self.canvas.tk.call("apply", TCL_HIDE, str(self.canvas),
+                                " ".join(map(str, self.items[dead].tolist())))
+
+    def draw(self):
+        """Move the pool items of the live particles to their rotated, fluttering rectangles"""
+        live = np.flatnonzero(self.alive)
+        if not len(live):
+            return
+        cos, sin = np.cos(self.angle[live]), np.sin(self.angle[live])
+        width = self.size[live, 0]
+        height = self.size[live, 1] * np.abs(np.cos(self.tilt[live]))  # Edge-on when tilted 90°
+        local_x = CORNERS[:, 0] * width[:, None]
+        local_y = CORNERS[:, 1] * height[:, None]
+        corners = np.empty((len(live), 4, 2))
+        corners[:, :, 0] = self.position[live, 0, None] + local_x * cos[:, None] - local_y * sin[:, None]
+        corners[:, :, 1] = self.position[live, 1, None] + local_x * sin[:, None] + local_y * cos[:, None]
+        rows = np.empty((len(live), 9), dtype=np.int64)
+        rows[:, 0] = self.items[live]
+        rows[:, 1:] = np.rint(corners.reshape(len(live), 8))
+        self.canvas.tk.call("apply", TCL_MOVE, str(self.canvas), " ".join(map(str, rows.ravel().tolist())))
+
+    def frame(self):
+        self.timer = None
+        try:
+            started = time.monotonic()
+            dt = min(started - self.last_frame, 0.05)  # A stalled loop must not teleport the confetti
+            self.last_frame = started
+
+            for emitter in list(self.emitters):
+                emitter["carry"] += emitter["rate"] * dt
+                launched = int(emitter["carry"])
+                emitter["carry"] -= launched
+                if launched:
+                    self.emit(launched, **emitter["options"])
+                if started >= emitter["until"]:
+                    self.emitters.remove(emitter)
+
+            self.step(dt)
+            self.draw()
+        except tk.TclError:
+            # The canvas went away with its window
+            self.emitters = []
+            self.alive[:] = False
+            return
+
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self.adapt(elapsed_ms)
+        if self.alive.any() or self.emitters:
+            self.timer = self.canvas.after(max(1, FRAME_MS - int(elapsed_ms)), self.frame)
+        elif self.on_done:
+            self.on_done(self)
+
+    def adapt(self, elapsed_ms):
+        """Shrink the particle limit when a frame ran over budget, grow it back when there is room"""
+        live = int(self.alive.sum())
+        stats = self.stats
+        stats["frames"] += 1
+        stats["peak"] = max(stats["peak"], live)
+        stats["frame_ms"] += (elapsed_ms - stats["frame_ms"]) * 0.1
+        if elapsed_ms > self.budget_ms:
+            stats["over_budget"] += 1
+            self.limit = max(50, int(self.limit * 0.85))
+            if live > self.limit:
+                # Drop the particles closest to the end of their life first
+                remaining = (self.life - self.age) + np.where(self.alive, 0.0, np.inf)
+                culled = np.argsort(remaining)[:live - self.limit]
+                self.alive[culled] = False
+                self.canvas.tk.call("apply", TCL_HIDE, str(self.canvas),
+                                    " ".join(map(str, self.items[culled].tolist())))
+        elif elapsed_ms < self.budget_ms * 0.6 and live >= self.limit * 0.9:
+            self.limit = min(self.capacity, int(self.limit * 1.1) + 1)
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Persistent call reminders for booked consultations
+Confirmed bookings get a reminder shortly before the meeting; pending reminders
+sit in a hierarchical timer wheel (O(1) insert and cancel) driven by a single
+thread, and every change is journalled so a restart rebuilds them in one pass
+"""
+
+import argparse
+import atexit
+import itertools
+import json
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # No flock: the one process using the directory owns it
+    fcntl = None
+
+JOURNAL = "reminders.journal"
+OWNER_LOCK = "reminders.lock"
+RECORD = struct.Struct("<IIBQd")   # payload length, crc32, kind, reminder id, due (epoch s)
+ADD, CANCEL, FIRED = 1, 2, 3
+
+LEAD_SECONDS = 5 * 60        # "Vi ringer 5 minuter före mötet"
+TICK = 1.0                   # Wheel resolution in seconds
+WHEEL_BITS = (8, 6, 6, 6, 6)  # 256 one-tick slots, then 64 slots per level (~136 years in all)
+JUMP_TICKS = 1 << 14         # Further behind than this (suspend, clock step): re-sort instead of ticking
+OWNER_RETRY = 5.0            # Seconds between attempts to take over from another process
+COMPACT_MIN = 10000          # Dead journal records before compaction is considered
+MAX_ATTEMPTS = 3
+RETRY_SECONDS = 60
+
+
+class Reminder:
+    """One pending reminder; the payload stays undecoded until it fires"""
+
+    __slots__ = ("id", "due", "tick", "payload", "slot", "attempts")
+
+    def __init__(self, reminder_id, due, payload):
+        self.id = reminder_id
+        self.due = due
+        self.tick = int(due // TICK)
+        self.payload = payload
+        self.slot = None
+        self.attempts = 0
+
+
+class TimerWheel:
+    """Hierarchical timing wheel over whole ticks (Varghese & Lauck, as in the classic Linux timers)"""
+
+    def __init__(self, now_tick):
+        self.current = now_tick
+        self.levels = [[{} for _ in range(1 << bits)] for bits in WHEEL_BITS]
+        self.shifts = list(itertools.accumulate((0,) + WHEEL_BITS[:-1]))
+        self.expired = {}  # Inserted at or before the current tick: fire on the next advance
+        self.count = 0
+
+    def insert(self, item):
+        if item.tick <= self.current:
+            self.expired[item.id] = item
+            item.slot = self.expired
+            self.count += 1
+        else:
+            self._place(item)
+
+    def _place(self, item):
+        delta = item.tick - self.current
+        for level, (shift, bits) in enumerate(zip(self.shifts, WHEEL_BITS)):
+            span = 1 << (shift + bits)
+            if delta < span or level == len(WHEEL_BITS) - 1:
+                # Beyond the last level: park in its furthest slot and re-sort when it cascades
+                tick = item.tick if delta < span else self.current + span - 1
+                slot = self.levels[level][(tick >> shift) & ((1 << bits) - 1)]
+                break
+        slot[item.id] = item
+        item.slot = slot
+        self.count += 1
+
+    def remove(self, item):
+        if item.slot is not None:
+            del item.slot[item.id]
+            item.slot = None
+            self.count -= 1
+
+    def items(self):
+        for slot in itertools.chain([self.expired], *self.levels):
+            yield from slot.values()
+
+    def advance(self, to_tick):
+        """Move time forward to to_tick and return the items that became due"""
+        if to_tick - self.current > JUMP_TICKS:
+            items = list(self.items())
+            self.__init__(to_tick)
+            for item in items:
+                self.insert(item)
+        fired = list(self.expired.values())
+        self.expired.clear()
+
+        while self.current < to_tick:
+            self.current += 1
+            tick = self.current
+            # Entering a new block of a level moves its slot down; lower levels first
+            for level in range(1, len(WHEEL_BITS)):
+                if tick & ((1 << self.shifts[level]) - 1):
+                    break
+                slot = self.levels[level][(tick >> self.shifts[level]) & ((1 << WHEEL_BITS[level]) - 1)]
+                if slot:
+                    items = list(slot.values())
+                    slot.clear()
+                    self.count -= len(items)
+                    for item in items:
+                        self._place(item)
+            slot = self.levels[0][tick & ((1 << WHEEL_BITS[0]) - 1)]
+            if slot:
+                fired.extend(slot.values())
+                slot.clear()
+
+        for item in fired:
+            item.slot = None
+        self.count -= len(fired)
+        return fired
+
+
+class Notifier:
+    """Base class for reminder delivery (staff console, HTTP service, test stubs)"""
+
+    def notify(self, reminder):
+        """Deliver one due reminder: dict with id, due and the booking fields; raise to retry"""
+        raise NotImplementedError
+
+
+class ConsoleNotifier(Notifier):
+    """Prints the call to make on the console of the kiosk host"""
+
+    def notify(self, reminder):
+        meeting = reminder.get("meeting", "")[11:16]
+        print(f"📞 Påminnelse: ring {reminder.get('name') or '?'} ({reminder.get('phone') or reminder.get('email')}) "
+              f"- möte {meeting}, {reminder.get('company') or ''}".rstrip(", "))
+
+
+class HTTPNotifier(Notifier):
+    """Posts the reminder to a paging or CRM webhook"""
+
+    def __init__(self, url, timeout=10.0, headers=None):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+    def notify(self, reminder):
+        self.session.post(self.url, json=reminder, timeout=self.timeout).raise_for_status()
+
+
+class RecordingNotifier(Notifier):
+    """Local stand-in that only collects delivered reminders (tests, dry runs)"""
+
+    def __init__(self):
+        self.delivered = []
+
+    def notify(self, reminder):
+        self.delivered.append(reminder)
+
+
+def encode_record(kind, reminder_id, due, payload=b""):
+    header = struct.pack("<BQd", kind, reminder_id, due)
+    return RECORD.pack(len(payload), zlib.crc32(header + payload), kind, reminder_id, due) + payload
+
+
+def decode_records(data):
+    """(kind, id, due, payload) of the complete records in data, and the bytes they took"""
+    records, offset = [], 0
+    while offset + RECORD.size <= len(data):
+        length, crc, kind, reminder_id, due = RECORD.unpack_from(data, offset)
+        end = offset + RECORD.size + length
+        if end > len(data):
+            break
+        payload = data[offset + RECORD.size:end]
+        if zlib.crc32(payload, zlib.crc32(data[offset + 8:offset + RECORD.size])) != crc:
+            break  # Torn tail of a crashed writer: everything after it is unreadable
+        records.append((kind, reminder_id, due, payload))
+        offset = end
+    return records, offset
+
+
+def append_records(path, data):
+    """Append under an exclusive lock, following the journal if it was compacted meanwhile"""
+    while True:
+        with open(path, "ab") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                if os.fstat(f.fileno()).st_ino != os.stat(path).st_ino:
+                    continue  # Replaced by a compaction while we waited
+            f.write(data)
+            return
+
+
+class ReminderScheduler:
+    """Journalled reminders for one directory, fired by whichever process holds its lock"""
+
+    def __init__(self, directory, notifier=None):
+        self.directory = directory
+        self.notifier = notifier or ConsoleNotifier()
+        self.path = os.path.join(directory, JOURNAL)
+        os.makedirs(directory, exist_ok=True)
+        open(self.path, "ab").close()
+
+        self.lock_file = None
+        self.owner = False
+        self.reminders = {}
+        self.wheel = None
+        self.offset = 0
+        self.dead = 0
+        self.stats = {"added": 0, "fired": 0, "failed": 0, "rebuild_ms": 0.0}
+
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="reminders", daemon=True)
+        self.thread.start()
+
+    def add(self, due, payload):
+        """Schedule a reminder at due (epoch seconds) from any thread or process; returns its id"""
+        reminder_id = uuid.uuid4().int >> 64
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        append_records(self.path, encode_record(ADD, reminder_id, due, data))
+        self.stats["added"] += 1
+        self.wakeup.set()
+        return reminder_id
+
+    def cancel(self, reminder_id):
+        append_records(self.path, encode_record(CANCEL, reminder_id, 0.0))
+        self.wakeup.set()
+
+    def pending(self):
+        return len(self.reminders)
+
+    def _run(self):
+        while not self.closed:
+            if not self.owner:
+                self._try_take_ownership()
+            if self.owner:
+                try:
+                    self._read_journal()
+                    for reminder in self.wheel.advance(int(time.time() // TICK)):
+                        self._fire(reminder)
+                    if self.dead > max(COMPACT_MIN, len(self.reminders)):
+                        self._compact()
+                except OSError as e:
+                    print(f"⚠️ Påminnelsejournalen kunde inte läsas: {e}")
+            self.wakeup.wait(TICK if self.owner else OWNER_RETRY)
+            self.wakeup.clear()
+
+    def _try_take_ownership(self):
+        if fcntl:
+            if self.lock_file is None:
+                self.lock_file = open(os.path.join(self.directory, OWNER_LOCK), "a")
+            try:
+                fcntl.flock(self.lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return  # Another demo process fires the reminders
+        started = time.perf_counter()
+        self.reminders = {}
+        self.wheel = TimerWheel(int(time.time() // TICK))
+        self.offset = 0
+        self.dead = 0
+        self._read_journal(repair=True)
+        self.stats["rebuild_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self.owner = True
+
+    def _read_journal(self, repair=False):
+        with open(self.path, "r+b" if repair else "rb") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX if repair else fcntl.LOCK_SH)
+            f.seek(self.offset)
+            data = f.read()
+            records, used = decode_records(data)
+            self.offset += used
+            if repair and used < len(data):
+                # A writer died mid-record: cut it off so later appends stay readable
+                f.truncate(self.offset)
+        for kind, reminder_id, due, payload in records:
+            self._apply(kind, reminder_id, due, payload)
+
+    def _apply(self, kind, reminder_id, due, payload):
+        old = self.reminders.pop(reminder_id, None)
+        if old is not None:
+            self.wheel.remove(old)
+            self.dead += 1
+        if kind == ADD:
+            reminder = Reminder(reminder_id, due, payload)
+            if old is not None:
+                reminder.attempts = old.attempts
+            self.reminders[reminder_id] = reminder
+            self.wheel.insert(reminder)
+        else:
+            self.dead += 1
+
+    def _fire(self, reminder):
+        self.reminders.pop(reminder.id, None)
+        message = dict(json.loads(reminder.payload), id=f"{reminder.id:016x}", due=reminder.due)
+        try:
+            self.notifier.notify(message)
+        except Exception as e:
+            reminder.attempts += 1
+            self.stats["failed"] += 1
+            if reminder.attempts < MAX_ATTEMPTS:
+                print(f"⚠️ Påminnelse {message['id']} misslyckades ({e}), nytt försök om {RETRY_SECONDS} s")
+                reminder.due = time.time() + RETRY_SECONDS
+                reminder.tick = int(reminder.due // TICK)
+                self.reminders[reminder.id] = reminder
+                self.wheel.insert(reminder)
+                append_records(self.path, encode_record(ADD, reminder.id, reminder.due, reminder.payload))
+                return
+            print(f"❌ Påminnelse {message['id']} gav upp efter {MAX_ATTEMPTS} försök: {e}")
+        else:
+            self.stats["fired"] += 1
+        append_records(self.path, encode_record(FIRED, reminder.id, reminder.due))
+
+    def _compact(self):
+        """Rewrite the journal with only the pending reminders"""
+        with open(self.path, "rb") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)  # Writers wait, then follow the new file
+            f.seek(self.offset)
+            records, _used = decode_records(f.read())
+            for record in records:
+                self._apply(*record)
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as out:
+                out.write(b"".join(encode_record(ADD, r.id, r.due, r.payload) for r in self.reminders.values()))
+                self.offset = out.tell()
+            os.replace(tmp, self.path)
+        self.dead = 0
+
+    def close(self):
+        self.closed = True
+        self.wakeup.set()
+        self.thread.join(2.0)
+        if self.lock_file:
+            self.lock_file.close()
+
+
+def read_journal(directory):
+    """Pending reminders of a directory as {id: (due, payload dict)}, without taking ownership"""
+    with open(os.path.join(directory, JOURNAL), "rb") as f:
+        records, _used = decode_records(f.read())
+    pending = {}
+    for kind, reminder_id, due, payload in records:
+        if kind == ADD:
+            pending[reminder_id] = (due, json.loads(payload))
+        else:
+            pending.pop(reminder_id, None)
+    return pending
+
+
+REMINDER_DIR = os.path.join(os.path.expanduser("~"), ".local", "share", "axie-studio", "reminders")
+
+_scheduler = None
+_configured = False
+
+
+def configure_reminders(directory, notifier=None):
+    """Keep reminders of this process in directory (None or "" turns them off)"""
+    global _scheduler, _configured
+    if _scheduler:
+        _scheduler.close()
+    _scheduler = ReminderScheduler(directory, notifier) if directory else None
+    _configured = True
+    if _scheduler:
+        atexit.register(_scheduler.close)
+    return _scheduler
+
+
+def get_reminders():
+    """The process reminder scheduler; AXIE_REMINDER_DIR moves it and AXIE_REMINDER_URL posts reminders"""
+    if not _configured:
+        url = os.environ.get("AXIE_REMINDER_URL")
+        configure_reminders(os.environ.get("AXIE_REMINDER_DIR", REMINDER_DIR),
+                            HTTPNotifier(url) if url else None)
+    return _scheduler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Visa och avboka väntande samtalspåminnelser")
+    parser.add_argument("command", choices=["list", "cancel"])
+    parser.add_argument("id", nargs="?", help="påminnelsens id (för cancel)")
+    parser.add_argument("--dir", default=os.environ.get("AXIE_REMINDER_DIR") or REMINDER_DIR,
+                        help="påminnelsekatalog")
+    args = parser.parse_args(argv)
+
+    if args.command == "cancel":
+        if not args.id:
+            parser.error("cancel kräver ett id")
+        append_records(os.path.join(args.dir, JOURNAL), encode_record(CANCEL, int(args.id, 16), 0.0))
+        print(f"✅ Påminnelse {args.id} avbokad")
+        return
+
+    pending = read_journal(args.dir)
+    print(f"⏰ {len(pending)} väntande påminnelser")
+    for reminder_id, (due, payload) in sorted(pending.items(), key=lambda item: item[1][0])[:50]:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(due))
+        print(f"  {reminder_id:016x}  {when}  {payload.get('name')}  {payload.get('phone') or payload.get('email')}")
+
+
+if __name__ == "__main__":
+    main()
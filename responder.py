@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Pluggable responder backends for live bot replies
+Runs generators on a background executor with an LRU+TTL response cache,
+in-flight request coalescing, per-request timeouts and scripted fallback
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+
+import requests
+
+from intent_matcher import normalize_text
+
+WHITESPACE = re.compile(r"\s+")
+
+# How many previous messages take part in the cache key
+CONTEXT_WINDOW = 4
+
+
+def normalize_prompt(text):
+    """Normalise a prompt so trivially different kiosk questions share a cache entry"""
+    return WHITESPACE.sub(" ", normalize_text(text)).strip(" .!?")
+
+
+class Responder:
+    """Base class for reply generators (local model servers, HTTP services, stubs)"""
+
+    def generate(self, prompt, context):
+        """Return the reply text for prompt given [(sender, text), ...] context"""
+        raise NotImplementedError
+
+    def stream(self, prompt, context):
+        """Yield the reply in chunks; backends that cannot stream yield it whole"""
+        reply = self.generate(prompt, context)
+        if reply:
+            yield reply
+
+
+class IntentResponder(Responder):
+    """Local stand-in backend that answers from the scenario intent index"""
+
+    def __init__(self, matcher, delay=0.0):
+        self.matcher = matcher
+        self.delay = delay
+
+    def generate(self, prompt, context):
+        if self.delay:
+            time.sleep(self.delay)
+        intent, score = self.matcher.match(prompt)
+        if not intent:
+            return None
+        return "\n\n".join(intent["responses"])
+
+
+class HTTPResponder(Responder):
+    """Backend that posts the prompt to an HTTP generator service"""
+
+    def __init__(self, url, timeout=10.0, headers=None):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+
+    def generate(self, prompt, context):
+        response = self.session.post(self.url, timeout=self.timeout, json={
+            "prompt": prompt,
+            "context": [{"sender": sender, "text": text} for sender, text in context],
+        })
+        response.raise_for_status()
+        return response.json().get("reply")
+
+    def stream(self, prompt, context):
+        with self.session.post(self.url, timeout=self.timeout, stream=True, json={
+            "prompt": prompt,
+            "context": [{"sender": sender, "text": text} for sender, text in context],
+            "stream": True,
+        }) as response:
+            response.raise_for_status()
+            response.encoding = response.encoding or 'utf-8'
+            for chunk in response.iter_content(chunk_size=None, decode_unicode=True):
+                yield chunk
+
+
+class ResponseCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, max_entries=256, ttl=3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.entries.get(key)
+            if item is None:
+                return None
+            value, expires = item
+            if expires < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + self.ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class SharedStream:
+    """One backend stream read on the executor; any number of readers follow it"""
+
+    def __init__(self):
+        self.parts = []
+        self.done = False
+        self.error = None
+        self.future = None
+        self.condition = threading.Condition()
+
+    def run(self, stream, prompt, context):
+        """Executor job: collect the chunks, the full reply becomes the future's result"""
+        try:
+            for chunk in stream(prompt, context):
+                if chunk:
+                    with self.condition:
+                        self.parts.append(chunk)
+                        self.condition.notify_all()
+        except Exception as e:
+            self.error = e
+            raise
+        finally:
+            with self.condition:
+                self.done = True
+                self.condition.notify_all()
+        return ''.join(self.parts)
+
+    def follow(self, deadline):
+        """Yield every chunk so far and then each new one; TimeoutError at the deadline"""
+        index = 0
+        while True:
+            with self.condition:
+                while index == len(self.parts) and not self.done:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError()
+                    self.condition.wait(remaining)
+                chunks = self.parts[index:]
+                index = len(self.parts)
+                done = self.done
+            yield from chunks
+            if done:
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class ResponderService:
+    """Runs a Responder off the Tk thread with caching and request coalescing"""
+
+    def __init__(self, backend, max_workers=2, cache_size=256, ttl=3600.0, timeout=5.0):
+        self.backend = backend
+        self.timeout = timeout
+        self.cache = ResponseCache(cache_size, ttl)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="responder")
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "timeouts": 0, "errors": 0}
+
+    def cache_key(self, prompt, context):
+        recent = tuple((sender, normalize_prompt(text)) for sender, text in list(context)[-CONTEXT_WINDOW:])
+        return normalize_prompt(prompt), recent
+
+    def submit(self, prompt, context=()):
+        """Return a Future for the reply; cached and identical in-flight prompts share one call"""
+        context = list(context)
+        key = self.cache_key(prompt, context)
+
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["hits"] += 1
+                future = Future()
+                future.set_result(cached)
+                return future
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.stats["coalesced"] += 1
+                return future.future if isinstance(future, SharedStream) else future
+            self.stats["misses"] += 1
+            future = self.executor.submit(self.backend.generate, prompt, context)
+            self.in_flight[key] = future
+
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return future
+
+    def _finish(self, key, future):
+        if not future.cancelled() and future.exception() is None and future.result():
+            self.cache.put(key, future.result())
+        with self.lock:
+            self.in_flight.pop(key, None)
+            if not future.cancelled() and future.exception() is not None:
+                self.stats["errors"] += 1
+                print(f"⚠️ Svarsmotorn misslyckades: {future.exception()}")
+
+    def stream(self, prompt, context=(), fallback=None):
+        """Yield reply chunks as they arrive; identical prompts in flight follow one backend call"""
+        context = list(context)
+        key = self.cache_key(prompt, context)
+
+        started = False
+        with self.lock:
+            entry = cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["hits"] += 1
+            else:
+                entry = self.in_flight.get(key)
+                if entry is not None:
+                    self.stats["coalesced"] += 1
+                else:
+                    self.stats["misses"] += 1
+                    entry = SharedStream()
+                    entry.future = self.executor.submit(entry.run, self.backend.stream, prompt, context)
+                    self.in_flight[key] = entry
+                    started = True
+        if cached is not None:
+            yield cached
+            return
+        if started:
+            entry.future.add_done_callback(lambda f: self._finish(key, f))
+
+        # Same deadline as generated_reply; the backend call itself may finish later and still be cached
+        deadline = time.monotonic() + self.timeout
+        shown = False
+        try:
+            if isinstance(entry, SharedStream):
+                for chunk in entry.follow(deadline):
+                    shown = True
+                    yield chunk
+            else:
+                reply = entry.result(timeout=max(0.0, deadline - time.monotonic()))
+                if reply:
+                    shown = True
+                    yield reply
+            if shown:
+                return
+        except TimeoutError:
+            with self.lock:
+                self.stats["timeouts"] += 1
+        except Exception:
+            pass  # Counted and reported by _finish
+        if fallback:
+            # A reply cut off halfway is marked before the scripted answer follows
+            yield f" …\n\n{fallback}" if shown else fallback
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
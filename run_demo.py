@@ -6,8 +6,30 @@ Run this file to start the super automated demo
 
 import sys
 import os
+import argparse
 
 def main():
+    parser = argparse.ArgumentParser(description="Axie Studio AI Chatbot Demo")
+    parser.add_argument("--supervise", type=int, metavar="N",
+                        help="run N demo workers under the kiosk supervisor (restart and recycling)")
+    parser.add_argument("--lang", choices=["sv", "en", "fi"],
+                        help="user interface language (default sv)")
+    parser.add_argument("--events", metavar="DIR",
+                        help="log booking funnel events as compressed JSONL segments in DIR")
+    parser.add_argument("--record", metavar="DIR",
+                        help="record every session as a transcript in DIR")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play a recorded transcript instead of the scripted demo")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay speed (2 = twice as fast)")
+    parser.add_argument("--terminal", action="store_true",
+                        help="play the scripted demo in the terminal (curses) instead of a Tk window")
+    parser.add_argument("--start", type=float, default=0.0,
+                        help="start the replay at this second")
+    parser.add_argument("--intents", metavar="FILE",
+                        help="prebuilt intent index (python intent_matcher.py build FILE)")
+    args, extra = parser.parse_known_args()
+    
     print("🚀 Starting Axie Studio AI Chatbot Demo...")
     print("=" * 50)
     print("Features:")
@@ -18,10 +40,39 @@ def main():
     print("• Minimal CSS/JS dependencies")
     print("=" * 50)
     
+    if args.lang:
+        # Set before the UI modules load their catalogue; inherited by workers
+        os.environ["AXIE_LOCALE"] = args.lang
+    
+    if args.events:
+        # Inherited by supervised worker processes as well
+        os.environ["AXIE_EVENT_DIR"] = args.events
+        print(f"📊 Loggar händelser i {args.events}")
+    
+    if args.intents:
+        # Inherited by supervised workers, which build their SharedAssets from the environment
+        os.environ["AXIE_INTENT_INDEX"] = args.intents
+    
+    if args.record:
+        os.environ["AXIE_TRANSCRIPT_DIR"] = args.record
+        print(f"📼 Spelar in transkript i {args.record}")
+    
+    if args.supervise:
+        # The supervisor restarts crashed workers, so no sys.exit on errors here
+        from kiosk_supervisor import main as supervise
+        supervise(["--workers", str(args.supervise)] + extra)
+        return
+    
+    if args.terminal:
+        # No Tk, fonts or images: for signage boxes without an X server
+        from terminal_demo import main as run_terminal
+        run_terminal(["--speed", str(args.speed)] + extra)
+        return
+    
     try:
         # Import and run the enhanced chatbot
         from enhanced_chatbot import main as run_chatbot
-        run_chatbot()
+        run_chatbot(args.replay, args.speed, args.start, args.intents)
     except ImportError:
         print("❌ Error: Could not import enhanced_chatbot module")
         print("Make sure enhanced_chatbot.py is in the same directory")
@@ -0,0 +1,54 @@
+"""
+Scripted conversation scenarios for the automated demo
+Shared by every front-end so the scenario content lives in one place
+"""
+
+CONVERSATIONS = [
+    # Conversation 1: Enthusiastic startup
+    [
+        ("bot", "🤖 Hej! Välkommen till Axie Studio - Sveriges ledande AI-byrå!"),
+        ("bot", "Vi hjälper företag att öka produktiviteten med 300% genom intelligenta AI-lösningar! 🚀"),
+        ("user", "Hej! Det låter fantastiskt. Vi är ett startup som behöver automatisera vår kundservice."),
+        ("bot", "Perfekt! Startups är våra favoriter! 💡 Vi kan implementera en AI-chatbot som hanterar 80% av era kundförfrågningar automatiskt."),
+        ("bot", "En av våra startup-kunder minskade sina supportkostnader med 70% på bara 3 veckor! 📊"),
+        ("user", "Wow! Hur snabbt kan ni implementera något liknande för oss?"),
+        ("bot", "För startups har vi en speciallösning som kan vara igång på 5 arbetsdagar! ⚡"),
+        ("bot", "Vill du boka en kostnadsfri 30-minuters demo där jag visar exakt hur det fungerar?"),
+        ("user", "Ja, absolut! Det låter som precis vad vi behöver."),
+        ("bot", "Fantastiskt! Jag öppnar vårt bokningssystem så du kan välja en tid som passar. Detta kommer att förändra ert företag! 🎯"),
+        ("system", "OPEN_BOOKING_MODAL")
+    ],
+    
+    # Conversation 2: Established company
+    [
+        ("bot", "🤖 Välkommen till Axie Studio! Vi revolutionerar företag med AI-teknik."),
+        ("bot", "Sedan 2020 har vi hjälpt över 200 företag att automatisera sina processer och öka effektiviteten dramatiskt! 📈"),
+        ("user", "Hej! Vi är ett etablerat företag med 50 anställda. Kan AI verkligen hjälpa oss?"),
+        ("bot", "Absolut! Etablerade företag ser ofta de största fördelarna! 🏢 Ni har redan processer som kan optimeras."),
+        ("bot", "Ett liknande företag sparade 25 timmar per vecka genom att automatisera sin orderhantering med vår AI-lösning."),
+        ("user", "Det låter intressant. Vilka andra områden kan ni hjälpa med?"),
+        ("bot", "Vi specialiserar oss på: 📋\n• Intelligent dokumenthantering\n• Automatisk dataanalys\n• Prediktiv underhåll\n• Smart personalplanering"),
+        ("bot", "Vad säger du om en djupgående konsultation där vi analyserar era specifika behov?"),
+        ("user", "Ja, det vore värdefullt. När kan vi träffas?"),
+        ("bot", "Perfekt! Låt mig öppna vårt bokningssystem så du kan välja en tid som passar era scheman. 🗓️"),
+        ("system", "OPEN_BOOKING_MODAL")
+    ],
+    
+    # Conversation 3: Skeptical customer
+    [
+        ("bot", "🤖 Hej och välkommen till Axie Studio! Vi gör AI tillgängligt för alla företag."),
+        ("bot", "Oavsett bransch eller storlek kan vi hjälpa er att dra nytta av AI:s kraft! 💪"),
+        ("user", "Hej. Jag är lite skeptisk till AI. Är det verkligen värt investeringen?"),
+        ("bot", "Jag förstår din skepsis helt! 🤔 Många av våra mest nöjda kunder var skeptiska från början."),
+        ("bot", "Därför erbjuder vi alltid en kostnadsfri analys först. Inga löften - bara konkreta siffror på vad AI kan göra för ert företag."),
+        ("user", "Okej, det låter rimligt. Men hur vet jag att ni kan leverera?"),
+        ("bot", "Bra fråga! Vi har en 100% nöjd-kund-garanti. 🛡️ Om ni inte ser resultat inom 30 dagar får ni pengarna tillbaka."),
+        ("bot", "Plus att vi kan visa er exakt ROI innan ni investerar en krona. Vill du se hur?"),
+        ("user", "Ja, det skulle övertyga mig. Hur gör vi det?"),
+        ("bot", "Perfekt! Jag bokar in en ROI-analys där vi räknar på era specifika siffror. Helt kostnadsfritt! 📊"),
+        ("system", "OPEN_BOOKING_MODAL")
+    ]
+]
+
+# Reply for live visitor input that matches no intent
+FALLBACK_REPLY = "Bra fråga! 🤔 Det tar vi gärna upp på en kostnadsfri 30-minuters konsultation. Vill du boka en tid?"
@@ -0,0 +1,73 @@
+"""
+Process-wide assets for chat windows
+Fonts, images, emoji sprites, compiled scenarios and caches are created
+once per Tk interpreter and shared by every SuperAutomatedChatbot in the
+process
+"""
+
+import os
+from io import BytesIO
+from tkinter import font
+
+import requests
+from PIL import Image, ImageTk
+
+from scenarios import CONVERSATIONS
+from intent_matcher import IntentMatcher, build_intents_from_conversations
+from text_layout import TextLayoutCache
+from emoji_atlas import install_sprites
+
+LOGO_URL = "https://www.axiestudio.se/logo.jpg"
+
+
+def compile_scenarios(conversations):
+    """Freeze scenarios into tuples so every window can share them read-only"""
+    return tuple(tuple((sender, message) for sender, message in conversation)
+                 for conversation in conversations)
+
+
+class SharedAssets:
+    """Fonts, emoji sprites, logo, scenarios, intent index and layout cache for one Tk interpreter"""
+
+    def __init__(self, root, conversations=CONVERSATIONS, intent_index_path=None):
+        self.root = root
+
+        # Fonts (including the ones previously allocated per message)
+        self.title_font = font.Font(root=root, family="Helvetica", size=16, weight="bold")
+        self.header_font = font.Font(root=root, family="Helvetica", size=12, weight="bold")
+        self.message_font = font.Font(root=root, family="Helvetica", size=11)
+        self.small_font = font.Font(root=root, family="Helvetica", size=9)
+        self.avatar_font = font.Font(root=root, size=16)
+        self.timestamp_font = font.Font(root=root, size=8)
+        self.logo_font = font.Font(root=root, size=32)
+
+        self.conversations = compile_scenarios(conversations)
+        # Emoji sprites for this interpreter (rasterised once, then loaded from the disk cache)
+        self.emoji = install_sprites(root, (message for conversation in self.conversations
+                                            for _sender, message in conversation))
+        self.layout_cache = TextLayoutCache()
+        self.intent_matcher = None
+        # Prebuilt index (intent_matcher.py build), e.g. for large catalogues; AXIE_INTENT_INDEX for workers
+        intent_index_path = intent_index_path or os.environ.get("AXIE_INTENT_INDEX")
+        if intent_index_path:
+            try:
+                self.intent_matcher = IntentMatcher.load(intent_index_path)
+            except (OSError, KeyError, ValueError) as e:
+                print(f"⚠️ Intent-indexet {intent_index_path} kunde inte läsas: {e}")
+        if self.intent_matcher is None:
+            intents = build_intents_from_conversations(self.conversations)
+            self.intent_matcher = IntentMatcher().build_async(intents)
+
+        self.logos = {}
+
+    def logo_photo(self, size):
+        """Return the company logo as a shared PhotoImage, or None when offline"""
+        if size not in self.logos:
+            try:
+                logo_response = requests.get(LOGO_URL, timeout=3)
+                logo_image = Image.open(BytesIO(logo_response.content))
+                logo_image = logo_image.resize((size, size), Image.Resampling.LANCZOS)
+                self.logos[size] = ImageTk.PhotoImage(logo_image, master=self.root)
+            except Exception:
+                self.logos[size] = None
+        return self.logos[size]
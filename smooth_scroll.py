@@ -0,0 +1,89 @@
+"""
+Scroll region maintenance and eased auto-scroll for chat canvases
+Coalesces <Configure> storms into one scrollregion update per frame and
+animates scrolling over time, retargeting when new messages arrive
+"""
+
+import time
+
+from message_stream import FRAME_MS
+
+
+class ScrollRegionKeeper:
+    """Keeps a canvas scrollregion in sync with one embedded content frame"""
+
+    def __init__(self, canvas, content, frame_ms=FRAME_MS):
+        self.canvas = canvas
+        self.content = content
+        self.frame_ms = frame_ms
+        self.height = 0
+        self.pending = None
+        self.region = None
+
+    def request(self, event=None):
+        """Schedule at most one region update per frame however many events fire"""
+        if self.pending is None:
+            self.pending = self.canvas.after(self.frame_ms, self.flush)
+
+    def expect(self, pixels):
+        """Grow the known height ahead of Tk's geometry pass (reserved bubble sizes)"""
+        self.height += pixels
+        self.request()
+
+    def reset(self, content=None):
+        """Start over for a new content frame"""
+        if content is not None:
+            self.content = content
+        self.height = 0
+        self.request()
+
+    def flush(self):
+        self.pending = None
+        # The frame's requested height is the region; no bbox("all") walk over items
+        requested = self.content.winfo_reqheight()
+        if requested > 1:
+            self.height = requested
+        region = (0, 0, self.canvas.winfo_width(), self.height)
+        if region != self.region:
+            self.region = region
+            self.canvas.configure(scrollregion=region)
+
+
+class SmoothScroller:
+    """Time-based ease-out scrolling that follows the bottom of a growing canvas"""
+
+    def __init__(self, canvas, keeper, duration=0.35, frame_ms=FRAME_MS):
+        self.canvas = canvas
+        self.keeper = keeper
+        self.duration = duration
+        self.frame_ms = frame_ms
+        self.start_px = 0.0
+        self.start_time = 0.0
+        self.running = False
+
+    def bottom_px(self):
+        return max(0, self.keeper.height - self.canvas.winfo_height())
+
+    def current_px(self):
+        return self.canvas.yview()[0] * max(self.keeper.height, 1)
+
+    def scroll_to_bottom(self):
+        """Start (or retarget) an eased scroll to the newest message"""
+        self.start_px = self.current_px()
+        self.start_time = time.monotonic()
+        if not self.running:
+            self.running = True
+            self.canvas.after(self.frame_ms, self.tick)
+
+    def tick(self):
+        progress = min(1.0, (time.monotonic() - self.start_time) / self.duration)
+        eased = 1 - (1 - progress) ** 3
+        # The target is re-read every frame so late growth is followed smoothly
+        target = self.bottom_px()
+        position = self.start_px + (target - self.start_px) * eased
+        if self.keeper.height > 0:
+            self.canvas.yview_moveto(position / self.keeper.height)
+        if progress < 1.0:
+            self.canvas.after(self.frame_ms, self.tick)
+        else:
+            self.running = False
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Terminal rendering backend for the scripted demo
+Plays the same scenarios and pacing as SuperAutomatedChatbot (demo_script)
+with curses on signage boxes without an X server; the screen is kept as rows
+of styled segments and only the rows that changed since the last frame are
+written, and nothing is drawn while the script sleeps
+"""
+
+import argparse
+import curses
+import heapq
+import itertools
+import locale
+import os
+import time
+import unicodedata
+from datetime import datetime
+
+from scenarios import CONVERSATIONS
+from demo_scheduler import DemoScheduler
+from demo_script import DemoView, automation_script, word_delay, keystroke_delays
+from i18n import _
+
+# The time slots of the booking modal, shown in the booking prompt
+SLOT_TIMES = ("09:00", "10:30", "13:00", "14:30", "16:00")
+BUBBLE_MAX_WIDTH = 60  # Cells of text per bubble line (at most 70% of the screen)
+
+# Colour pairs
+BOT, USER, HEADER, RUNNING, PAUSED, BOOKING = range(1, 7)
+
+
+def char_width(char):
+    """Terminal cells of one character: 2 for wide (emoji, CJK), 0 for combining marks"""
+    if unicodedata.combining(char) or char in '\u200d\ufe0e\ufe0f':
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+
+
+def cell_width(text):
+    return sum(char_width(char) for char in text)
+
+
+def fit(text, width):
+    """Cut text to at most width cells"""
+    used = 0
+    for i, char in enumerate(text):
+        used += char_width(char)
+        if used > width:
+            return text[:i]
+    return text
+
+
+def wrap_words(text, width):
+    """Final line breaks of text as lists of words, so typing reveals words in place"""
+    lines = []
+    for paragraph in text.split('\n'):
+        line, used = [], 0
+        for word in paragraph.split(' '):
+            size = cell_width(word)
+            if line and used + 1 + size > width:
+                lines.append(line)
+                line, used = [], 0
+            while size > width:  # Longer than a whole line: break inside the word
+                head = fit(word, width) or word[0]
+                lines.append([head])
+                word = word[len(head):]
+                size = cell_width(word)
+            used += size + (1 if line else 0)
+            line.append(word)
+        lines.append(line)
+    return lines
+
+
+class TerminalLoop:
+    """Timers and key input for one terminal; has the after() interface DemoScheduler uses on Tk roots"""
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self.timers = []
+        self.cancelled = set()
+        self.ids = itertools.count(1)
+        self.running = True
+
+    def after(self, ms, callback, *args):
+        timer = next(self.ids)
+        heapq.heappush(self.timers, (time.monotonic() + ms / 1000, timer, callback, args))
+        return timer
+
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, timer):
+        self.cancelled.add(timer)
+
+    def run(self, on_key, on_idle):
+        """Run due timers, let on_idle draw, then block in getch until the next timer or a key"""
+        while self.running:
+            now = time.monotonic()
+            while self.timers and self.timers[0][0] <= now:
+                _due, timer, callback, args = heapq.heappop(self.timers)
+                if timer in self.cancelled:
+                    self.cancelled.discard(timer)
+                    continue
+                callback(*args)
+            on_idle()
+            if self.timers:
+                self.stdscr.timeout(max(0, int((self.timers[0][0] - time.monotonic()) * 1000) + 1))
+            else:
+                self.stdscr.timeout(-1)
+            key = self.stdscr.getch()
+            if key != -1:
+                on_key(key)
+
+
+class Screen:
+    """Differential writer: rows of (text, attr) segments, rewriting only rows that changed"""
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self.rows = []
+        self.stats = {"frames": 0, "rows_written": 0}
+
+    def reset(self):
+        """Forget what is on the terminal (after a resize) so the next frame writes every row"""
+        self.rows = []
+        self.stdscr.clear()
+
+    def draw(self, rows):
+        height, width = self.stdscr.getmaxyx()
+        for y, row in enumerate(rows[:height]):
+            if y < len(self.rows) and self.rows[y] == row:
+                continue
+            self.stdscr.move(y, 0)
+            self.stdscr.clrtoeol()
+            x = 0
+            for text, attr in row:
+                text = fit(text, width - x)
+                if not text:
+                    break
+                try:
+                    self.stdscr.addstr(y, x, text, attr)
+                except curses.error:
+                    pass  # Writing the bottom right cell moves the cursor off screen
+                x += cell_width(text)
+            self.stats["rows_written"] += 1
+        self.rows = list(rows)
+        self.stats["frames"] += 1
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+
+class Message:
+    """A chat bubble: final line breaks and how many words are visible so far"""
+
+    def __init__(self, text, kind, width):
+        self.text = text
+        self.kind = kind  # "bot", "user" or "note"
+        self.time = datetime.now().strftime("%H:%M")
+        self.rewrap(width)
+        self.visible = self.words
+
+    def rewrap(self, width):
+        self.lines = wrap_words(self.text, width)
+        self.width = max([cell_width(' '.join(line)) for line in self.lines] + [1])
+        self.words = sum(len(line) for line in self.lines)
+
+    def visible_lines(self):
+        """Lines as typed so far, padded to the final bubble width"""
+        left, lines = self.visible, []
+        for line in self.lines:
+            text = ' '.join(line[:max(0, left)])
+            left -= len(line)
+            lines.append(text + ' ' * (self.width - cell_width(text)))
+        return lines
+
+
+class TerminalChatbot(DemoView):
+    """The scripted demo in a terminal: bubbles, typing, counter and booking prompt"""
+
+    def __init__(self, stdscr, loop, scheduler, conversations=CONVERSATIONS, start_offset=0):
+        self.stdscr = stdscr
+        self.loop = loop
+        self.scheduler = scheduler
+        self.screen = Screen(stdscr)
+        self.conversations = conversations
+        self.start_offset = start_offset
+        self.attrs = self.setup_colors()
+
+        self.messages = []
+        self.input_text = ""
+        self.sending = False
+        self.booking_open = False
+        self.demo_paused = False
+        self.tasks = []
+        self.automation_task = None
+        self.dirty = True
+
+    def setup_colors(self):
+        """Curses attributes per element; reverse video on terminals without colour"""
+        plain = {"bot": curses.A_REVERSE, "user": curses.A_BOLD, "header": curses.A_REVERSE | curses.A_BOLD,
+                 "running": curses.A_REVERSE, "paused": curses.A_DIM, "booking": curses.A_REVERSE,
+                 "dim": curses.A_DIM, "normal": curses.A_NORMAL}
+        if not curses.has_colors():
+            return plain
+        curses.start_color()
+        curses.use_default_colors()
+        curses.init_pair(BOT, curses.COLOR_WHITE, curses.COLOR_BLUE)
+        curses.init_pair(USER, curses.COLOR_BLUE, curses.COLOR_CYAN)
+        curses.init_pair(HEADER, curses.COLOR_WHITE, curses.COLOR_BLUE)
+        curses.init_pair(RUNNING, curses.COLOR_WHITE, curses.COLOR_GREEN)
+        curses.init_pair(PAUSED, curses.COLOR_WHITE, curses.COLOR_BLACK)
+        curses.init_pair(BOOKING, curses.COLOR_BLACK, curses.COLOR_YELLOW)
+        return dict(plain, bot=curses.color_pair(BOT), user=curses.color_pair(USER),
+                    header=curses.color_pair(HEADER) | curses.A_BOLD, running=curses.color_pair(RUNNING),
+                    paused=curses.color_pair(PAUSED), booking=curses.color_pair(BOOKING))
+
+    def spawn(self, generator, name, delay=0.0):
+        self.tasks = [task for task in self.tasks if not task.done]
+        task = self.scheduler.spawn(generator, name, delay)
+        self.tasks.append(task)
+        return task
+
+    def changed(self):
+        self.dirty = True
+
+    def bubble_width(self):
+        _height, width = self.stdscr.getmaxyx()
+        return max(10, min(BUBBLE_MAX_WIDTH, int(width * 0.7) - 2))
+
+    # DemoView
+
+    def start_conversation(self, conv_index):
+        self.changed()
+
+    def clear_chat(self):
+        for task in self.tasks:
+            if task.name == "typing":
+                self.scheduler.cancel(task)
+        self.messages = [Message(_("🎯 Automatisk AI-Demo Startar\n\nDu kommer att se olika kundscenarier som "
+                                   "visar hur vår AI-assistent hanterar olika typer av förfrågningar."),
+                                 "note", self.bubble_width())]
+        self.booking_open = False
+        self.changed()
+
+    def add_message_with_animation(self, text, is_bot, animate_typing=True):
+        message = Message(text, "bot" if is_bot else "user", self.bubble_width())
+        self.messages.append(message)
+        self.changed()
+        if animate_typing:
+            message.visible = 0
+            self.spawn(self.type_text(message), "typing")
+
+    def type_text(self, message):
+        """Reveal a bot message word by word with the pacing of the Tk bubbles"""
+        for line in message.lines:
+            for word in line:
+                message.visible += 1
+                self.changed()
+                yield word_delay(word, self.typing_speed)
+
+    def simulate_user_typing(self, text):
+        for i, delay in enumerate(keystroke_delays(text)):
+            self.input_text = text[:i + 1]
+            self.changed()
+            yield delay
+
+        # Send button press
+        self.sending = True
+        self.changed()
+        yield 0.2
+        self.sending = False
+        self.changed()
+        yield 0.5
+        self.input_text = ""
+        self.changed()
+
+    def open_booking_modal(self):
+        self.booking_open = True
+        self.changed()
+
+    # Demo control
+
+    def start_automation(self, scenario=None):
+        first = self.start_offset if scenario is None else scenario
+        if self.automation_task:
+            self.scheduler.cancel(self.automation_task)
+        self.automation_task = self.spawn(automation_script(self, first), "automation")
+
+    def toggle_pause(self):
+        """Freeze the script and its typing where they are, or continue"""
+        for task in self.tasks:
+            if self.demo_paused:
+                self.scheduler.resume(task)
+            else:
+                self.scheduler.pause(task)
+        self.demo_paused = not self.demo_paused
+        self.changed()
+
+    def jump_to_scenario(self, scenario):
+        if self.demo_paused:
+            self.toggle_pause()
+        self.start_automation(scenario)
+
+    def on_key(self, key):
+        if key in (ord('q'), 27):
+            self.loop.running = False
+        elif key == ord(' '):
+            self.toggle_pause()
+        elif ord('1') <= key < ord('1') + min(9, len(self.conversations)):
+            self.jump_to_scenario(key - ord('1'))
+        elif key == curses.KEY_RESIZE:
+            curses.update_lines_cols()
+            width = self.bubble_width()
+            for message in self.messages:
+                visible = message.visible
+                message.rewrap(width)
+                message.visible = min(visible, message.words)
+            self.screen.reset()
+            self.changed()
+
+    # Drawing
+
+    def render(self):
+        """Draw the screen if anything changed since the last frame"""
+        if not self.dirty:
+            return
+        self.dirty = False
+        height, width = self.stdscr.getmaxyx()
+        a = self.attrs
+
+        rows = [[(" " + _("🤖 Axie Studio AI-Assistent").ljust(width), a["header"])]]
+        if self.demo_paused:
+            status = (f" {_('Pausad')} ", a["paused"])
+        else:
+            status = (f" {_('Kör automatiskt')} ", a["running"])
+        counter = _("Konversation {current}/{total}").format(current=self.current_conversation + 1,
+                                                             total=len(self.conversations))
+        used = 2 + cell_width(_("Demo Status:")) + cell_width(status[0])
+        rows.append([(" " + _("Demo Status:") + " ", a["dim"]), status,
+                     (" " * max(1, width - used - cell_width(counter) - 1) + counter, a["dim"])])
+
+        chat_height = max(0, height - 4)
+        chat = self.chat_rows(width)
+        if self.booking_open:
+            chat += self.booking_rows(width)
+        chat = chat[-chat_height:] if chat_height else []
+        rows += [[]] * (chat_height - len(chat)) + chat
+
+        rows.append([("─" * width, a["dim"])])
+        send = (f" {_('🚀 Skicka')} ", a["running"] if self.sending else a["dim"])
+        field = f" › {self.input_text}▏"
+        field = fit(field, max(0, width - cell_width(send[0]) - 1))
+        rows.append([(field, a["normal"]), (" " * max(0, width - cell_width(field) - cell_width(send[0]) - 1), 0),
+                     send])
+        self.screen.draw(rows)
+
+    def chat_rows(self, width):
+        a = self.attrs
+        rows = []
+        for message in self.messages:
+            rows.append([])
+            if message.kind == "note":
+                for line in message.visible_lines():
+                    text = line.rstrip()
+                    rows.append([(" " * max(0, (width - cell_width(text)) // 2) + text, a["dim"])])
+                continue
+            attr = a[message.kind]
+            # Bot bubbles on the left, visitor bubbles on the right, as in the Tk window
+            indent = 1 if message.kind == "bot" else max(1, width - message.width - 3)
+            for line in message.visible_lines():
+                rows.append([(" " * indent, 0), (f" {line} ", attr)])
+            stamp_indent = indent + message.width + 2 - len(message.time) if message.kind == "bot" else indent
+            rows.append([(" " * stamp_indent + message.time, a["dim"])])
+        return rows
+
+    def booking_rows(self, width):
+        attr = self.attrs["booking"]
+        lines = [_("🎯 Boka Din AI-Konsultation"),
+                 _("Upptäck hur AI kan revolutionera ditt företag på bara 30 minuter"),
+                 _("Alla tider är 30 minuter och helt kostnadsfria:"),
+                 " · ".join(SLOT_TIMES)]
+        inner = min(width - 4, max(cell_width(line) for line in lines))
+        rows = [[]]
+        for line in lines:
+            wrapped = [' '.join(words) for words in wrap_words(line, inner)]
+            for text in wrapped:
+                rows.append([(" ", 0), (f" {text}{' ' * (inner - cell_width(text))} ", attr)])
+        return rows
+
+
+def run(stdscr, args):
+    curses.curs_set(0)
+    loop = TerminalLoop(stdscr)
+    scheduler = DemoScheduler(loop, time_scale=1.0 / args.speed)
+    chatbot = TerminalChatbot(stdscr, loop, scheduler, start_offset=args.scenario - 1)
+    if args.typing_speed is not None:
+        chatbot.typing_speed = args.typing_speed
+    if args.message_delay is not None:
+        chatbot.message_delay = args.message_delay
+    if args.conversation_delay is not None:
+        chatbot.conversation_delay = args.conversation_delay
+    chatbot.start_automation()
+    try:
+        loop.run(chatbot.on_key, chatbot.render)
+    except KeyboardInterrupt:
+        pass
+    return chatbot.screen.stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kör den automatiska demon i terminalen (curses, utan X-server)")
+    parser.add_argument("--scenario", type=int, default=1, choices=range(1, len(CONVERSATIONS) + 1),
+                        help="första scenariot")
+    parser.add_argument("--speed", type=float, default=1.0, help="uppspelningshastighet (2 = dubbelt så snabbt)")
+    parser.add_argument("--typing-speed", type=float, help="sekunder per tecken")
+    parser.add_argument("--message-delay", type=float, help="sekunder mellan meddelanden")
+    parser.add_argument("--conversation-delay", type=float, help="sekunder mellan konversationer")
+    parser.add_argument("--stats", action="store_true", help="skriv ut antal ritade rader vid avslut")
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("--speed måste vara större än 0")
+
+    locale.setlocale(locale.LC_ALL, "")  # Wide characters (emoji) need the terminal's encoding
+    os.environ.setdefault("ESCDELAY", "25")  # Esc quits without the default one second wait
+    stats = curses.wrapper(run, args)
+    if args.stats:
+        print(f"🖥️ {stats['frames']} bildrutor, {stats['rows_written']} skrivna rader")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Text layout pre-measurement for chat bubbles
+Computes final line breaks and bubble size once per message so typing only
+reveals text inside a box whose geometry never changes
+"""
+
+# Bound for the per-text layout cache (scenario texts repeat every cycle)
+MAX_CACHED_LAYOUTS = 512
+
+
+class TextLayout:
+    """Final line breaks and pixel size of a wrapped text"""
+
+    def __init__(self, lines, width, height, line_height):
+        self.lines = lines
+        self.width = width
+        self.height = height
+        self.line_height = line_height
+
+    @property
+    def text(self):
+        return "\n".join(self.lines)
+
+    def reveal_steps(self):
+        """Yield (word, visible_text) for each word as it is typed, using the final breaks"""
+        done = []
+        for line in self.lines:
+            words = line.split(' ')
+            for i in range(len(words)):
+                yield words[i], "\n".join(done + [' '.join(words[:i + 1])])
+            done.append(line)
+
+
+class TextLayoutCache:
+    """Memoized font.measure per (font, word) plus whole-text layouts"""
+
+    def __init__(self):
+        self.widths = {}
+        self.line_heights = {}
+        self.layouts = {}
+
+    def measure(self, font, text):
+        key = (str(font), text)
+        width = self.widths.get(key)
+        if width is None:
+            width = self.widths[key] = font.measure(text)
+        return width
+
+    def line_height(self, font):
+        key = str(font)
+        height = self.line_heights.get(key)
+        if height is None:
+            height = self.line_heights[key] = font.metrics('linespace')
+        return height
+
+    def layout(self, font, text, wraplength):
+        """Greedy word wrap matching a Tk label with the given wraplength"""
+        key = (str(font), text, wraplength)
+        layout = self.layouts.get(key)
+        if layout is not None:
+            return layout
+
+        space = self.measure(font, ' ')
+        lines = []
+        for paragraph in text.split('\n'):
+            line, line_width = [], 0
+            for word in paragraph.split(' '):
+                word_width = self.measure(font, word)
+                if word_width > wraplength:
+                    # Words wider than the bubble are broken between characters
+                    if line:
+                        lines.append(' '.join(line))
+                        line, line_width = [], 0
+                    pieces = self.break_word(font, word, wraplength)
+                    lines.extend(pieces[:-1])
+                    word = pieces[-1]
+                    word_width = self.measure(font, word)
+                elif line and line_width + space + word_width > wraplength:
+                    lines.append(' '.join(line))
+                    line, line_width = [], 0
+                line_width += (space if line else 0) + word_width
+                line.append(word)
+            lines.append(' '.join(line))
+
+        # Measure finished lines whole so kerning matches what Tk draws
+        width = max(self.measure(font, line) for line in lines)
+        line_height = self.line_height(font)
+        layout = TextLayout(lines, width, line_height * len(lines), line_height)
+
+        if len(self.layouts) >= MAX_CACHED_LAYOUTS:
+            self.layouts.clear()
+        self.layouts[key] = layout
+        return layout
+
+    def break_word(self, font, word, wraplength):
+        pieces, current = [], ''
+        for char in word:
+            if current and self.measure(font, current + char) > wraplength:
+                pieces.append(current)
+                current = ''
+            current += char
+        pieces.append(current)
+        return pieces
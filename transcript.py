@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Append-only transcript recording and replay
+Messages and UI events of every kiosk session are appended with monotonic
+timestamps to a compact binary log; a sidecar seek index lets replay jump to
+any moment with a binary search instead of reading from the start
+"""
+
+import argparse
+import atexit
+import bisect
+import json
+import mmap
+import os
+import socket
+import struct
+import sys
+import time
+import zlib
+from collections import namedtuple
+
+MAGIC = b"AXTR1"
+HEADER = struct.Struct("<5sQ")         # magic, wall-clock start in ms since the epoch
+RECORD = struct.Struct("<IIBQ")        # payload length, crc32, kind, ms since start
+INDEX_ENTRY = struct.Struct("<QQQ")    # ms since start, record offset, checkpoint offset
+INDEX_EVERY = 64                       # records between periodic seek index entries
+TRANSCRIPT_PATTERN = "transcript-*.axtr"
+
+SESSION, CLEAR, MESSAGE, EVENT = 1, 2, 3, 4
+SENDERS = ("bot", "user")
+
+# t in seconds since the recording started; data depends on kind:
+# SESSION dict, CLEAR None, MESSAGE (sender, text), EVENT (name, fields)
+Record = namedtuple("Record", "t kind data offset")
+
+
+def encode_payload(kind, data):
+    if kind == MESSAGE:
+        sender, text = data
+        return bytes((SENDERS.index(sender),)) + text.encode("utf-8")
+    if kind == CLEAR:
+        return b""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_payload(kind, payload):
+    if kind == MESSAGE:
+        return SENDERS[payload[0]], payload[1:].decode("utf-8")
+    if kind == CLEAR:
+        return None
+    data = json.loads(payload)
+    return (data.pop("name"), data) if kind == EVENT else data
+
+
+class TranscriptRecorder:
+    """Appends records to one transcript file and its seek index"""
+
+    def __init__(self, path, flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.file = open(path, "ab")
+        if self.file.tell() == 0:
+            self.file.write(HEADER.pack(MAGIC, int(time.time() * 1000)))
+        self.index = open(path + ".idx", "ab")
+        self.started = time.monotonic()
+        self.records = 0
+        self.checkpoint = self.file.tell()
+        self.previous_kind = None
+        self.last_flush = self.started
+        self.closed = False
+
+    def append(self, kind, data=None):
+        if self.closed:
+            return
+        now = time.monotonic()
+        t_ms = int((now - self.started) * 1000)
+        payload = encode_payload(kind, data)
+        offset = self.file.tell()
+
+        # Replay rebuilds the chat from the last checkpoint: a session start, or a
+        # clear that is not just the second half of one
+        checkpoint = kind == SESSION or (kind == CLEAR and self.previous_kind != SESSION)
+        if checkpoint:
+            self.checkpoint = offset
+        self.file.write(RECORD.pack(len(payload), zlib.crc32(payload), kind, t_ms) + payload)
+        if checkpoint or self.records % INDEX_EVERY == 0:
+            self.index.write(INDEX_ENTRY.pack(t_ms, offset, self.checkpoint))
+        self.records += 1
+        self.previous_kind = kind
+
+        if now - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def session(self, session, scenario, live):
+        self.append(SESSION, {"session": session, "scenario": scenario, "live": live})
+
+    def clear(self):
+        self.append(CLEAR)
+
+    def message(self, sender, text):
+        self.append(MESSAGE, (sender, text))
+
+    def event(self, name, **fields):
+        self.append(EVENT, dict(fields, name=name))
+
+    def flush(self):
+        # Data before index, so an index entry never points past the data on disk
+        self.file.flush()
+        self.index.flush()
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        self.file.close()
+        self.index.close()
+        if not self.records:
+            # Nothing happened in this window: leave no empty transcript behind
+            for path in (self.path, self.path + ".idx"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class IndexTimes:
+    """Times of the seek index entries as a sequence, for bisect over the mapped file"""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.count = len(buffer) // INDEX_ENTRY.size
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        return INDEX_ENTRY.unpack_from(self.buffer, position * INDEX_ENTRY.size)[0]
+
+    def entry(self, position):
+        return INDEX_ENTRY.unpack_from(self.buffer, position * INDEX_ENTRY.size)
+
+
+def rebuild_index(path):
+    """Write the seek index of a transcript from its records (e.g. after the .idx was lost)"""
+    reader = TranscriptReader(path, use_index=False)
+    checkpoint, previous_kind = HEADER.size, None
+    with open(path + ".idx.tmp", "wb") as index:
+        for number, record in enumerate(reader.records()):
+            t_ms = round(record.t * 1000)
+            is_checkpoint = record.kind == SESSION or (record.kind == CLEAR and previous_kind != SESSION)
+            if is_checkpoint:
+                checkpoint = record.offset
+            if is_checkpoint or number % INDEX_EVERY == 0:
+                index.write(INDEX_ENTRY.pack(t_ms, record.offset, checkpoint))
+            previous_kind = record.kind
+    reader.close()
+    os.replace(path + ".idx.tmp", path + ".idx")
+
+
+class TranscriptReader:
+    """Random access to a transcript through its seek index"""
+
+    def __init__(self, path, use_index=True):
+        self.path = path
+        self.file = open(path, "rb")
+        magic, self.wall_start_ms = HEADER.unpack(self.file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} är ingen transkriptfil")
+        self.index_map = None
+        self.times = IndexTimes(b"")
+        if use_index:
+            if not os.path.exists(path + ".idx"):
+                rebuild_index(path)
+            self.load_index()
+
+    def load_index(self):
+        """Map the seek index (call again to see entries appended since)"""
+        if self.index_map:
+            self.index_map.close()
+            self.index_map = None
+        with open(self.path + ".idx", "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            usable = size - size % INDEX_ENTRY.size
+            if usable:
+                self.index_map = mmap.mmap(f.fileno(), usable, access=mmap.ACCESS_READ)
+        self.times = IndexTimes(self.index_map if self.index_map else b"")
+
+    def records(self, offset=HEADER.size):
+        """Records from offset on; stops at a torn or corrupt tail"""
+        while True:
+            self.file.seek(offset)
+            header = self.file.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            length, crc, kind, t_ms = RECORD.unpack(header)
+            payload = self.file.read(length)
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                return
+            yield Record(t_ms / 1000, kind, decode_payload(kind, payload), offset)
+            offset += RECORD.size + length
+
+    def seek(self, seconds):
+        """Checkpoint offset to rebuild the screen at `seconds` from: O(log n) in the index"""
+        position = bisect.bisect_right(self.times, int(seconds * 1000)) - 1
+        if position < 0:
+            return HEADER.size
+        _t_ms, _offset, checkpoint = self.times.entry(position)
+        return checkpoint
+
+    def duration(self):
+        """Time of the last record, scanning only past the last index entry"""
+        offset = self.times.entry(len(self.times) - 1)[1] if len(self.times) else HEADER.size
+        last = 0.0
+        for record in self.records(offset):
+            last = record.t
+        return last
+
+    def close(self):
+        if self.index_map:
+            self.index_map.close()
+            self.index_map = None
+        self.file.close()
+
+
+_directory = None
+_configured = False
+_recorders = 0
+
+
+def configure_transcripts(directory):
+    """Record the sessions of this process into directory (None turns recording off)"""
+    global _directory, _configured
+    _directory = directory
+    _configured = True
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def open_recorder():
+    """A new recorder for one chat window, or None; AXIE_TRANSCRIPT_DIR enables it in workers too"""
+    global _recorders
+    if not _configured:
+        configure_transcripts(os.environ.get("AXIE_TRANSCRIPT_DIR"))
+    if not _directory:
+        return None
+    _recorders += 1
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    name = f"transcript-{stamp}-{socket.gethostname()}-{os.getpid()}-{_recorders}.axtr"
+    recorder = TranscriptRecorder(os.path.join(_directory, name))
+    atexit.register(recorder.close)
+    return recorder
+
+
+def describe(record):
+    if record.kind == MESSAGE:
+        sender, text = record.data
+        return f"{'🤖' if sender == 'bot' else '👤'} {text}"
+    if record.kind == SESSION:
+        return f"▶️ Session {record.data['session']} (scenario {record.data['scenario'] + 1}" + \
+               (", live)" if record.data.get("live") else ")")
+    if record.kind == CLEAR:
+        return "🧹 Chatten rensad"
+    name, fields = record.data
+    return f"• {name} {json.dumps(fields, ensure_ascii=False) if fields else ''}".rstrip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Visa och indexera inspelade transkript")
+    parser.add_argument("command", choices=["show", "index"])
+    parser.add_argument("path", help="transkriptfil (.axtr)")
+    parser.add_argument("--from", dest="start", type=float, default=0.0,
+                        help="börja vid sekund (hoppar via sökindexet)")
+    args = parser.parse_args(argv)
+
+    if args.command == "index":
+        rebuild_index(args.path)
+        print(f"✅ Sökindex återskapat: {args.path}.idx")
+        return
+
+    reader = TranscriptReader(args.path)
+    start = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(reader.wall_start_ms / 1000))
+    print(f"📼 {os.path.basename(args.path)}, inspelad {start}, {reader.duration():.1f} s")
+    try:
+        for record in reader.records(reader.seek(args.start)):
+            marker = " " if record.t < args.start else "*"
+            print(f"{marker}{record.t:9.3f}  {describe(record)}")
+    except BrokenPipeError:
+        sys.stderr.close()
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+Full-text search over recorded transcripts
+Keeps an incremental inverted index of Swedish-normalised terms with
+positional, varint-compressed postings per conversation and answers boolean,
+phrase, prefix and THEN (in that order) queries with vectorized NumPy merges
+"""
+
+import argparse
+import bisect
+import glob
+import json
+import mmap
+import os
+import re
+import shutil
+import struct
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from intent_matcher import TOKEN_PATTERN, STOPWORDS, normalize_text, stem
+from transcript import (TranscriptReader, TRANSCRIPT_PATTERN, HEADER, SESSION, CLEAR, MESSAGE, EVENT)
+
+MANIFEST = "manifest.json"
+DOCS = "docs.bin"
+DOC = struct.Struct("<IQQdi")             # transcript number, checkpoint offset, session, start (epoch s), scenario
+LEXICON_ENTRY = struct.Struct("<QIQII")   # term offset, term length, postings offset, postings length, documents
+MESSAGE_GAP = 16      # positions between messages, so a phrase never spans two of them
+IDLE_SECONDS = 300    # a transcript untouched this long has no conversation left open
+MAX_SEGMENTS = 8      # more segments than this are merged into one
+EVENT_PREFIX = "event:"
+
+cached_stem = lru_cache(maxsize=1 << 16)(stem)
+
+
+# Varint codec (LEB128), vectorized
+
+def encode_varints(values):
+    values = np.asarray(values, dtype=np.uint64)
+    if not len(values):
+        return b""
+    lengths = np.ones(len(values), dtype=np.int64)
+    rest = values >> np.uint64(7)
+    while rest.any():
+        lengths += rest > 0
+        rest >>= np.uint64(7)
+    starts = np.cumsum(lengths) - lengths
+    out = np.empty(int(lengths.sum()), dtype=np.uint8)
+    for k in range(int(lengths.max())):
+        mask = lengths > k
+        low = (values[mask] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (lengths[mask] - 1 > k).astype(np.uint64) << np.uint64(7)
+        out[starts[mask] + k] = (low | more).astype(np.uint8)
+    return out.tobytes()
+
+
+def decode_varints(buffer):
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if not len(data):
+        return np.zeros(0, dtype=np.int64)
+    ends = np.flatnonzero(data < 0x80)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    shift = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    return np.add.reduceat((data & 0x7F).astype(np.int64) << (7 * shift), starts)
+
+
+def read_varint(buffer, position):
+    value = shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_postings(docs, counts, positions):
+    """Doc gaps, occurrence counts and per-document position gaps as three varint streams"""
+    docs = np.asarray(docs, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    positions = np.asarray(positions, dtype=np.int64)
+    gaps = np.diff(positions, prepend=0)
+    gaps[np.cumsum(counts) - counts] = positions[np.cumsum(counts) - counts]
+    doc_bytes = encode_varints(np.diff(docs, prepend=0))
+    count_bytes = encode_varints(counts)
+    header = encode_varints([len(docs), len(doc_bytes), len(count_bytes)])
+    return header + doc_bytes + count_bytes + encode_varints(gaps)
+
+
+def decode_postings(blob, positions=True):
+    """(docs, counts, positions) of one posting list; positions decoded only when asked"""
+    count, offset = read_varint(blob, 0)
+    doc_length, offset = read_varint(blob, offset)
+    count_length, offset = read_varint(blob, offset)
+    docs = np.cumsum(decode_varints(blob[offset:offset + doc_length]))
+    offset += doc_length
+    counts = decode_varints(blob[offset:offset + count_length])
+    if not positions:
+        return docs, counts, None
+    gaps = decode_varints(blob[offset + count_length:])
+    running = np.cumsum(gaps)
+    first = np.cumsum(counts) - counts
+    return docs, counts, running - np.repeat(running[first] - gaps[first], counts)
+
+
+# Documents: one conversation of a transcript, from checkpoint to checkpoint
+
+def document_terms(records):
+    """term -> positions for the messages and UI events of one conversation"""
+    terms = {}
+    position = 0
+    for record in records:
+        if record.kind == MESSAGE:
+            for token in TOKEN_PATTERN.findall(normalize_text(record.data[1])):
+                if token not in STOPWORDS:
+                    terms.setdefault(cached_stem(token), []).append(position)
+                position += 1
+            position += MESSAGE_GAP
+        elif record.kind == EVENT:
+            terms.setdefault(EVENT_PREFIX + record.data[0], []).append(position)
+            position += MESSAGE_GAP
+    return terms
+
+
+def read_conversations(path, offset, final):
+    """Complete conversations from offset on, and the offset to resume from next time"""
+    reader = TranscriptReader(path, use_index=False)
+    conversations, current, previous_kind, end = [], None, None, offset
+    try:
+        for record in reader.records(offset):
+            checkpoint = record.kind == SESSION or (record.kind == CLEAR and previous_kind != SESSION)
+            if checkpoint and current:
+                conversations.append(current)
+                current = None
+            if current is None:
+                current = (record.offset, [])
+            current[1].append(record)
+            previous_kind = record.kind
+            end = reader.file.tell()
+        if current:
+            if final:
+                conversations.append(current)
+            else:
+                end = current[0]  # Still open: indexed once the next conversation starts
+    finally:
+        wall_start = reader.wall_start_ms / 1000
+        reader.close()
+    return conversations, end, wall_start
+
+
+# Segments: immutable sorted lexicon plus postings
+
+class TermsView:
+    """Sorted terms of a segment as a sequence, for bisect over the mapped lexicon"""
+
+    def __init__(self, segment):
+        self.segment = segment
+
+    def __len__(self):
+        return self.segment.count
+
+    def __getitem__(self, position):
+        return self.segment.term(position)
+
+
+class Segment:
+    def __init__(self, directory):
+        self.directory = directory
+        self.maps = {}
+        for name in ("terms.bin", "lexicon.bin", "postings.bin"):
+            with open(os.path.join(directory, name), "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                self.maps[name] = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) if size else b""
+        self.count = len(self.maps["lexicon.bin"]) // LEXICON_ENTRY.size
+        self.terms = TermsView(self)
+
+    def entry(self, position):
+        return LEXICON_ENTRY.unpack_from(self.maps["lexicon.bin"], position * LEXICON_ENTRY.size)
+
+    def term(self, position):
+        term_offset, term_length, _offset, _length, _docs = self.entry(position)
+        return self.maps["terms.bin"][term_offset:term_offset + term_length].decode("utf-8")
+
+    def postings(self, position):
+        _term_offset, _term_length, offset, length, _docs = self.entry(position)
+        return memoryview(self.maps["postings.bin"])[offset:offset + length]
+
+    def find(self, term):
+        position = bisect.bisect_left(self.terms, term)
+        if position < self.count and self.term(position) == term:
+            return position
+        return None
+
+    def prefix(self, prefix):
+        start = bisect.bisect_left(self.terms, prefix)
+        end = start
+        while end < self.count and self.term(end).startswith(prefix):
+            end += 1
+        return range(start, end)
+
+    def close(self):
+        for buffer in self.maps.values():
+            if buffer:
+                buffer.close()
+
+
+def write_segment(directory, postings):
+    """postings: term -> (docs, counts, positions); written to a fresh segment directory"""
+    staging = directory + ".tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    terms_blob, lexicon, offset = bytearray(), bytearray(), 0
+    with open(os.path.join(staging, "postings.bin"), "wb") as f:
+        for term in sorted(postings):
+            docs, counts, positions = postings[term]
+            blob = encode_postings(docs, counts, positions)
+            encoded = term.encode("utf-8")
+            lexicon += LEXICON_ENTRY.pack(len(terms_blob), len(encoded), offset, len(blob), len(docs))
+            terms_blob += encoded
+            f.write(blob)
+            offset += len(blob)
+    with open(os.path.join(staging, "terms.bin"), "wb") as f:
+        f.write(terms_blob)
+    with open(os.path.join(staging, "lexicon.bin"), "wb") as f:
+        f.write(lexicon)
+    os.replace(staging, directory)
+
+
+# Queries
+
+QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+OPERATORS = {"AND", "OR", "NOT", "THEN"}
+
+
+def query_terms(text):
+    """(term, relative position) pairs of a query word or phrase, stopwords keeping their place"""
+    if text.lower().startswith(EVENT_PREFIX):
+        return [(text.lower(), 0)]
+    return [(cached_stem(token), position)
+            for position, token in enumerate(TOKEN_PATTERN.findall(normalize_text(text)))
+            if token not in STOPWORDS]
+
+
+def parse_query(text):
+    """AST of: OR binds loosest, then AND (implicit between words), then THEN, NOT, ( ) and "phrases\""""
+    tokens = QUERY_TOKEN.findall(text)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def take():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def join(kind, left, right):
+        # Stopword-only words parse to None and drop out of the expression
+        if left is None or right is None:
+            return right if left is None else left
+        return (kind, left, right)
+
+    def parse_or():
+        node = parse_and()
+        while peek() == "OR":
+            take()
+            node = join("or", node, parse_and())
+        return node
+
+    def parse_and():
+        node = parse_then()
+        while peek() not in (None, "OR", ")"):
+            if peek() == "AND":
+                take()
+            node = join("and", node, parse_then())
+        return node
+
+    def parse_then():
+        node = parse_primary()
+        while peek() == "THEN":
+            take()
+            node = join("then", node, parse_primary())
+        return node
+
+    def parse_primary():
+        token = take() if peek() is not None else None
+        if token is None or token == ")" or token in OPERATORS - {"NOT"}:
+            raise ValueError(f"Ofullständig fråga: {text}")
+        if token == "NOT":
+            node = parse_primary()
+            return None if node is None else ("not", node)
+        if token == "(":
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError(f"Saknar ')' i frågan: {text}")
+            take()
+            return node
+        if token.startswith('"'):
+            terms = query_terms(token.strip('"'))
+            return ("phrase", terms) if terms else None
+        if token.endswith("*") and len(token) > 1:
+            return ("prefix", normalize_text(token[:-1]))
+        terms = query_terms(token)
+        if not terms:
+            return None
+        return ("term", terms[0][0]) if len(terms) == 1 else ("phrase", terms)
+
+    node = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Oväntat '{peek()}' i frågan: {text}")
+    if node is None:
+        raise ValueError("Frågan innehåller bara stoppord")
+    return node
+
+
+def pairs_to_docs(pairs):
+    return np.unique(pairs >> 32)
+
+
+class TranscriptIndex:
+    """Segmented inverted index over the conversations of a transcript directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {"files": [], "offsets": {}, "segments": [], "documents": 0, "next_segment": 1}
+        # Documents written after the last saved manifest belong to an interrupted update
+        docs_path = os.path.join(directory, DOCS)
+        with open(docs_path, "ab") as f:
+            f.truncate(self.manifest["documents"] * DOC.size)
+        self.segments = [Segment(os.path.join(directory, name)) for name in self.manifest["segments"]]
+        self.docs = None
+
+    def save_manifest(self):
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(path + ".tmp", path)
+
+    def update(self, transcripts_dir, now=None):
+        """Index conversations appended since the last update; returns how many were added"""
+        now = now or time.time()
+        postings, doc_rows = {}, []
+        doc_id = self.manifest["documents"]
+        for path in sorted(glob.glob(os.path.join(transcripts_dir, TRANSCRIPT_PATTERN))):
+            name = os.path.basename(path)
+            offset = self.manifest["offsets"].get(name, HEADER.size)
+            if offset >= os.path.getsize(path):
+                continue
+            final = now - os.path.getmtime(path) >= IDLE_SECONDS
+            conversations, end, wall_start = read_conversations(path, offset, final)
+            if name not in self.manifest["offsets"]:
+                self.manifest["files"].append(name)
+            file_number = self.manifest["files"].index(name)
+            self.manifest["offsets"][name] = end
+
+            for checkpoint, records in conversations:
+                terms = document_terms(records)
+                if not terms:
+                    continue
+                session = next((r.data for r in records if r.kind == SESSION), {})
+                doc_rows.append(DOC.pack(file_number, checkpoint, int(session.get("session") or "0", 16),
+                                         wall_start + records[0].t, session.get("scenario", -1)))
+                for term, positions in terms.items():
+                    entry = postings.setdefault(term, ([], [], []))
+                    entry[0].append(doc_id)
+                    entry[1].append(len(positions))
+                    entry[2].extend(positions)
+                doc_id += 1
+
+        if doc_rows:
+            name = f"seg-{self.manifest['next_segment']:06d}"
+            write_segment(os.path.join(self.directory, name), postings)
+            with open(os.path.join(self.directory, DOCS), "ab") as f:
+                f.write(b"".join(doc_rows))
+            self.manifest["segments"].append(name)
+            self.manifest["next_segment"] += 1
+            self.manifest["documents"] = doc_id
+            self.segments.append(Segment(os.path.join(self.directory, name)))
+        self.save_manifest()
+        if len(self.segments) > MAX_SEGMENTS:
+            self.merge()
+        self.docs = None
+        return len(doc_rows)
+
+    def merge(self):
+        """Rewrite all segments as one (doc ids stay, so postings simply concatenate)"""
+        merged = {}
+        for segment in self.segments:
+            for position in range(segment.count):
+                docs, counts, positions = decode_postings(segment.postings(position))
+                entry = merged.setdefault(segment.term(position), ([], [], []))
+                entry[0].append(docs)
+                entry[1].append(counts)
+                entry[2].append(positions)
+        postings = {term: tuple(np.concatenate(parts) for parts in entry) for term, entry in merged.items()}
+        name = f"seg-{self.manifest['next_segment']:06d}"
+        write_segment(os.path.join(self.directory, name), postings)
+        old = self.manifest["segments"]
+        for segment in self.segments:
+            segment.close()
+        self.manifest["segments"] = [name]
+        self.manifest["next_segment"] += 1
+        self.save_manifest()
+        for old_name in old:
+            shutil.rmtree(os.path.join(self.directory, old_name), ignore_errors=True)
+        self.segments = [Segment(os.path.join(self.directory, name))]
+
+    def postings(self, terms, positions=True):
+        """Concatenated postings of the given terms in every segment, as (doc << 32 | position) pairs"""
+        parts = []
+        for segment in self.segments:
+            for term in terms:
+                index = segment.find(term)
+                if index is None:
+                    continue
+                docs, counts, offsets = decode_postings(segment.postings(index), positions)
+                if positions:
+                    parts.append((np.repeat(docs, counts) << 32) | offsets)
+                else:
+                    parts.append(docs << 32)
+        if not parts:
+            return np.zeros(0, dtype=np.int64)
+        pairs = np.concatenate(parts)
+        return np.unique(pairs) if len(terms) > 1 else pairs
+
+    def prefix_terms(self, prefix):
+        return sorted({segment.term(position) for segment in self.segments
+                       for position in segment.prefix(prefix)})
+
+    def evaluate(self, node):
+        """('pos', pairs) for words and phrases, ('docs', ids) after boolean operators"""
+        kind = node[0]
+        if kind == "term":
+            return "pos", self.postings([node[1]])
+        if kind == "prefix":
+            return "pos", self.postings(self.prefix_terms(node[1]))
+        if kind == "phrase":
+            if not node[1]:
+                raise ValueError("Frågan innehåller bara stoppord")
+            result = None
+            for term, offset in node[1]:
+                shifted = self.postings([term]) - offset
+                result = shifted if result is None else np.intersect1d(result, shifted, assume_unique=True)
+            return "pos", result
+        if kind == "then":
+            left, right = self.evaluate(node[1]), self.evaluate(node[2])
+            if left[0] != "pos" or right[0] != "pos":
+                raise ValueError("THEN kräver ord eller fraser på båda sidor")
+            # Keep occurrences of the right side after the first left occurrence in the same document
+            left_docs, first = np.unique(left[1] >> 32, return_index=True)
+            first_position = left[1][first] & 0xFFFFFFFF
+            right_docs = right[1] >> 32
+            slot = np.minimum(np.searchsorted(left_docs, right_docs), max(len(left_docs) - 1, 0))
+            if not len(left_docs):
+                return "pos", right[1][:0]
+            keep = (left_docs[slot] == right_docs) & ((right[1] & 0xFFFFFFFF) > first_position[slot])
+            return "pos", right[1][keep]
+        if kind == "not":
+            return "docs", np.setdiff1d(np.arange(self.manifest["documents"]), self.documents(node[1]),
+                                        assume_unique=True)
+        left, right = self.documents(node[1]), self.documents(node[2])
+        if kind == "and":
+            return "docs", np.intersect1d(left, right, assume_unique=True)
+        return "docs", np.union1d(left, right)
+
+    def documents(self, node):
+        if node[0] in ("term", "prefix"):
+            # Only which documents: the position stream is never decoded
+            terms = [node[1]] if node[0] == "term" else self.prefix_terms(node[1])
+            return pairs_to_docs(self.postings(terms, positions=False))
+        kind, values = self.evaluate(node)
+        return pairs_to_docs(values) if kind == "pos" else values
+
+    def search(self, query):
+        """Sorted ids of the conversations matching a query"""
+        return self.documents(parse_query(query))
+
+    def document(self, doc_id):
+        if self.docs is None:
+            with open(os.path.join(self.directory, DOCS), "rb") as f:
+                self.docs = f.read(self.manifest["documents"] * DOC.size)
+        file_number, checkpoint, session, start, scenario = DOC.unpack_from(self.docs, doc_id * DOC.size)
+        return {"id": int(doc_id), "transcript": self.manifest["files"][file_number], "offset": checkpoint,
+                "session": f"{session:012x}" if session else None, "start": start,
+                "scenario": scenario if scenario >= 0 else None}
+
+
+def snippet(path, offset, query, width=90):
+    """First message of a conversation that contains one of the query terms"""
+    wanted = {term for term, _position in query_terms(re.sub(r'\b(AND|OR|NOT|THEN)\b|[()"*]', " ", query))}
+    reader = TranscriptReader(path, use_index=False)
+    try:
+        first = None
+        for number, record in enumerate(reader.records(offset)):
+            if number and (record.kind == SESSION or (record.kind == CLEAR and previous_kind != SESSION)):
+                break
+            previous_kind = record.kind
+            if record.kind != MESSAGE:
+                continue
+            sender, text = record.data
+            first = first or text
+            if wanted & {term for term, _position in query_terms(text)}:
+                return f"{'🤖' if sender == 'bot' else '👤'} {text[:width]}"
+        return first[:width] if first else ""
+    finally:
+        reader.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fritextsökning i inspelade transkript")
+    parser.add_argument("command", choices=["index", "query"])
+    parser.add_argument("transcripts", help="katalog med transkript (run_demo.py --record)")
+    parser.add_argument("query", nargs="?",
+                        help='t.ex. \'kundservice THEN event:booking_abandoned\', "boka en demo", kund*')
+    parser.add_argument("--index", help="indexkatalog (standard: TRANSCRIPTS/search)")
+    parser.add_argument("--limit", type=int, default=20, help="högst så många träffar visas")
+    parser.add_argument("--json", action="store_true", help="skriv träffarna som JSON")
+    args = parser.parse_intermixed_args(argv)
+
+    index = TranscriptIndex(args.index or os.path.join(args.transcripts, "search"))
+    started = time.perf_counter()
+    added = index.update(args.transcripts)
+    if args.command == "index":
+        print(f"✅ {added} nya konversationer indexerade på {time.perf_counter() - started:.2f} s "
+              f"({index.manifest['documents']} totalt, {len(index.segments)} segment)")
+        return
+    if not args.query:
+        parser.error("frågan saknas")
+
+    started = time.perf_counter()
+    try:
+        matches = index.search(args.query)
+    except ValueError as e:
+        parser.exit(2, f"❌ {e}\n")
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    documents = [index.document(doc_id) for doc_id in matches[::-1][:args.limit]]  # Newest first
+    if args.json:
+        print(json.dumps({"matches": int(len(matches)), "ms": round(elapsed_ms, 2), "documents": documents},
+                         indent=2, ensure_ascii=False))
+        return
+    print(f"🔎 {len(matches)} konversationer på {elapsed_ms:.1f} ms")
+    for document in documents:
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(document["start"]))
+        scenario = document["scenario"] + 1 if document["scenario"] is not None else "-"
+        print(f"• {when}  scenario {scenario}  {document['transcript']} @{document['offset']}")
+        print(f"    {snippet(os.path.join(args.transcripts, document['transcript']), document['offset'], args.query)}")
+
+
+if __name__ == "__main__":
+    main()
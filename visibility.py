@@ -0,0 +1,125 @@
+"""
+Window visibility tracking for the low-power mode
+Follows <Map>, <Unmap> and <Visibility> of a toplevel and, where the desktop
+can tell, whether its screensaver is on, so animations and the demo script
+can be suspended while nobody can see the window
+"""
+
+import os
+import subprocess
+import threading
+import time
+
+IDLE_PROBE_SECONDS = 5.0  # Screensaver check interval while the user is inactive
+IDLE_PROBE_AFTER = 60.0  # Seconds without input (tk inactive) before the screensaver can be on
+
+# Tried in order; the first that runs answers for the rest of the process
+SCREENSAVER_COMMANDS = (
+    (["gdbus", "call", "--session", "--dest", "org.freedesktop.ScreenSaver",
+      "--object-path", "/org/freedesktop/ScreenSaver", "--method", "org.freedesktop.ScreenSaver.GetActive"],
+     lambda output: "true" in output),
+    (["xset", "q"], lambda output: "Monitor is Off" in output or "Monitor is in" in output),  # DPMS standby
+)
+
+
+def low_power_enabled():
+    """AXIE_LOW_POWER=0 keeps everything running when hidden (e.g. screen recording)"""
+    return os.environ.get("AXIE_LOW_POWER", "1") != "0"
+
+
+class ScreensaverProbe:
+    """Asks the desktop whether the screensaver is on, off the Tk thread; one per process"""
+
+    def __init__(self):
+        self.active = False
+        self.available = True
+        self.checked = 0.0
+        self.running = False
+        self.command = None
+
+    def poll(self):
+        """Last known state; starts a refresh in the background when it is stale"""
+        if self.available and not self.running and time.monotonic() - self.checked >= IDLE_PROBE_SECONDS:
+            self.running = True
+            threading.Thread(target=self.run, name="screensaver-probe", daemon=True).start()
+        return self.active
+
+    def run(self):
+        try:
+            for command, is_active in ([self.command] if self.command else SCREENSAVER_COMMANDS):
+                try:
+                    result = subprocess.run(command, capture_output=True, text=True, timeout=2)
+                except (OSError, subprocess.SubprocessError):
+                    continue
+                if result.returncode == 0:
+                    self.command = (command, is_active)
+                    self.active = is_active(result.stdout)
+                    return
+            self.available = False  # No session bus or X tools: rely on the window events alone
+            self.active = False
+        finally:
+            self.checked = time.monotonic()
+            self.running = False
+
+
+_probe = ScreensaverProbe()
+
+
+class VisibilityTracker:
+    """Calls on_change(visible) when a toplevel becomes hidden (unmapped, covered, screensaver) or visible again"""
+
+    def __init__(self, window, on_change):
+        self.window = window
+        self.on_change = on_change
+        # Assumed visible until an event says otherwise, so nothing waits for a Map that already happened
+        self.mapped = True
+        self.obscured = False
+        self.screensaver = False
+        self.visible = True
+
+        window.bind('<Map>', self.on_map, add='+')
+        window.bind('<Unmap>', self.on_unmap, add='+')
+        window.bind('<Visibility>', self.on_visibility, add='+')
+        self.window.after(int(IDLE_PROBE_SECONDS * 1000), self.probe_idle)
+
+    def on_map(self, event):
+        if event.widget is self.window:
+            self.mapped = True
+            self.update()
+
+    def on_unmap(self, event):
+        if event.widget is self.window:
+            self.mapped = False
+            self.update()
+
+    def on_visibility(self, event):
+        # Compositing window managers never report FullyObscured; then only Map/Unmap count
+        if event.widget is self.window:
+            self.obscured = event.state == 'VisibilityFullyObscured'
+            self.update()
+
+    def probe_idle(self):
+        """Check the screensaver every few seconds, but only once the user has gone idle"""
+        if not self.window.winfo_exists():
+            return
+        inactive_ms = int(self.window.tk.call('tk', 'inactive'))  # -1 where Tk cannot tell
+        if 0 <= inactive_ms < IDLE_PROBE_AFTER * 1000:
+            self.screensaver = False  # Someone is using the machine
+        elif self.mapped:
+            self.screensaver = _probe.poll()
+        self.update()
+        if _probe.available or self.screensaver:
+            self.window.after(int(IDLE_PROBE_SECONDS * 1000), self.probe_idle)
+
+    def update(self):
+        visible = self.mapped and not self.obscured and not self.screensaver
+        if visible != self.visible:
+            self.visible = visible
+            self.on_change(visible)
+
+
+def track_visibility(window, on_change):
+    """Start tracking a toplevel, or None when the low-power mode is turned off"""
+    if not low_power_enabled():
+        return None
+    return VisibilityTracker(window, on_change)
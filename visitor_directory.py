@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Returning-visitor directory for booking-form autofill
+Confirmed bookings are appended to a log; a sorted prefix index over names,
+e-mail addresses, phone numbers and companies is built from it into a file
+that is memory-mapped at startup, so the form can suggest and fill in a
+whole record after a few keystrokes
+"""
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import unicodedata
+
+from form_validation import ascii_domain, normalize_phone, PHONE_SEPARATORS
+from reminders import append_records
+
+LOG = "visitors.jsonl"
+INDEX = "visitors.idx"
+MAGIC = b"AXVI"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIQ")  # magic, version, records, keys, log bytes covered
+KEY = struct.Struct("<III")        # key offset, key length, record number (sorted by key bytes)
+RECORD = struct.Struct("<II")      # record offset, record length (UTF-8 JSON)
+
+FIELDS = ("Namn", "E-post", "Telefon", "Företag", "Befattning")
+# Form field -> key prefix in the index; Befattning is filled in but not searched
+SEARCHABLE = {"Namn": "n", "E-post": "e", "Telefon": "p", "Företag": "c"}
+IDENTITY_FIELDS = {"e": "E-post", "p": "Telefon", "n": "Namn"}  # visitor_identity tag -> field
+MIN_PREFIX = {"Namn": 2, "E-post": 2, "Telefon": 3, "Företag": 2}
+REBUILD_AFTER = 500  # Records only in the log before the index file is rebuilt
+
+
+def fold(text):
+    """Case- and space-insensitive form of a name or company"""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def normalize_email(value):
+    """Identity form of an address: lower-case local part, IDNA domain"""
+    local, _at, domain = value.strip().rpartition("@")
+    if not local:
+        return None
+    domain = ascii_domain(domain)
+    return f"{local.casefold()}@{domain}" if domain else None
+
+
+def phone_digits(value):
+    """National digits of a (partly typed) Swedish number: '+46 70-12' -> '07012'"""
+    digits = PHONE_SEPARATORS.sub("", value)
+    for country in ("+46", "0046"):
+        if digits.startswith(country):
+            return "0" + digits[len(country):]
+    return digits
+
+
+def search_text(field_name, value):
+    """What a typed value is matched against: the start of one of the record's keys"""
+    if field_name == "Telefon":
+        return phone_digits(value)
+    if field_name == "E-post":
+        # Unicode, not IDNA: a half-typed 'för' must be a prefix of 'företag.se'
+        return value.strip().casefold()
+    return fold(value)
+
+
+def visitor_identity(record):
+    """One entry per person: normalised e-mail, else phone, else name"""
+    email = normalize_email(record.get("E-post", ""))
+    if email:
+        return "e:" + email
+    phone = normalize_phone(record.get("Telefon", ""))
+    if phone:
+        return "p:" + phone
+    return "n:" + fold(record.get("Namn", ""))
+
+
+def record_keys(record):
+    """Index keys of a record; names and companies also from each later word"""
+    keys = []
+    for field_name, tag in SEARCHABLE.items():
+        text = search_text(field_name, record.get(field_name, ""))
+        if not text:
+            continue
+        keys.append(f"{tag}\0{text}")
+        if field_name in ("Namn", "Företag"):
+            words = text.split(" ")
+            keys.extend(f"{tag}\0{' '.join(words[i:])}" for i in range(1, len(words)))
+    return keys
+
+
+def merge(old, new):
+    """Later bookings win, but an empty field does not erase an earlier value"""
+    merged = dict(old)
+    merged.update({name: value for name, value in new.items() if value})
+    return merged
+
+
+def read_log(path, offset=0):
+    """Records from byte offset on, and the offset after the last complete line"""
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return [], offset
+    end = data.rfind(b"\n") + 1  # A line still being written is read next time
+    records = []
+    for line in data[:end].splitlines():
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue  # Torn line of a crashed writer
+    return records, offset + end
+
+
+def build_index(directory):
+    """Merge the log into one record per visitor and write the prefix index file; returns its size"""
+    records, covered = read_log(os.path.join(directory, LOG))
+    visitors = {}
+    for record in records:
+        identity = visitor_identity(record)
+        visitors[identity] = merge(visitors.get(identity, {}), record)
+
+    blobs = [json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+             for record in visitors.values()]
+    keys = sorted((key.encode("utf-8"), number) for number, record in enumerate(visitors.values())
+                  for key in record_keys(record))
+
+    key_table = HEADER.size
+    record_table = key_table + len(keys) * KEY.size
+    offset = record_table + len(blobs) * RECORD.size
+    parts = [HEADER.pack(MAGIC, VERSION, len(blobs), len(keys), covered)]
+    for key, number in keys:
+        parts.append(KEY.pack(offset, len(key), number))
+        offset += len(key)
+    for blob in blobs:
+        parts.append(RECORD.pack(offset, len(blob)))
+        offset += len(blob)
+    parts.extend(key for key, _number in keys)
+    parts.extend(blobs)
+
+    path = os.path.join(directory, INDEX)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp, path)
+    return offset
+
+
+class PrefixIndex:
+    """Read-only view of an index file: binary search over its sorted keys, straight from the mapping"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.records, self.keys, self.covered = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError(f"{path}: okänt indexformat")
+        self.key_table = HEADER.size
+        self.record_table = self.key_table + self.keys * KEY.size
+
+    def key(self, position):
+        offset, length, number = KEY.unpack_from(self.map, self.key_table + position * KEY.size)
+        return self.map[offset:offset + length], number
+
+    def search(self, prefix):
+        """Record numbers whose keys start with prefix (bytes), in key order"""
+        low, high = 0, self.keys
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(middle)[0] < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        for position in range(low, self.keys):
+            key, number = self.key(position)
+            if not key.startswith(prefix):
+                return
+            yield number
+
+    def record(self, number):
+        offset, length = RECORD.unpack_from(self.map, self.record_table + number * RECORD.size)
+        return json.loads(self.map[offset:offset + length])
+
+    def close(self):
+        self.map.close()
+
+
+class VisitorDirectory:
+    """Visitors of earlier bookings in a directory: memory-mapped index plus the newest log lines"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.log_path = os.path.join(directory, LOG)
+        self.index_path = os.path.join(directory, INDEX)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        self.index = None
+        self.offset = 0
+        self.overlay = {}  # identity -> record, for log lines the index does not cover yet
+        self.overlay_keys = []  # Sorted (key, identity)
+        self.building = False
+        self.built = False
+        self.stats = {"load_ms": 0.0, "lookups": 0}
+
+        started = time.perf_counter()
+        self.open_index()
+        self.refresh()
+        self.stats["load_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    def open_index(self):
+        if self.index:
+            self.index.close()
+            self.index = None
+        try:
+            self.index = PrefixIndex(self.index_path)
+        except (OSError, ValueError):
+            pass  # Not built yet (or from another version): the log alone answers until it is
+        self.offset = self.index.covered if self.index else 0
+        self.overlay = {}
+        self.overlay_keys = []
+
+    def refresh(self):
+        """Pick up bookings made since (by any process), and swap in a freshly built index"""
+        if self.built:
+            self.built = False
+            self.open_index()
+        records, self.offset = read_log(self.log_path, self.offset)
+        for record in records:
+            self.remember(record)
+        stale = len(self.overlay) >= (REBUILD_AFTER if self.index else 1)
+        if stale and not self.building:
+            self.building = True
+            threading.Thread(target=self.rebuild, name="visitor-index", daemon=True).start()
+
+    def rebuild(self):
+        try:
+            build_index(self.directory)
+            self.built = True  # Opened by the next refresh, on the caller's thread
+        except OSError as e:
+            print(f"⚠️ Besöksregistret kunde inte indexeras: {e}")
+        finally:
+            self.building = False
+
+    def indexed(self, identity, record):
+        """The index file's record for this visitor, found through record's identifying field"""
+        if not self.index:
+            return None
+        field_name = IDENTITY_FIELDS[identity[0]]
+        text = search_text(field_name, record.get(field_name, ""))
+        if not text:
+            return None
+        for number in self.index.search(f"{SEARCHABLE[field_name]}\0{text}".encode("utf-8")):
+            candidate = self.index.record(number)
+            if visitor_identity(candidate) == identity:
+                return candidate
+        return None
+
+    def remember(self, record):
+        identity = visitor_identity(record)
+        old = self.overlay.get(identity)
+        if old:
+            for key in record_keys(old):
+                index = bisect.bisect_left(self.overlay_keys, (key, identity))
+                if index < len(self.overlay_keys) and self.overlay_keys[index] == (key, identity):
+                    del self.overlay_keys[index]
+        else:
+            old = self.indexed(identity, record)  # Fields left empty now keep their indexed value
+        record = merge(old or {}, record)
+        self.overlay[identity] = record
+        for key in record_keys(record):
+            bisect.insort(self.overlay_keys, (key, identity))
+
+    def add(self, record):
+        """Store a confirmed booking's contact details (form field name -> value)"""
+        record = {name: record[name].strip() for name in FIELDS if record.get(name, "").strip()}
+        if not record:
+            return
+        record["t"] = int(time.time())
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+        if not os.path.exists(self.log_path):
+            os.close(os.open(self.log_path, os.O_WRONLY | os.O_CREAT, 0o600))
+        append_records(self.log_path, line)
+        self.refresh()
+
+    def lookup(self, field_name, value, limit=5):
+        """Visitors whose name, e-mail, phone or company (field_name) starts with value"""
+        if field_name not in SEARCHABLE:
+            return []
+        text = search_text(field_name, value)
+        if len(text) < MIN_PREFIX[field_name]:
+            return []
+        self.stats["lookups"] += 1
+        prefix = f"{SEARCHABLE[field_name]}\0{text}"
+        results, seen = [], set()
+
+        # Newest first: bookings the index does not cover yet
+        position = bisect.bisect_left(self.overlay_keys, (prefix,))
+        while position < len(self.overlay_keys) and len(results) < limit:
+            key, identity = self.overlay_keys[position]
+            if not key.startswith(prefix):
+                break
+            if identity not in seen:
+                seen.add(identity)
+                results.append(self.overlay[identity])
+            position += 1
+
+        if self.index and len(results) < limit:
+            numbers = set()
+            for number in self.index.search(prefix.encode("utf-8")):
+                if number in numbers:
+                    continue
+                numbers.add(number)
+                record = self.index.record(number)
+                identity = visitor_identity(record)
+                if identity in self.overlay:
+                    continue  # Superseded by a newer booking, which matched above or no longer matches
+                if identity not in seen:
+                    seen.add(identity)
+                    results.append(record)
+                    if len(results) >= limit:
+                        break
+        return results
+
+    def __len__(self):
+        indexed = self.index.records if self.index else 0
+        return indexed + len(self.overlay)
+
+    def close(self):
+        if self.index:
+            self.index.close()
+            self.index = None
+
+
+VISITOR_DIR = os.path.join(os.path.expanduser("~"), ".local", "share", "axie-studio", "visitors")
+
+_directory = None
+_configured = False
+
+
+def configure_visitors(directory):
+    """Keep the visitor directory of this process in directory (None or "" turns it off)"""
+    global _directory, _configured
+    if _directory:
+        _directory.close()
+    _directory = VisitorDirectory(directory) if directory else None
+    _configured = True
+    return _directory
+
+
+def get_visitors():
+    """The process visitor directory; AXIE_VISITOR_DIR moves it, empty turns autofill off"""
+    if not _configured:
+        configure_visitors(os.environ.get("AXIE_VISITOR_DIR", VISITOR_DIR))
+    return _directory
+
+
+def describe(record):
+    return " · ".join(record[name] for name in ("Namn", "E-post", "Företag") if record.get(name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Besöksregistret för autoifyllning av bokningsformuläret")
+    parser.add_argument("command", choices=["build", "lookup", "stats"])
+    parser.add_argument("field", nargs="?", choices=sorted(SEARCHABLE), help="fält att söka i (för lookup)")
+    parser.add_argument("prefix", nargs="?", help="början av värdet (för lookup)")
+    parser.add_argument("--limit", type=int, default=10, help="max antal träffar")
+    parser.add_argument("--dir", default=os.environ.get("AXIE_VISITOR_DIR") or VISITOR_DIR,
+                        help="katalog för besöksregistret")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        started = time.perf_counter()
+        size = build_index(args.dir)
+        print(f"✅ Index byggt: {size / 1024:.0f} kB på {(time.perf_counter() - started) * 1000:.0f} ms")
+        return
+
+    directory = VisitorDirectory(args.dir)
+    if args.command == "stats":
+        print(f"👥 {len(directory)} besökare, index laddat på {directory.stats['load_ms']} ms")
+        return
+    if not args.field or args.prefix is None:
+        parser.error("lookup kräver fält och prefix")
+    started = time.perf_counter()
+    results = directory.lookup(args.field, args.prefix, args.limit)
+    elapsed_us = (time.perf_counter() - started) * 1e6
+    print(f"🔎 {len(results)} träffar på {elapsed_us:.0f} µs")
+    for record in results:
+        print(f"  {describe(record)}")
+
+
+if __name__ == "__main__":
+    main()